@@ -0,0 +1,83 @@
+"""
+Throughput of the deriver operators on inputs sampled at different rates.
+
+Runs `ffill`, `filter_none`, `ffill` followed by `filter_none`, and `align` over a stream where the first input is set
+on every item, the second on one item in 10 and the third on one item in 100, and prints items/sec for each.
+
+Usage: python benchmarks/bench_deriver_operators.py [--items 200000] [--batch-size 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List
+
+import bytewax.operators as op
+from bytewax.dataflow import Dataflow, Stream
+from bytewax.testing import TestingSink, TestingSource, run_main
+
+from nortech.derivers import operators
+from nortech.derivers.values.deriver import DeriverInputs
+
+
+class Inputs(DeriverInputs):
+    fast: float | None
+    medium: float | None
+    slow: float | None
+
+
+class AlignedInputs(DeriverInputs):
+    fast: float
+    medium: float
+    slow: float
+
+
+def make_inputs(items: int) -> List[Inputs]:
+    start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    return [
+        Inputs(
+            timestamp=start + timedelta(milliseconds=100 * index),
+            fast=float(index),
+            medium=float(index) if index % 10 == 0 else None,
+            slow=float(index) if index % 100 == 0 else None,
+        )
+        for index in range(items)
+    ]
+
+
+PIPELINES: dict[str, Callable[[Stream[Inputs]], Stream]] = {
+    "ffill": lambda stream: operators.ffill("ffill", stream),
+    "filter_none": lambda stream: operators.filter_none("filter_none", stream, AlignedInputs),
+    "ffill + filter_none": lambda stream: operators.filter_none(
+        "filter_none", operators.ffill("ffill", stream), AlignedInputs
+    ),
+    "align": lambda stream: operators.align("align", stream, AlignedInputs),
+}
+
+
+def measure(pipeline: Callable[[Stream[Inputs]], Stream], inputs: List[Inputs], batch_size: int) -> float:
+    flow = Dataflow("bench")
+    stream = op.input("input", flow, TestingSource([item.model_copy() for item in inputs], batch_size=batch_size))
+    op.output("output", pipeline(stream), TestingSink([]))
+
+    start = time.perf_counter()
+    run_main(flow)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=200000, help="Number of input items.")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Number of items per source batch.")
+    args = parser.parse_args()
+
+    inputs = make_inputs(args.items)
+    print(f"{'passthrough':<20} {args.items / measure(lambda stream: stream, inputs, args.batch_size):12,.0f} items/s")
+    for name, pipeline in PIPELINES.items():
+        print(f"{name:<20} {args.items / measure(pipeline, inputs, args.batch_size):12,.0f} items/s")
+
+
+if __name__ == "__main__":
+    main()
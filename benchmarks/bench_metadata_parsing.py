@@ -0,0 +1,76 @@
+"""
+Per-item cost of parsing metadata list pages.
+
+Compares the inline parametrized validation that list endpoints used to do with the cached response models validated
+straight from JSON, and with building the items without validation through `model_construct`.
+
+Usage: python benchmarks/bench_metadata_parsing.py [--items 100] [--repeat 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from typing import Literal
+
+from nortech.metadata.services.signal import SignalListResponse
+from nortech.metadata.values.pagination import NextRef, PaginatedResponse
+from nortech.metadata.values.signal import SignalListOutput
+
+
+def signal_list_page(items: int) -> bytes:
+    return json.dumps(
+        {
+            "size": items,
+            "data": [
+                {
+                    "id": signal_id,
+                    "name": f"signal_{signal_id}",
+                    "physicalUnit": "bar",
+                    "dataType": "float",
+                    "description": "Pressure sensor",
+                    "longDescription": "Main pressure sensor for the unit",
+                }
+                for signal_id in range(items)
+            ],
+            "next": {"token": "next_token"},
+        }
+    ).encode()
+
+
+def inline_validation(content: bytes):
+    return PaginatedResponse[
+        SignalListOutput, Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
+    ].model_validate({**json.loads(content), "pagination_options": None})
+
+
+def cached_validation(content: bytes):
+    return SignalListResponse.model_validate_page(content)
+
+
+def unvalidated_construction(content: bytes):
+    page = json.loads(content)
+    return SignalListResponse.model_construct(
+        size=page["size"],
+        data=[SignalListOutput.model_construct(**item) for item in page["data"]],
+        next=NextRef.model_construct(**page["next"]),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=100, help="Number of items per page.")
+    parser.add_argument("--repeat", type=int, default=200, help="Number of pages parsed per measurement.")
+    args = parser.parse_args()
+
+    content = signal_list_page(args.items)
+    assert inline_validation(content).data == cached_validation(content).data == unvalidated_construction(content).data
+
+    for parse in (inline_validation, cached_validation, unvalidated_construction):
+        seconds = min(timeit.repeat(lambda parse=parse: parse(content), number=args.repeat, repeat=5))
+        print(f"{parse.__name__:<24} {seconds / args.repeat / args.items * 1e6:8.3f} us/item")
+
+
+if __name__ == "__main__":
+    main()
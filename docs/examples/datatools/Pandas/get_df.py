@@ -40,3 +40,10 @@ print(df.columns)
 #     "workspace_3/asset_3/division_3/unit_3/signal_4",
 #     "workspace_3/asset_3/division_3/unit_3/signal_5",
 # ]
+
+# Convert signals from their physical unit to other units, e.g. from degC to degF
+df = nortech.datatools.pandas.get_df(
+    signals=[signal1, signal3],
+    time_window=my_time_window,
+    units={"workspace1/asset1/division1/unit1/signal1": "degF", signal3.path: "kW"},
+)
@@ -0,0 +1,30 @@
+from datetime import datetime, timedelta, timezone
+
+from nortech import Nortech
+from nortech.derivers import Deriver, TimeWindow
+
+
+class MyDeriver(Deriver): ...
+
+
+nortech = Nortech()
+
+# Backfill a year of data in daily chunks, checkpointing progress to a local directory.
+# If the process crashes, running the same call again resumes from the last checkpoint.
+result_df = nortech.derivers.backfill_locally(
+    MyDeriver,
+    time_window=TimeWindow(start=datetime(2023, 1, 1, tzinfo=timezone.utc), end=datetime(2024, 1, 1, tzinfo=timezone.utc)),
+    chunk=timedelta(days=1),
+    checkpoint_dir="my_deriver_backfill",
+)
+
+print(result_df)
+#                            output_signal
+# timestamp
+# 2023-01-01 00:00:00+00:00            0.0
+# 2023-01-01 00:00:01+00:00            2.0
+# 2023-01-01 00:00:02+00:00            4.0
+# ...                                  ...
+# 2023-12-31 23:59:58+00:00       63071996.0
+# 2023-12-31 23:59:59+00:00       63071998.0
+# 2024-01-01 00:00:00+00:00       63072000.0
@@ -13,7 +13,7 @@ nortech = Nortech()
 derivers = nortech.derivers.create(MyDeriver, start_at=datetime.now(timezone.utc), description="my-description")
 print(derivers)
 # DeployedDeriver(
-#     deriver=MyDeriver,
+#     definition="class MyDeriver(Deriver): ...",
 #     description="my-description",
 #     start_at=None,
 #     inputs=[
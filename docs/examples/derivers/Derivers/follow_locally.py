@@ -0,0 +1,31 @@
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+
+from nortech import Nortech
+from nortech.derivers import Deriver
+
+
+class MyDeriver(Deriver): ...
+
+
+nortech = Nortech()
+
+
+def print_outputs(df: pd.DataFrame):
+    print(df)
+
+
+# Feed the last hour of data and then new data as it arrives, polling every 10 seconds, until interrupted
+nortech.derivers.follow_locally(
+    MyDeriver,
+    print_outputs,
+    start=datetime.now(timezone.utc) - timedelta(hours=1),
+    poll_interval=timedelta(seconds=10),
+    lag=timedelta(seconds=5),
+)
+#                            output_signal
+# timestamp
+# 2025-01-01 11:00:00+00:00            0.0
+# 2025-01-01 11:00:01+00:00            2.0
+# ...                                  ...
@@ -14,7 +14,7 @@ derivers = nortech.derivers.get("MyDeriver")
 
 print(derivers)
 # DeployedDeriver(
-#     deriver=MyDeriver,
+#     definition="class MyDeriver(Deriver): ...",
 #     description="my-description",
 #     start_at="2025-01-01T12:00:00Z",
 #     inputs=[
@@ -15,9 +15,13 @@ print(derivers)
 #     next=None,
 #     data=[
 #         DeployedDeriverList(
-#             deriver=MyDeriver,
+#             definition="class MyDeriver(Deriver): ...",
 #             description="my-description",
 #             start_at=None,
 #         )
 #     ],
 # )
+
+# The deriver class is compiled from its definition on first access
+print(derivers.data[0].deriver)
+# <class 'MyDeriver'>
@@ -0,0 +1,30 @@
+from datetime import timedelta
+
+from nortech import Nortech
+from nortech.derivers import Deriver
+
+
+class MyDeriver(Deriver): ...
+
+
+nortech = Nortech()
+
+# Run the deriver on a day of random inputs at 100 items/sec, with 10% of missing values
+report = nortech.derivers.load_test_locally(MyDeriver, duration=timedelta(days=1), rate=100, null_ratio=0.1)
+
+print(report)
+# LoadTestReport(
+#     items=8640000,
+#     outputs=8640000,
+#     seconds=61.2,
+#     latency_percentiles={50: 0.031, 90: 0.044, 99: 0.093},
+#     peak_memory=157286400,
+# )
+print(report.items_per_second)
+# 141176.47
+
+
+# In a performance regression test, with `pytest_plugins = ["nortech.derivers.pytest_plugin"]` in conftest.py
+def test_my_deriver_throughput(deriver_load_test):
+    report = deriver_load_test(MyDeriver, duration=timedelta(hours=1), rate=100)
+    assert report.items_per_second > 50000
@@ -0,0 +1,44 @@
+from datetime import timedelta, timezone
+
+import pandas as pd
+
+from nortech import Nortech
+from nortech.derivers import Deriver
+
+
+class MyDeriver(Deriver): ...
+
+
+nortech = Nortech()
+
+# Create input DataFrame with the inputs of two assets
+timestamps = pd.date_range(start="2023-01-01", periods=100_000, freq="s", tz=timezone.utc)
+df = pd.DataFrame(
+    {
+        "timestamp": list(timestamps) * 2,
+        "input_signal": [float(i) for i in range(200_000)],
+        "asset": ["asset1"] * 100_000 + ["asset2"] * 100_000,
+    }
+).set_index("timestamp")
+
+# Run each asset in its own process
+result_df = nortech.derivers.run_locally_in_parallel_with_df(MyDeriver, df, workers=2, partition_by="asset")
+
+# Run each asset in hourly chunks, replaying 5 minutes of inputs before each chunk to warm up the deriver state
+result_df = nortech.derivers.run_locally_in_parallel_with_df(
+    MyDeriver,
+    df,
+    workers=8,
+    partition_by="asset",
+    time_chunk=timedelta(hours=1),
+    warm_up=timedelta(minutes=5),
+)
+
+print(result_df)
+#                            output_signal   asset
+# timestamp
+# 2023-01-01 00:00:00+00:00            0.0  asset1
+# 2023-01-01 00:00:00+00:00       200000.0  asset2
+# 2023-01-01 00:00:01+00:00            2.0  asset1
+# 2023-01-01 00:00:01+00:00       200002.0  asset2
+# ...                                  ...     ...
@@ -36,3 +36,22 @@ print(result_df)
 # 2023-01-01 00:01:37+00:00          194.0
 # 2023-01-01 00:01:38+00:00          196.0
 # 2023-01-01 00:01:39+00:00          198.0
+
+
+# Derivers that implement a vectorized `run_batch` can run on chunks of rows instead of one row at a time
+class MyBatchDeriver(MyDeriver):
+    def run_batch(self, df: pd.DataFrame) -> pd.DataFrame:
+        return (df[["input_signal"]] * 2).rename(columns={"input_signal": "output_signal"})
+
+
+result_df = nortech.derivers.run_locally_with_df(MyBatchDeriver, df, batch_size=5000, batch_mode=True)
+
+# Profile the run to find which steps of the deriver take the most time
+result_df, profile = nortech.derivers.run_locally_with_df(MyDeriver, df, profile=True)
+
+print(profile.to_df())
+#             items_in  items_out   seconds  items_per_second
+# step_id
+# map_output       100        100  0.000151      6.622517e+05
+print(profile.input_conversion_seconds, profile.output_conversion_seconds, profile.total_seconds)
+# 0.000412 0.000263 0.004127
@@ -0,0 +1,38 @@
+from datetime import datetime, timezone
+
+import polars as pl
+
+from nortech import Nortech
+from nortech.derivers import Deriver
+
+
+class MyDeriver(Deriver): ...
+
+
+nortech = Nortech()
+
+# Create input DataFrame or use nortech.datatools.polars to get data
+df = pl.DataFrame(
+    {
+        "timestamp": pl.datetime_range(
+            datetime(2023, 1, 1, tzinfo=timezone.utc), datetime(2023, 1, 1, 0, 1, 39, tzinfo=timezone.utc), "1s", eager=True
+        ),
+        "input_signal": [float(i) for i in range(100)],
+    }
+)
+
+# Run the deriver locally, on a DataFrame or a LazyFrame
+result_df = nortech.derivers.run_locally_with_polars_df(MyDeriver, df.lazy(), batch_size=5000)
+
+print(result_df)
+# shape: (100, 2)
+# ┌─────────────────────────┬───────────────┐
+# │ timestamp               ┆ output_signal │
+# │ ---                     ┆ ---           │
+# │ datetime[μs, UTC]       ┆ f64           │
+# ╞═════════════════════════╪═══════════════╡
+# │ 2023-01-01 00:00:00 UTC ┆ 0.0           │
+# │ 2023-01-01 00:00:01 UTC ┆ 2.0           │
+# │ …                       ┆ …             │
+# │ 2023-01-01 00:01:39 UTC ┆ 198.0         │
+# └─────────────────────────┴───────────────┘
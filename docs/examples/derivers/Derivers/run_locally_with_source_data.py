@@ -1,4 +1,4 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pandas as pd
 
@@ -38,3 +38,22 @@ print(result_df)
 # 2023-01-01 00:01:37+00:00          194.0
 # 2023-01-01 00:01:38+00:00          196.0
 # 2023-01-01 00:01:39+00:00          198.0
+
+# Stream a year of data in daily chunks, fetching the next day while the current one is processed,
+# and write the outputs to a parquet file as they are produced
+nortech.derivers.run_locally_with_source_data(
+    MyDeriver,
+    time_window=TimeWindow(start=datetime(2023, 1, 1, tzinfo=timezone.utc), end=datetime(2024, 1, 1, tzinfo=timezone.utc)),
+    chunk=timedelta(days=1),
+    prefetch=2,
+    output_path="my_deriver.parquet",
+)
+
+# Cache the outputs on disk, so that running again over the same or a shorter window reads them back,
+# and extending the window only computes the new tail, replaying one hour of inputs before it
+nortech.derivers.run_locally_with_source_data(
+    MyDeriver,
+    time_window=TimeWindow(start=datetime(2023, 1, 1, tzinfo=timezone.utc), end=datetime(2023, 2, 1, tzinfo=timezone.utc)),
+    cache_dir=".deriver_cache",
+    warm_up=timedelta(hours=1),
+)
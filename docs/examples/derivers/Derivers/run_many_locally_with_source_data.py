@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+
+from nortech import Nortech
+from nortech.derivers import Deriver, TimeWindow
+
+
+# MySecondDeriver reads the output signal of MyFirstDeriver
+class MyFirstDeriver(Deriver): ...
+
+
+class MySecondDeriver(Deriver): ...
+
+
+nortech = Nortech()
+
+# Fetch the input signals of both derivers once and run them in a single dataflow
+result_dfs = nortech.derivers.run_many_locally_with_source_data(
+    [MyFirstDeriver, MySecondDeriver],
+    time_window=TimeWindow(start=datetime(2023, 1, 1, tzinfo=timezone.utc), end=datetime(2023, 1, 2, tzinfo=timezone.utc)),
+)
+
+print(result_dfs["MySecondDeriver"])
+#                            output_signal
+# timestamp
+# 2023-01-01 00:00:00+00:00            0.0
+# 2023-01-01 00:00:01+00:00            4.0
+# 2023-01-01 00:00:02+00:00            8.0
+# ...                                  ...
@@ -0,0 +1,23 @@
+from datetime import datetime, timezone
+
+from nortech import Nortech
+from nortech.derivers import Deriver
+
+
+# Define Derivers
+class MyDeriver(Deriver): ...
+
+
+class MyOtherDeriver(Deriver): ...
+
+
+nortech = Nortech()
+
+summary = nortech.derivers.sync([MyDeriver, MyOtherDeriver], start_at=datetime.now(timezone.utc))
+print(summary)
+# DeriverSyncSummary(
+#     created=["MyOtherDeriver"],
+#     updated=[],
+#     unchanged=["MyDeriver"],
+#     failed={},
+# )
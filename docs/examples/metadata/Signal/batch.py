@@ -0,0 +1,37 @@
+from nortech import Nortech
+
+nortech = Nortech()
+
+# Fetch many signals by ID with bulk requests of at most 100 signals
+with nortech.metadata.signal.batch(max_batch_size=100) as batch:
+    futures = [batch.load(signal_id) for signal_id in range(1, 1001)]
+
+signals = [future.result() for future in futures]
+
+print(signals[0])
+# SignalOutput(
+#     id=1,
+#     name="my-signal",
+#     physical_unit="°C",
+#     data_type="float64",
+#     description="Temperature sensor",
+#     long_description="Main temperature sensor for the unit",
+#     created_at=datetime.datetime(2024, 1, 1, 0, 0, 0, 0),
+#     updated_at=datetime.datetime(2024, 1, 1, 0, 0, 0, 0),
+#     workspace=MetadataOutput(
+#         id=123,
+#         name="my-workspace"
+#     ),
+#     asset=MetadataOutput(
+#         id=456,
+#         name="my-asset"
+#     ),
+#     division=MetadataOutput(
+#         id=789,
+#         name="my-division"
+#     ),
+#     unit=MetadataOutput(
+#         id=101,
+#         name="my-unit"
+#     )
+# )
@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from nortech import Nortech
+from nortech.datatools.values.windowing import TimeWindow
+from nortech.metadata import SignalCatalog
+
+nortech = Nortech()
+
+# Fetch a searchable snapshot of the signals of a workspace, cached by the client
+catalog = nortech.metadata.signal.catalog("my-workspace")
+
+# Search by path prefix, substring or regular expression, and filter by data type, physical unit or description
+signals = catalog.search(prefix="my-workspace/my-asset/", contains="temperature", physical_unit="°C")
+
+print(signals)
+# [
+#     SignalInput(
+#         workspace="my-workspace",
+#         asset="my-asset",
+#         division="my-division",
+#         unit="my-unit",
+#         signal="temperature"
+#     )
+# ]
+
+# Found signals can be used directly to fetch data
+df = nortech.datatools.polars.get_df(
+    signals=signals,
+    time_window=TimeWindow(start=datetime(2023, 1, 1), end=datetime(2023, 1, 31)),
+)
+
+# Keep the snapshot across sessions
+catalog.save("catalog.parquet")
+catalog = SignalCatalog.load("catalog.parquet")
@@ -0,0 +1,26 @@
+from nortech import Nortech
+from nortech.metadata.values.signal import SignalInput
+
+nortech = Nortech()
+
+signal_inputs = [
+    123,
+    {"workspace": "my-workspace", "asset": "my-asset", "division": "my-division", "unit": "my-unit", "signal": "my-signal"},
+    SignalInput(workspace="my-workspace", asset="my-asset", division="my-division", unit="my-unit", signal="missing"),
+]
+
+# Get many signals with bulk requests of at most 100 signals, 4 at a time
+signals = nortech.metadata.signal.get_many(signal_inputs, chunk_size=100, max_workers=4)
+
+not_found = [signal for signal, result in zip(signal_inputs, signals) if result is None]
+
+print(not_found)
+# [
+#     SignalInput(
+#         workspace="my-workspace",
+#         asset="my-asset",
+#         division="my-division",
+#         unit="my-unit",
+#         signal="missing"
+#     )
+# ]
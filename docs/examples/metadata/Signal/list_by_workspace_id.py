@@ -32,3 +32,21 @@ print(signals)
 #         )
 #     ]
 # )
+
+# List as columns, without building a pydantic model per signal
+signals = nortech.metadata.signal.list_by_workspace_id(123, columnar=True)
+
+print(signals.data)
+# shape: (2, 6)
+# ┌───────────────┬────────────────────┬─────────────────────────────────┬───────────┬─────┬────────────────┐
+# │ physical_unit ┆ description        ┆ long_description                ┆ data_type ┆ id  ┆ name           │
+# │ ---           ┆ ---                ┆ ---                             ┆ ---       ┆ --- ┆ ---            │
+# │ str           ┆ str                ┆ str                             ┆ str       ┆ i64 ┆ str            │
+# ╞═══════════════╪════════════════════╪═════════════════════════════════╪═══════════╪═════╪════════════════╡
+# │ °C            ┆ Temperature sensor ┆ Main temperature sensor for th… ┆ float64   ┆ 1   ┆ my-signal      │
+# │ bar           ┆ Pressure sensor    ┆ Main pressure sensor for the u… ┆ float64   ┆ 2   ┆ another-signal │
+# └───────────────┴────────────────────┴─────────────────────────────────┴───────────┴─────┴────────────────┘
+
+# Convert a paginated response to a polars DataFrame or an Arrow table
+signals_df = nortech.metadata.signal.list_by_workspace_id(123).to_polars()
+signals_table = nortech.metadata.signal.list_by_workspace_id(123).to_arrow()
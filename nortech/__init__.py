@@ -31,6 +31,8 @@ class Nortech:
         experimental_features: bool | None = None,
         timeout: float | Timeout | None = None,
         retry: int | Retry | None = None,
+        signal_batch_size: int | None = None,
+        signal_batch_window: float | None = None,
     ):
         """
         Initialize the Nortech class.
@@ -43,6 +45,8 @@ class Nortech:
         experimental_features (bool | None): Whether to enable experimental features.
         timeout (float | Timeout | None): The timeout setting for the API request. From [urllib3](https://urllib3.readthedocs.io/en/stable/reference/urllib3.util.html#urllib3.util.Timeout) package.
         retry (int | Retry | None): The retry setting for the API request. From [urllib3](https://urllib3.readthedocs.io/en/stable/reference/urllib3.util.html#urllib3.util.Retry) package.
+        signal_batch_size (int | None): The maximum number of signals fetched per bulk request. Defaults to 100.
+        signal_batch_window (float | None): The number of seconds during which signal lookups by ID are coalesced into bulk requests. Disabled by default.
 
         Example:
         ```python
@@ -70,6 +74,8 @@ class Nortech:
             )
         )  # Sets the retry configuration
 
+        nortech = Nortech(signal_batch_window=0.01)  # Coalesces concurrent signal lookups by ID made within 10ms
+
         ```
 
         """
@@ -86,6 +92,10 @@ class Nortech:
             api_settings["TIMEOUT"] = timeout
         if retry is not None:
             api_settings["RETRY"] = retry
+        if signal_batch_size is not None:
+            api_settings["SIGNAL_BATCH_SIZE"] = signal_batch_size
+        if signal_batch_window is not None:
+            api_settings["SIGNAL_BATCH_WINDOW"] = signal_batch_window
 
         api_settings["URL"] = url
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Sequence
+from typing import Dict, Sequence
 
 from pandas import DataFrame
 from polars import DataFrame as PolarsDataFrame
@@ -67,6 +67,7 @@ class Pandas:
         self,
         signals: Sequence[int | SignalInput | SignalInputDict | SignalOutput | SignalListOutput],
         time_window: TimeWindow,
+        units: Dict[str, str] | None = None,
     ) -> DataFrame:
         """
         Retrieve a pandas DataFrame for the specified signals within the given time window. If experimental features are enabled, live data will also be retrieved.
@@ -79,6 +80,7 @@ class Pandas:
                 - [SignalOutput](#signaloutput): A pydantic model representing a signal output. Obtained from requesting a signal metadata.
                 - [SignalListOutput](#signallistoutput): A pydantic model representing a listed signal output. Obtained from requesting signals metadata.
             time_window (TimeWindow): The time window for which data should be retrieved.
+            units (dict[str, str], optional): The units to convert signals to, keyed by signal path, e.g. `{"workspace/asset/division/unit/signal": "degF"}`. Values are converted from the physical unit of each signal. Defaults to None.
 
         Returns:
             DataFrame: A pandas DataFrame containing the data.
@@ -86,9 +88,10 @@ class Pandas:
         Raises:
             NoSignalsRequestedError: Raised when no signals are requested.
             InvalidTimeWindow: Raised when the start date is after the end date.
+            ValueError: Raised when a signal in `units` is not retrieved, has no physical unit or cannot be converted to the requested unit.
 
         """
-        return pandas_handlers.get_df(self.nortech_api, signals, time_window)
+        return pandas_handlers.get_df(self.nortech_api, signals, time_window, units)
 
 
 class Polars:
@@ -99,6 +102,7 @@ class Polars:
         self,
         signals: Sequence[int | SignalInput | SignalInputDict | SignalOutput | SignalListOutput],
         time_window: TimeWindow,
+        units: Dict[str, str] | None = None,
     ) -> LazyFrame:
         """
         Retrieve a polars LazyFrame for the specified signals within the given time window. If experimental features are enabled, live data will also be retrieved.
@@ -111,6 +115,7 @@ class Polars:
                 - [SignalOutput](#signaloutput): A pydantic model representing a signal output. Obtained from requesting a signal metadata.
                 - [SignalListOutput](#signallistoutput): A pydantic model representing a listed signal output. Obtained from requesting signals metadata.
             time_window (TimeWindow): The time window for which data should be retrieved.
+            units (dict[str, str], optional): The units to convert signals to, keyed by signal path, e.g. `{"workspace/asset/division/unit/signal": "degF"}`. Values are converted from the physical unit of each signal. Defaults to None.
 
         Returns:
             LazyFrame: A polars LazyFrame containing the data.
@@ -118,14 +123,16 @@ class Polars:
         Raises:
             NoSignalsRequestedError: Raised when no signals are requested.
             InvalidTimeWindow: Raised when the start date is after the end date.
+            ValueError: Raised when a signal in `units` is not retrieved, has no physical unit or cannot be converted to the requested unit.
 
         """
-        return polars_handlers.get_lazy_polars_df(self.nortech_api, signals, time_window)
+        return polars_handlers.get_lazy_polars_df(self.nortech_api, signals, time_window, units)
 
     def get_df(
         self,
         signals: Sequence[int | SignalInput | SignalInputDict | SignalOutput | SignalListOutput],
         time_window: TimeWindow,
+        units: Dict[str, str] | None = None,
     ) -> PolarsDataFrame:
         """
         Retrieve a polars DataFrame for the specified signals within the given time window. If experimental features are enabled, live data will also be retrieved.
@@ -138,6 +145,7 @@ class Polars:
                 - [SignalOutput](#signaloutput): A pydantic model representing a signal output. Obtained from requesting a signal metadata.
                 - [SignalListOutput](#signallistoutput): A pydantic model representing a listed signal output. Obtained from requesting signals metadata.
             time_window (TimeWindow): The time window for which data should be retrieved.
+            units (dict[str, str], optional): The units to convert signals to, keyed by signal path, e.g. `{"workspace/asset/division/unit/signal": "degF"}`. Values are converted from the physical unit of each signal. Defaults to None.
 
         Returns:
             DataFrame: A polars DataFrame containing the data.
@@ -145,9 +153,10 @@ class Polars:
         Raises:
             NoSignalsRequestedError: Raised when no signals are requested.
             InvalidTimeWindow: Raised when the start date is after the end date.
+            ValueError: Raised when a signal in `units` is not retrieved, has no physical unit or cannot be converted to the requested unit.
 
         """
-        return polars_handlers.get_polars_df(self.nortech_api, signals, time_window)
+        return polars_handlers.get_polars_df(self.nortech_api, signals, time_window, units)
 
 
 __all__ = ["Format"]
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from typing import Sequence
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
+from typing import Deque, Dict, Iterator, Sequence
 
 from pandas import DataFrame
 
 from nortech.datatools.handlers.polars import get_polars_df
 from nortech.datatools.values.windowing import TimeWindow
 from nortech.gateways.nortech_api import NortechAPI
+from nortech.metadata.services.signal import parse_signal_input_or_output_or_id_union_to_signal_input
 from nortech.metadata.values.signal import (
     SignalInput,
     SignalInputDict,
@@ -19,9 +23,37 @@ def get_df(
     nortech_api: NortechAPI,
     signals: Sequence[SignalInput | SignalInputDict | SignalOutput | SignalListOutput | int],
     time_window: TimeWindow,
+    units: Dict[str, str] | None = None,
 ) -> DataFrame:
-    polars_df = get_polars_df(nortech_api=nortech_api, signals=signals, time_window=time_window)
+    polars_df = get_polars_df(nortech_api=nortech_api, signals=signals, time_window=time_window, units=units)
 
     df = polars_df.to_pandas().set_index("timestamp")
 
     return df
+
+
+def get_df_chunks(
+    nortech_api: NortechAPI,
+    signals: Sequence[SignalInput | SignalInputDict | SignalOutput | SignalListOutput | int],
+    time_window: TimeWindow,
+    chunk: timedelta,
+    prefetch: int = 1,
+) -> Iterator[DataFrame]:
+    signal_inputs = parse_signal_input_or_output_or_id_union_to_signal_input(nortech_api, signals)
+    time_windows = time_window.split(chunk)
+
+    def get_chunk_df(chunk_time_window: TimeWindow) -> DataFrame:
+        df = get_df(nortech_api, signals=signal_inputs, time_window=chunk_time_window)
+        # Time windows include their end, which is also the start of the next chunk.
+        if chunk_time_window.end < time_window.end:
+            df = df[df.index < chunk_time_window.end]
+        return df
+
+    with ThreadPoolExecutor(max_workers=max(prefetch, 1)) as executor:
+        pending: Deque[Future[DataFrame]] = deque()
+        for chunk_time_window in time_windows:
+            pending.append(executor.submit(get_chunk_df, chunk_time_window))
+            if len(pending) > prefetch:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Sequence
+from typing import Dict, List, Sequence, Tuple
 
 from polars import DataFrame, LazyFrame, concat, lit
 
@@ -12,9 +12,11 @@ from nortech.datatools.services.storage import (
     cast_hot_schema_to_cold_schema,
     get_hot_and_cold_time_windows,
 )
+from nortech.datatools.services.units import convert_lazy_polars_df_units
 from nortech.datatools.values.windowing import ColdWindow, HotWindow, TimeWindow
 from nortech.gateways.nortech_api import NortechAPI
 from nortech.metadata.services.signal import (
+    get_signals,
     parse_signal_input_or_output_or_id_union_to_signal_input,
 )
 from nortech.metadata.values.signal import (
@@ -25,13 +27,50 @@ from nortech.metadata.values.signal import (
 )
 
 
+def signal_units(
+    nortech_api: NortechAPI,
+    signals: Sequence[SignalInput | SignalInputDict | SignalOutput | SignalListOutput | int],
+    signal_inputs: List[SignalInput],
+    units: Dict[str, str],
+) -> Dict[str, Tuple[str, str]]:
+    """Pair the physical unit of each signal in `units`, keyed by signal path, with the unit it is requested in."""
+    requested = {signal.path: signal for signal in signal_inputs}
+    unknown = [path for path in units if path not in requested]
+    if unknown:
+        raise ValueError(f"Units requested for signals that are not retrieved: {unknown}")
+
+    # Signal outputs already carry their metadata, the other signals are fetched.
+    metadata: Dict[str, SignalOutput | None] = {
+        signal.to_signal_input().path: signal for signal in signals if isinstance(signal, SignalOutput)
+    }
+    missing = [path for path in units if path not in metadata]
+    if missing:
+        metadata.update(zip(missing, get_signals(nortech_api, [requested[path] for path in missing])))
+
+    column_units: Dict[str, Tuple[str, str]] = {}
+    for path, to_unit in units.items():
+        signal = metadata[path]
+        if signal is None or signal.physical_unit is None:
+            raise ValueError(f"Signal '{path}' has no physical unit.")
+        if signal.data_type != "float":
+            raise ValueError(f"Signal '{path}' is not a float signal.")
+        column_units[path] = (signal.physical_unit, to_unit)
+    return column_units
+
+
 def get_lazy_polars_df(
     nortech_api: NortechAPI,
     signals: Sequence[SignalInput | SignalInputDict | SignalOutput | SignalListOutput | int],
     time_window: TimeWindow,
+    units: Dict[str, str] | None = None,
 ) -> LazyFrame:
     signal_inputs = parse_signal_input_or_output_or_id_union_to_signal_input(nortech_api, signals)
 
+    if units:
+        # Units are checked before fetching any data, the conversion itself is a vectorized expression on the result.
+        column_units = signal_units(nortech_api, signals, signal_inputs, units)
+        return convert_lazy_polars_df_units(get_lazy_polars_df(nortech_api, signal_inputs, time_window), column_units)
+
     if not nortech_api.settings.EXPERIMENTAL_FEATURES:
         return get_lazy_polars_df_from_cold_storage(
             nortech_api=nortech_api,
@@ -99,8 +138,9 @@ def get_polars_df(
     nortech_api: NortechAPI,
     signals: Sequence[SignalInput | SignalInputDict | SignalOutput | SignalListOutput | int],
     time_window: TimeWindow,
+    units: Dict[str, str] | None = None,
 ) -> DataFrame:
-    lazy_polars_df = get_lazy_polars_df(nortech_api, signals, time_window)
+    lazy_polars_df = get_lazy_polars_df(nortech_api, signals, time_window, units)
     polars_df = lazy_polars_df.collect()
 
     return polars_df
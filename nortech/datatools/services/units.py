@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from pint import DimensionalityError, UndefinedUnitError, UnitRegistry
+from polars import LazyFrame, col
+
+
+@lru_cache(maxsize=None)
+def unit_registry() -> UnitRegistry:
+    """Return the unit registry, which is slow to build and only built on first use."""
+    return UnitRegistry()
+
+
+@lru_cache(maxsize=None)
+def unit_conversion(from_unit: str, to_unit: str) -> Tuple[float, float]:
+    """
+    Return the factor and offset converting values from a unit to another, as `value * factor + offset`.
+
+    Offsets are only non-zero between units with different origins, e.g. "degC" and "degF".
+    """
+    registry = unit_registry()
+    try:
+        offset = registry.Quantity(0.0, from_unit).to(to_unit).magnitude
+        factor = registry.Quantity(1.0, from_unit).to(to_unit).magnitude - offset
+    except UndefinedUnitError as e:
+        raise ValueError(f"Cannot convert from '{from_unit}' to '{to_unit}', unknown unit.") from e
+    except DimensionalityError as e:
+        raise ValueError(f"Cannot convert from '{from_unit}' to '{to_unit}', incompatible units.") from e
+    return float(factor), float(offset)
+
+
+def convert_lazy_polars_df_units(lazy_polars_df: LazyFrame, units: Dict[str, Tuple[str, str]]) -> LazyFrame:
+    """Convert columns between units, given as `{column: (from_unit, to_unit)}`."""
+    conversions = {column: unit_conversion(*column_units) for column, column_units in units.items()}
+    return lazy_polars_df.with_columns(
+        (col(column) * factor + offset).alias(column)
+        for column, (factor, offset) in conversions.items()
+        if (factor, offset) != (1.0, 0.0)
+    )
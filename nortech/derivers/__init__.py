@@ -1,20 +1,34 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Literal
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Literal, Tuple, overload
 
+from bytewax.outputs import DynamicSink
 from pandas import DataFrame
+from polars import DataFrame as PolarsDataFrame
+from polars import LazyFrame
 
 from nortech.datatools.values.windowing import TimeWindow
 from nortech.derivers.handlers.deriver import (
+    DeriverSyncSummary,
     create_deriver,
+    follow_deriver_locally,
     get_deriver,
     list_derivers,
+    load_test_deriver,
+    run_deriver_backfill_locally,
+    run_deriver_locally_in_parallel_with_df,
     run_deriver_locally_with_df,
+    run_deriver_locally_with_polars_df,
     run_deriver_locally_with_source_data,
+    run_derivers_locally_with_source_data,
+    sync_derivers,
     update_deriver,
 )
 from nortech.derivers.services import operators as operators
+from nortech.derivers.services.load_test import LoadTestReport
+from nortech.derivers.services.profiling import DeriverProfile
 from nortech.derivers.values.deriver import (
     Deriver,
     DeriverInput,
@@ -120,12 +134,79 @@ class Derivers:
         """
         return update_deriver(self.nortech_api, deriver, start_at, description, create_parents, keep_data=keep_data)
 
+    def sync(
+        self,
+        derivers: Iterable[type[Deriver]],
+        start_at: datetime | None = None,
+        description: str | None = None,
+        create_parents: bool = False,
+        keep_data: bool = False,
+        max_workers: int = 4,
+    ) -> DeriverSyncSummary:
+        """
+        Deploy many derivers at once, only sending those whose definition changed.
+
+        The deployed derivers are listed once, and each deriver is compared with the deployed deriver of the same name
+        by a hash of its normalized source, which ignores formatting and comments. Derivers that are not deployed are
+        created, those whose source changed are updated and the others are skipped, so they are not restarted.
+
+        Args:
+            derivers (Iterable[type[Deriver]]): Deriver classes to deploy.
+            start_at (datetime | None, optional): The start time for the created and updated derivers. Defaults to
+                current time.
+            description (str | None, optional): The description for the created and updated derivers. Defaults to
+                None.
+            create_parents (bool, optional): Whether to create parent entities. Defaults to False.
+            keep_data (bool, optional): Whether the updated derivers keep their data. Defaults to False.
+            max_workers (int, optional): The maximum number of concurrent create and update requests. Defaults to 4.
+
+        Returns:
+            DeriverSyncSummary: The names of the created, updated and unchanged derivers, and the errors of the
+                derivers that failed to deploy.
+
+        Raises:
+            ValueError: If two derivers have the same name.
+
+        """
+        return sync_derivers(
+            self.nortech_api,
+            derivers,
+            start_at=start_at,
+            description=description,
+            create_parents=create_parents,
+            keep_data=keep_data,
+            max_workers=max_workers,
+        )
+
+    @overload
     def run_locally_with_df(
         self,
         deriver: type[Deriver],
         df: DataFrame,
         batch_size: int = 10000,
-    ) -> DataFrame:
+        batch_mode: bool = False,
+        profile: Literal[False] = False,
+    ) -> DataFrame: ...
+
+    @overload
+    def run_locally_with_df(
+        self,
+        deriver: type[Deriver],
+        df: DataFrame,
+        batch_size: int = 10000,
+        batch_mode: bool = False,
+        *,
+        profile: Literal[True],
+    ) -> Tuple[DataFrame, DeriverProfile]: ...
+
+    def run_locally_with_df(
+        self,
+        deriver: type[Deriver],
+        df: DataFrame,
+        batch_size: int = 10000,
+        batch_mode: bool = False,
+        profile: bool = False,
+    ) -> DataFrame | Tuple[DataFrame, DeriverProfile]:
         """
         Run a deriver locally on a DataFrame. The dataframe must have a timestamp index and columns equal to the input names in the deriver definition.
 
@@ -133,9 +214,14 @@ class Derivers:
             deriver (Deriver): The deriver to run.
             batch_size (int, optional): The batch size for processing. Defaults to 10000.
             df (DataFrame): The input DataFrame.
+            batch_mode (bool, optional): Whether to run the deriver's vectorized `run_batch` on chunks of `batch_size`
+                rows instead of streaming each row through `run`. Defaults to False.
+            profile (bool, optional): Whether to time each step of the deriver and count the items it processes, as
+                well as the conversion of inputs and outputs. Defaults to False.
 
         Returns:
             DataFrame: The processed DataFrame with derived signals.
+                If profile, a tuple of the DataFrame and a [DeriverProfile](#deriverprofile) of the run.
 
         """
         validate_deriver(deriver)
@@ -143,6 +229,98 @@ class Derivers:
             deriver=deriver,
             batch_size=batch_size,
             df=df,
+            batch_mode=batch_mode,
+            profile=profile,
+        )
+
+    def run_locally_with_polars_df(
+        self,
+        deriver: type[Deriver],
+        df: PolarsDataFrame | LazyFrame,
+        timestamp_column: str = "timestamp",
+        batch_size: int = 10000,
+    ) -> PolarsDataFrame:
+        """
+        Run a deriver locally on a polars DataFrame or LazyFrame, without converting it to pandas.
+
+        Only the timestamp column and the columns named after the deriver inputs are read, a batch of rows at a
+        time, and the given frame is left unchanged.
+
+        Args:
+            deriver (Deriver): The deriver to run.
+            df (DataFrame | LazyFrame): The input polars DataFrame or LazyFrame, with a datetime column
+                `timestamp_column` and columns equal to the input names in the deriver definition.
+            timestamp_column (str, optional): The name of the datetime column. Defaults to "timestamp".
+            batch_size (int, optional): The batch size for processing. Defaults to 10000.
+
+        Returns:
+            DataFrame: A polars DataFrame with a `timestamp` column, in the time zone of the input timestamps, and the
+                derived signals.
+
+        Raises:
+            ValueError: If `df` does not have a datetime column `timestamp_column`, or a column for each deriver input.
+
+        """
+        return run_deriver_locally_with_polars_df(
+            deriver=deriver,
+            df=df,
+            timestamp_column=timestamp_column,
+            batch_size=batch_size,
+        )
+
+    def run_locally_in_parallel_with_df(
+        self,
+        deriver: type[Deriver],
+        df: DataFrame,
+        workers: int | None = None,
+        partition_by: str | None = None,
+        time_chunk: timedelta | None = None,
+        warm_up: timedelta = timedelta(0),
+        batch_size: int = 10000,
+        batch_mode: bool = False,
+    ) -> DataFrame:
+        """
+        Run a deriver locally on a DataFrame, split into partitions processed in parallel by a pool of processes.
+
+        The DataFrame is partitioned by the values of the `partition_by` column, e.g. one partition per asset, and/or
+        into time chunks of `time_chunk`. Each time chunk is run with the preceding `warm_up` of inputs so that
+        stateful derivers (e.g. windows or forward fills) reach the same state they would have in a single run, and
+        only the outputs within the chunk are kept. The outputs of all partitions are merged in timestamp order.
+
+        Time chunks are aligned to the same grid as `resample` windows, so derivers windowing by a duration that
+        divides `time_chunk` match a single run. Chunks are not run with any inputs after their end, so derivers
+        looking ahead, e.g. `interpolate` with a `lookahead`, or windowing by durations that do not divide
+        `time_chunk`, may differ from a single run at the chunk edges.
+
+        Args:
+            deriver (Deriver): The deriver to run.
+            df (DataFrame): The input DataFrame, with a timestamp index and columns equal to the input names in the
+                deriver definition, plus the `partition_by` column if set.
+            workers (int | None, optional): The number of processes. Defaults to the number of CPUs.
+            partition_by (str | None, optional): The column to partition by. It is removed from the deriver inputs
+                and added to its outputs. Defaults to None.
+            time_chunk (timedelta | None, optional): The duration of the time chunks. Defaults to None.
+            warm_up (timedelta, optional): The duration of inputs replayed before each time chunk. Defaults to 0.
+            batch_size (int, optional): The batch size for processing. Defaults to 10000.
+            batch_mode (bool, optional): Whether to run the deriver's vectorized `run_batch` on chunks of `batch_size`
+                rows instead of streaming each row through `run`. Defaults to False.
+
+        Returns:
+            DataFrame: The processed DataFrame with derived signals.
+
+        Raises:
+            ValueError: If neither `partition_by` nor `time_chunk` are set.
+
+        """
+        return run_deriver_locally_in_parallel_with_df(
+            deriver=deriver,
+            df=df,
+            workers=workers,
+            partition_by=partition_by,
+            time_chunk=time_chunk,
+            warm_up=warm_up,
+            batch_size=batch_size,
+            batch_mode=batch_mode,
         )
 
     def run_locally_with_source_data(
@@ -150,17 +328,47 @@ class Derivers:
         deriver: type[Deriver],
         time_window: TimeWindow,
         batch_size: int = 10000,
-    ) -> DataFrame:
+        batch_mode: bool = False,
+        chunk: timedelta | None = None,
+        prefetch: int = 1,
+        output_path: str | Path | None = None,
+        cache_dir: str | Path | None = None,
+        warm_up: timedelta = timedelta(0),
+    ) -> DataFrame | None:
         """
         Run a deriver locally by fetching its inputs signal data for a given time window.
 
+        With `chunk`, the input data is fetched one time chunk at a time, with up to `prefetch` chunks fetched ahead
+        in the background, and each chunk is fed into the deriver as soon as it arrives, so that only a few chunks of
+        inputs are held in memory at once. The deriver state carries over from one chunk to the next.
+
+        With `cache_dir`, the outputs are cached on disk under a hash of the deriver source and input signals. A run
+        over a time window within the cached one reads the cached outputs, and a run that extends the cached window
+        only computes the outputs after it, replaying `warm_up` of inputs before them so that stateful derivers start
+        from the same state. Any other time window is computed again and replaces the cached outputs.
+
         Args:
             deriver (Deriver): The deriver to run.
             time_window (TimeWindow): The time window to process.
             batch_size (int, optional): The batch size for processing. Defaults to 10000.
+            batch_mode (bool, optional): Whether to run the deriver's vectorized `run_batch` on chunks of `batch_size`
+                rows instead of streaming each row through `run`. Defaults to False.
+            chunk (timedelta | None, optional): The duration of the time chunks in which input data is fetched.
+                Defaults to fetching the whole time window at once.
+            prefetch (int, optional): The number of chunks fetched ahead of the one being processed. Defaults to 1.
+            output_path (str | Path | None, optional): A parquet file to which outputs are written incrementally, in
+                row groups of `batch_size` rows, instead of being returned. Timestamps are written in UTC and `dict`
+                and `list` outputs as JSON strings. Defaults to returning the outputs.
+            cache_dir (str | Path | None, optional): A directory in which outputs are cached across runs. Defaults to
+                no caching.
+            warm_up (timedelta, optional): The duration of inputs replayed before the outputs computed to extend the
+                cached ones. Defaults to 0.
 
         Returns:
-            DataFrame: The processed DataFrame with derived signals.
+            DataFrame | None: The processed DataFrame with derived signals, or None if `output_path` is set.
+
+        Raises:
+            ValueError: If both `cache_dir` and `output_path` are set.
 
         """
         validate_deriver(deriver)
@@ -169,6 +377,189 @@ class Derivers:
             deriver=deriver,
             batch_size=batch_size,
             time_window=time_window,
+            batch_mode=batch_mode,
+            chunk=chunk,
+            prefetch=prefetch,
+            output_path=output_path,
+            cache_dir=cache_dir,
+            warm_up=warm_up,
+        )
+
+    def run_many_locally_with_source_data(
+        self,
+        derivers: Iterable[type[Deriver]],
+        time_window: TimeWindow,
+        batch_size: int = 10000,
+    ) -> Dict[str, DataFrame]:
+        """
+        Run many derivers locally in a single dataflow, fetching the signal data of all their inputs once.
+
+        Derivers whose inputs are outputs of other derivers in the list are fed those outputs as they are produced,
+        instead of fetching them, so a chain of derivers can be checked before any of them is deployed. Each deriver
+        is given the inputs it would receive if run on its own.
+
+        Args:
+            derivers (Iterable[type[Deriver]]): The derivers to run.
+            time_window (TimeWindow): The time window to process.
+            batch_size (int, optional): The batch size for processing. Defaults to 10000.
+
+        Returns:
+            dict[str, DataFrame]: The processed DataFrame of each deriver, by deriver name.
+
+        Raises:
+            ValueError: If two derivers have the same name or produce the same signal, or if derivers depend on each
+                other in a cycle.
+
+        """
+        return run_derivers_locally_with_source_data(
+            nortech_api=self.nortech_api,
+            derivers=derivers,
+            time_window=time_window,
+            batch_size=batch_size,
+        )
+
+    def backfill_locally(
+        self,
+        deriver: type[Deriver],
+        time_window: TimeWindow,
+        chunk: timedelta,
+        checkpoint_dir: str | Path,
+        checkpoint_interval: timedelta = timedelta(seconds=10),
+        prefetch: int = 1,
+        batch_size: int = 10000,
+    ) -> DataFrame:
+        """
+        Run a deriver locally over a long time window, fetching its inputs one time chunk at a time and checkpointing.
+
+        All chunks run through a single dataflow, so stateful operators like `ffill` or `resample` keep their state
+        across chunk boundaries and the outputs are identical to those of a single run over the whole time window.
+        Every `checkpoint_interval`, the position in the input data and the operators state are snapshotted to
+        `checkpoint_dir`, together with the outputs produced so far. Calling this method again with the same
+        checkpoint directory after a crash resumes from the last checkpoint, and once the backfill is complete it
+        returns the stored outputs without running the deriver again.
+
+        Args:
+            deriver (Deriver): The deriver to run.
+            time_window (TimeWindow): The time window to process.
+            chunk (timedelta): The duration of the time chunks in which input data is fetched.
+            checkpoint_dir (str | Path): The local directory where the backfill progress is stored. It can only be
+                reused for the same deriver code, time window and chunk.
+            checkpoint_interval (timedelta, optional): The time between checkpoints. Defaults to 10 seconds.
+            prefetch (int, optional): The number of chunks fetched ahead of the one being processed. Defaults to 1.
+            batch_size (int, optional): The batch size for processing. Defaults to 10000.
+
+        Returns:
+            DataFrame: The processed DataFrame with derived signals.
+
+        Raises:
+            ValueError: If the checkpoint directory belongs to a different backfill.
+
+        """
+        return run_deriver_backfill_locally(
+            nortech_api=self.nortech_api,
+            deriver=deriver,
+            time_window=time_window,
+            chunk=chunk,
+            checkpoint_dir=checkpoint_dir,
+            checkpoint_interval=checkpoint_interval,
+            prefetch=prefetch,
+            batch_size=batch_size,
+        )
+
+    def load_test_locally(
+        self,
+        deriver: type[Deriver],
+        duration: timedelta = timedelta(hours=1),
+        rate: float = 100.0,
+        null_ratio: float = 0.0,
+        jitter: float = 0.0,
+        batch_size: int = 10000,
+        seed: int = 0,
+        measure_memory: bool = True,
+    ) -> LoadTestReport:
+        """
+        Measure the throughput, latency and memory use of a deriver on synthetic inputs.
+
+        Random values are generated for each input of the deriver, of the type it declares, at `rate` items per
+        second of event time over `duration`. The deriver runs locally on all of them as fast as it can, and the
+        latency of each output is measured from the emission of the batch of inputs with its timestamp. The load test
+        is also available as the `deriver_load_test` fixture of the `nortech.derivers.pytest_plugin` pytest plugin,
+        for performance regression tests.
+
+        Args:
+            deriver (Deriver): The deriver to load test.
+            duration (timedelta, optional): The event time covered by the inputs. Defaults to 1 hour.
+            rate (float, optional): The number of inputs per second of event time. Defaults to 100.
+            null_ratio (float, optional): The probability of each input value being missing. Defaults to 0.
+            jitter (float, optional): The maximum shift of each input timestamp, as a fraction of the interval
+                between inputs. Defaults to 0.
+            batch_size (int, optional): The batch size for processing. Defaults to 10000.
+            seed (int, optional): The seed of the random inputs. Defaults to 0.
+            measure_memory (bool, optional): Whether to run the deriver a second time tracing memory allocations, to
+                measure its peak memory use. Defaults to True.
+
+        Returns:
+            LoadTestReport: The number of inputs and outputs, the wall time, items/sec, latency percentiles and peak
+                memory of the run.
+
+        Raises:
+            ValueError: If `rate` is not positive or `null_ratio` is not between 0 and 1.
+
+        """
+        return load_test_deriver(
+            deriver=deriver,
+            duration=duration,
+            rate=rate,
+            null_ratio=null_ratio,
+            jitter=jitter,
+            batch_size=batch_size,
+            seed=seed,
+            measure_memory=measure_memory,
+        )
+
+    def follow_locally(
+        self,
+        deriver: type[Deriver],
+        sink: Callable[[DataFrame], None] | DynamicSink,
+        start: datetime | None = None,
+        until: datetime | None = None,
+        poll_interval: timedelta = timedelta(seconds=10),
+        lag: timedelta = timedelta(0),
+        max_window: timedelta = timedelta(hours=1),
+        batch_size: int = 10000,
+    ) -> None:
+        """
+        Run a deriver locally on live data, polling hot storage for new inputs until `until` or until interrupted.
+
+        The deriver runs in a single long-running dataflow, so its state carries over between polls. Each poll only
+        fetches the inputs newer than the last ones seen, up to `max_window` at a time, and the next poll waits until
+        those inputs have been processed, so a deriver that falls behind catches up without piling up inputs in
+        memory. Rows fetched twice at the boundary between polls are only fed once.
+
+        Args:
+            deriver (Deriver): The deriver to run.
+            sink (Callable[[DataFrame], None] | DynamicSink): A function called with each batch of outputs, as a
+                DataFrame with a timestamp index in the time zone of `start`, or a bytewax sink.
+            start (datetime | None, optional): The time from which inputs are fed, within the retention of hot storage.
+                Defaults to now.
+            until (datetime | None, optional): The time at which to stop. Defaults to running until interrupted.
+            poll_interval (timedelta, optional): The time between polls once caught up. Defaults to 10 seconds.
+            lag (timedelta, optional): How long to wait for inputs to be ingested before fetching them. Inputs that
+                arrive in hot storage later than `lag` after their timestamp are missed. Defaults to 0.
+            max_window (timedelta, optional): The maximum duration of inputs fetched by a poll. Defaults to 1 hour.
+            batch_size (int, optional): The batch size for processing. Defaults to 10000.
+
+        """
+        follow_deriver_locally(
+            nortech_api=self.nortech_api,
+            deriver=deriver,
+            sink=sink,
+            start=start,
+            until=until,
+            poll_interval=poll_interval,
+            lag=lag,
+            max_window=max_window,
+            batch_size=batch_size,
         )
 
 
@@ -1,20 +1,52 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Literal
+import multiprocessing
+import pickle
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from inspect import getsource
+from pathlib import Path
+from textwrap import dedent
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Literal, Tuple
 
 import bytewax.operators as op
+import numpy as np
 from bytewax.dataflow import Dataflow
-from bytewax.testing import TestingSink, TestingSource, run_main
-from pandas import DataFrame, DatetimeIndex, isna
+from bytewax.outputs import DynamicSink
+from bytewax.recovery import RecoveryConfig
+from bytewax.testing import run_main
+from pandas import DataFrame, DatetimeIndex, Timestamp, concat
+from polars import DataFrame as PolarsDataFrame
+from polars import Datetime, LazyFrame, col
 
-from nortech.datatools.handlers.pandas import get_df
+from nortech.datatools.handlers.pandas import get_df, get_df_chunks
+from nortech.datatools.services.nortech_api import get_lazy_polars_df_from_hot_storage
 from nortech.datatools.values.windowing import TimeWindow
+from nortech.derivers.services.backfill import BackfillCheckpoint, BackfillSource, CheckpointSink, backfill_manifest
+from nortech.derivers.services.columnar import ColumnarSink, ColumnarSource, ParquetSink, PolarsSource, datetime_unit
+from nortech.derivers.services.follow import CallbackSink, FollowSource
+from nortech.derivers.services.fused import deriver_order, join_records, outputs_to_records, run_deriver
+from nortech.derivers.services.load_test import (
+    LATENCY_PERCENTILES,
+    LoadTestReport,
+    TimedSink,
+    TimedSource,
+    output_latencies,
+    synthetic_inputs,
+)
+from nortech.derivers.services.nortech_api import DeployedDeriverList, deriver_source_hash
 from nortech.derivers.services.nortech_api import create_deriver as create_deriver_api
 from nortech.derivers.services.nortech_api import get_deriver as get_deriver_api
 from nortech.derivers.services.nortech_api import list_derivers as list_derivers_api
 from nortech.derivers.services.nortech_api import update_deriver as update_deriver_api
-from nortech.derivers.values.deriver import Deriver, validate_deriver
+from nortech.derivers.services.operators import GRID_ALIGN_TO
+from nortech.derivers.services.profiling import DataflowProfiler, DeriverProfile, StepProfile
+from nortech.derivers.services.result_cache import ResultCache
+from nortech.derivers.values.deriver import Deriver, get_deriver_from_script, has_run_batch, validate_deriver
+from nortech.derivers.values.errors import InvalidDeriverError
 from nortech.gateways.nortech_api import NortechAPI
 from nortech.metadata.values.pagination import PaginationOptions
 
@@ -79,50 +111,592 @@ def update_deriver(
     )
 
 
+@dataclass
+class DeriverSyncSummary:
+    created: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    failed: Dict[str, Exception] = field(default_factory=dict)
+
+
+def _list_all_derivers(nortech_api: NortechAPI) -> List[DeployedDeriverList]:
+    page = list_derivers_api(nortech_api=nortech_api)
+    deployed_derivers = list(page.data)
+    while page.next and page.next.token:
+        page = list_derivers_api(nortech_api=nortech_api, pagination_options=page.next_pagination_options())
+        deployed_derivers.extend(page.data)
+    return deployed_derivers
+
+
+def sync_derivers(
+    nortech_api: NortechAPI,
+    derivers: Iterable[type[Deriver]],
+    start_at: datetime | None = None,
+    description: str | None = None,
+    create_parents: bool = False,
+    keep_data: bool = False,
+    max_workers: int = 4,
+) -> DeriverSyncSummary:
+    derivers = list(derivers)
+    for deriver in derivers:
+        validate_deriver(deriver)
+    names = [deriver.__name__ for deriver in derivers]
+    duplicated_names = sorted({name for name in names if names.count(name) > 1})
+    if duplicated_names:
+        raise ValueError(f"Derivers must have unique names, found duplicates: {duplicated_names}")
+
+    deployed_hashes = {
+        deployed_deriver.name: deployed_deriver.source_hash for deployed_deriver in _list_all_derivers(nortech_api)
+    }
+
+    summary = DeriverSyncSummary()
+    to_create: List[type[Deriver]] = []
+    to_update: List[type[Deriver]] = []
+    for deriver in derivers:
+        if deriver.__name__ not in deployed_hashes:
+            to_create.append(deriver)
+        elif deployed_hashes[deriver.__name__] != deriver_source_hash(getsource(deriver)):
+            to_update.append(deriver)
+        else:
+            summary.unchanged.append(deriver.__name__)
+
+    def deploy(deriver: type[Deriver], create: bool) -> None:
+        if create:
+            create_deriver_api(nortech_api, deriver, start_at, description, create_parents)
+        else:
+            update_deriver_api(nortech_api, deriver, start_at, description, create_parents, keep_data=keep_data)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [(deriver, True, executor.submit(deploy, deriver, True)) for deriver in to_create] + [
+            (deriver, False, executor.submit(deploy, deriver, False)) for deriver in to_update
+        ]
+        for deriver, create, future in futures:
+            try:
+                future.result()
+            except Exception as exception:
+                summary.failed[deriver.__name__] = exception
+            else:
+                (summary.created if create else summary.updated).append(deriver.__name__)
+
+    return summary
+
+
+def run_deriver_batches_locally_with_df(
+    deriver: type[Deriver],
+    df: DataFrame,
+    batch_size: int = 10000,
+):
+    if not has_run_batch(deriver):
+        raise InvalidDeriverError("Deriver must implement the run_batch method to run in batch mode.")
+
+    df_timezone = df.index.tz
+    return _run_deriver_batches(deriver, [df.tz_convert("UTC")], batch_size).tz_convert(df_timezone)  # type: ignore
+
+
+def _iter_deriver_batches(deriver: type[Deriver], dfs: Iterable[DataFrame], batch_size: int) -> Iterator[DataFrame]:
+    deriver_instance = deriver()
+    for df in dfs:
+        for start in range(0, len(df), batch_size):
+            yield deriver_instance.run_batch(df.iloc[start : start + batch_size])
+
+
+def _run_deriver_batches(deriver: type[Deriver], dfs: Iterable[DataFrame], batch_size: int) -> DataFrame:
+    output_dfs = list(_iter_deriver_batches(deriver, dfs, batch_size))
+    if not output_dfs:
+        return DataFrame(
+            columns=[name for name, _ in deriver.Outputs.list_types()],
+            index=DatetimeIndex([], tz="UTC", name="timestamp"),
+        )
+
+    df_out = concat(output_dfs)
+    df_out.index.name = "timestamp"
+    return df_out
+
+
 def run_deriver_locally_with_df(
     deriver: type[Deriver],
     df: DataFrame,
     batch_size: int = 10000,
+    batch_mode: bool = False,
+    profile: bool = False,
 ):
     validate_deriver(deriver)
 
     if not isinstance(df.index, DatetimeIndex):  # type: ignore
         raise ValueError("df must have a datetime index")
 
-    df_timezone = df.index.tz
-    df.index = df.index.tz_convert("UTC")
+    start = perf_counter()
+    if batch_mode:
+        df_out = run_deriver_batches_locally_with_df(deriver, df, batch_size)
+        if not profile:
+            return df_out
+        seconds = perf_counter() - start
+        return df_out, DeriverProfile(
+            steps=[StepProfile("run_batch", items_in=len(df), items_out=len(df_out), seconds=seconds)],
+            total_seconds=seconds,
+        )
 
-    def df_to_inputs(df: DataFrame):
-        for deriver_input in df.reset_index().to_dict("records"):  # type: ignore
-            input_with_none = {k: (None if isna(v) else v) for k, v in deriver_input.items()}
-            yield deriver.Inputs.model_validate(input_with_none)
+    output_sink = ColumnarSink()
+    flow = _build_dataflow(deriver, df.tz_convert("UTC"), batch_size, output_sink)  # type: ignore
+    profiler = DataflowProfiler(flow) if profile else None
+    run_main(flow)
+
+    output_start = perf_counter()
+    df_out = output_sink.to_df()
+    if "timestamp" in df_out.columns:
+        df_out = df_out.set_index("timestamp").tz_convert(df.index.tz)  # type: ignore
+    if profiler is None:
+        return df_out
+    return df_out, profiler.report(perf_counter() - start, perf_counter() - output_start)
 
-    source = TestingSource(ib=df_to_inputs(df), batch_size=batch_size)
+
+def run_deriver_locally_with_polars_df(
+    deriver: type[Deriver],
+    df: PolarsDataFrame | LazyFrame,
+    timestamp_column: str = "timestamp",
+    batch_size: int = 10000,
+) -> PolarsDataFrame:
+    validate_deriver(deriver)
+
+    lazy_df = df.lazy()
+    schema = lazy_df.collect_schema()
+    timestamp_type = schema.get(timestamp_column)
+    if not isinstance(timestamp_type, Datetime):
+        raise ValueError(f"df must have a datetime column {timestamp_column}")
+    input_names = [name for name, _ in deriver.Inputs.list_types() if name != "timestamp"]
+    missing_inputs = [name for name in input_names if name not in schema]
+    if missing_inputs:
+        raise ValueError(f"df is missing the input columns {missing_inputs}")
+
+    # Only the timestamp and input columns are selected, which for a DataFrame shares their memory instead of copying.
+    timestamp = col(timestamp_column)
+    timestamp = (
+        timestamp.dt.convert_time_zone("UTC") if timestamp_type.time_zone else timestamp.dt.replace_time_zone("UTC")
+    )
+    inputs_df = lazy_df.select(
+        timestamp.alias("timestamp"),
+        *input_names,
+    ).collect()
+
+    output_sink = ColumnarSink()
+    flow = Dataflow(deriver.__name__)
+    stream = op.input("input", flow, PolarsSource(inputs_df, deriver.Inputs, batch_size=batch_size))
+    op.output("out", deriver().run(stream), output_sink)
+    run_main(flow)
+
+    df_out = output_sink.to_polars_df(deriver.Outputs)
+    if timestamp_type.time_zone:
+        return df_out.with_columns(col("timestamp").dt.convert_time_zone(timestamp_type.time_zone))
+    return df_out.with_columns(col("timestamp").dt.replace_time_zone(None))
+
+
+def _build_dataflow(
+    deriver: type[Deriver], df: DataFrame | Iterable[DataFrame], batch_size: int, sink: ColumnarSink | ParquetSink
+) -> Dataflow:
+    source = ColumnarSource(df, deriver.Inputs, batch_size=batch_size)
     flow = Dataflow(deriver.__name__)
     stream = op.input("input", flow, source)
     transformed_stream = deriver().run(stream)
+    op.output("out", transformed_stream, sink)
+    return flow
 
-    output_list: list[Deriver.Outputs] = []
-    output_sink = TestingSink(output_list)
-    op.output("out", transformed_stream, output_sink)
 
-    run_main(flow)
+def _run_dataflow(
+    deriver: type[Deriver], df: DataFrame | Iterable[DataFrame], batch_size: int, sink: ColumnarSink | ParquetSink
+):
+    run_main(_build_dataflow(deriver, df, batch_size, sink))
 
-    df_out = DataFrame([output.model_dump(by_alias=True) for output in output_list])
-    if "timestamp" in df_out.columns:
-        df_out = df_out.set_index("timestamp").tz_convert(df_timezone)  # type: ignore
+
+@dataclass
+class DeriverPartition:
+    df: DataFrame
+    output_start: datetime | None = None
+    output_end: datetime | None = None
+    key: tuple[str, Any] | None = None
+
+
+def partition_df(
+    df: DataFrame,
+    partition_by: str | None = None,
+    time_chunk: timedelta | None = None,
+    warm_up: timedelta = timedelta(0),
+) -> List[DeriverPartition]:
+    partitions = (
+        [
+            DeriverPartition(group.drop(columns=partition_by), key=(partition_by, key))
+            for key, group in df.groupby(partition_by, sort=False)
+        ]
+        if partition_by is not None
+        else [DeriverPartition(df)]
+    )
+    if time_chunk is None:
+        return partitions
+
+    chunks: List[DeriverPartition] = []
+    for partition in partitions:
+        sorted_df = partition.df.sort_index(kind="stable")
+        timestamps = sorted_df.index
+        # Chunks are aligned to the grid of `resample` windows, so windows dividing `time_chunk` are never split.
+        align_to = Timestamp(GRID_ALIGN_TO)
+        align_to = align_to.tz_convert(timestamps.tz) if timestamps.tz is not None else align_to.tz_localize(None)  # type: ignore
+        start = 0
+        while start < len(timestamps):
+            chunk_start = align_to + ((timestamps[start] - align_to) // time_chunk) * time_chunk
+            chunk_end = chunk_start + time_chunk
+            end = timestamps.searchsorted(chunk_end)
+            chunks.append(
+                DeriverPartition(
+                    sorted_df.iloc[timestamps.searchsorted(chunk_start - warm_up) : end],
+                    output_start=chunk_start,
+                    output_end=chunk_end,
+                    key=partition.key,
+                )
+            )
+            start = end
+    return chunks
+
+
+def _serialize_deriver(deriver: type[Deriver]) -> type[Deriver] | str:
+    # Derivers that cannot be imported by the worker processes are sent as scripts, like when deployed.
+    if deriver.__module__ != "__main__":
+        try:
+            pickle.dumps(deriver)
+            return deriver
+        except (pickle.PicklingError, AttributeError):
+            pass
+    return dedent(getsource(deriver))
+
+
+def _run_partition(
+    deriver: type[Deriver] | str, partition: DeriverPartition, batch_size: int, batch_mode: bool
+) -> DataFrame:
+    if isinstance(deriver, str):
+        deriver = get_deriver_from_script(deriver)
+
+    df_out = run_deriver_locally_with_df(deriver, partition.df, batch_size, batch_mode)
+    if partition.output_start is not None and len(df_out):
+        df_out = df_out[(df_out.index >= partition.output_start) & (df_out.index < partition.output_end)]
+    if partition.key is not None:
+        df_out = df_out.assign(**{partition.key[0]: partition.key[1]})
     return df_out
 
 
+def run_deriver_locally_in_parallel_with_df(
+    deriver: type[Deriver],
+    df: DataFrame,
+    workers: int | None = None,
+    partition_by: str | None = None,
+    time_chunk: timedelta | None = None,
+    warm_up: timedelta = timedelta(0),
+    batch_size: int = 10000,
+    batch_mode: bool = False,
+):
+    validate_deriver(deriver)
+
+    if not isinstance(df.index, DatetimeIndex):  # type: ignore
+        raise ValueError("df must have a datetime index")
+    if partition_by is None and time_chunk is None:
+        raise ValueError("partition_by or time_chunk must be set to run in parallel")
+
+    partitions = partition_df(df, partition_by, time_chunk, warm_up)
+    if not partitions:
+        return run_deriver_locally_with_df(deriver, df, batch_size, batch_mode)
+
+    serialized_deriver = _serialize_deriver(deriver)
+    with ProcessPoolExecutor(
+        max_workers=min(workers or multiprocessing.cpu_count(), len(partitions)),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        futures = [
+            executor.submit(_run_partition, serialized_deriver, partition, batch_size, batch_mode)
+            for partition in partitions
+        ]
+        df_outs = [df_out for df_out in (future.result() for future in futures) if len(df_out)]
+    if not df_outs:
+        return DataFrame(columns=[name for name, _ in deriver.Outputs.list_types()])
+
+    df_out = concat(df_outs)
+    return df_out.iloc[df_out.index.argsort(kind="stable")]
+
+
 def run_deriver_locally_with_source_data(
     nortech_api: NortechAPI,
     deriver: type[Deriver],
     time_window: TimeWindow,
     batch_size: int = 10000,
-):
+    batch_mode: bool = False,
+    chunk: timedelta | None = None,
+    prefetch: int = 1,
+    output_path: str | Path | None = None,
+    cache_dir: str | Path | None = None,
+    warm_up: timedelta = timedelta(0),
+) -> DataFrame | None:
+    if cache_dir is not None:
+        if output_path is not None:
+            raise ValueError("cache_dir and output_path cannot be set together")
+        return _run_deriver_locally_with_cache(
+            nortech_api, deriver, time_window, batch_size, batch_mode, chunk, prefetch, cache_dir, warm_up
+        )
+
     inputs = deriver.Inputs.list()
-    df = get_df(nortech_api, signals=[_input for _, _input in inputs], time_window=time_window)
+    signals = [_input for _, _input in inputs]
     path_to_name = {_input.path: name for name, _input in inputs}
-    df = df.rename(columns=path_to_name)
 
-    return run_deriver_locally_with_df(deriver, df, batch_size)
+    if chunk is None and output_path is None:
+        df = get_df(nortech_api, signals=signals, time_window=time_window)
+        df = df.rename(columns=path_to_name)
+
+        return run_deriver_locally_with_df(deriver, df, batch_size, batch_mode)
+
+    validate_deriver(deriver)
+    if batch_mode and not has_run_batch(deriver):
+        raise InvalidDeriverError("Deriver must implement the run_batch method to run in batch mode.")
+
+    dfs = (
+        df.rename(columns=path_to_name).tz_convert("UTC")
+        for df in (
+            get_df_chunks(nortech_api, signals=signals, time_window=time_window, chunk=chunk, prefetch=prefetch)
+            if chunk is not None
+            else [get_df(nortech_api, signals=signals, time_window=time_window)]
+        )
+    )
+
+    if batch_mode and output_path is not None:
+        partition = ParquetSink(output_path, deriver.Outputs, batch_size).build("out", 0, 1)
+        for df_out in _iter_deriver_batches(deriver, dfs, batch_size):
+            partition.write_df(df_out)
+        partition.close()
+        return None
+
+    if batch_mode:
+        return _run_deriver_batches(deriver, dfs, batch_size).tz_convert(time_window.start.tzinfo)  # type: ignore
+
+    if output_path is not None:
+        _run_dataflow(deriver, dfs, batch_size, ParquetSink(output_path, deriver.Outputs, batch_size))
+        return None
+
+    output_sink = ColumnarSink()
+    _run_dataflow(deriver, dfs, batch_size, output_sink)
+
+    df_out = output_sink.to_df()
+    if "timestamp" in df_out.columns:
+        df_out = df_out.set_index("timestamp").tz_convert(time_window.start.tzinfo)  # type: ignore
+    return df_out
+
+
+def load_test_deriver(
+    deriver: type[Deriver],
+    duration: timedelta = timedelta(hours=1),
+    rate: float = 100.0,
+    null_ratio: float = 0.0,
+    jitter: float = 0.0,
+    batch_size: int = 10000,
+    seed: int = 0,
+    measure_memory: bool = True,
+) -> LoadTestReport:
+    validate_deriver(deriver)
+    df = synthetic_inputs(deriver.Inputs, duration, rate, null_ratio, jitter, seed=seed)
+
+    def build_flow() -> Tuple[Dataflow, TimedSource, TimedSink]:
+        source = TimedSource(ColumnarSource(df, deriver.Inputs, batch_size=batch_size))
+        sink = TimedSink()
+        flow = Dataflow(deriver.__name__)
+        op.output("out", deriver().run(op.input("input", flow, source)), sink)
+        return flow, source, sink
+
+    flow, source, sink = build_flow()
+    start = perf_counter()
+    run_main(flow)
+    seconds = perf_counter() - start
+
+    latencies = output_latencies(source.emitted, sink.received)
+    report = LoadTestReport(
+        items=len(df),
+        outputs=len(sink.received),
+        seconds=seconds,
+        latency_percentiles=(
+            dict(zip(LATENCY_PERCENTILES, np.percentile(latencies, LATENCY_PERCENTILES).tolist()))
+            if len(latencies)
+            else {}
+        ),
+    )
+
+    if measure_memory:
+        # Tracing allocations slows the run down, so memory is measured on a second run that is not timed.
+        flow, _, _ = build_flow()
+        tracemalloc.start()
+        try:
+            run_main(flow)
+            report.peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return report
+
+
+def _run_deriver_locally_with_cache(
+    nortech_api: NortechAPI,
+    deriver: type[Deriver],
+    time_window: TimeWindow,
+    batch_size: int,
+    batch_mode: bool,
+    chunk: timedelta | None,
+    prefetch: int,
+    cache_dir: str | Path,
+    warm_up: timedelta,
+) -> DataFrame:
+    validate_deriver(deriver)
+    cache = ResultCache(cache_dir, deriver, batch_mode)
+    cached_time_window = cache.time_window
+
+    def run(run_time_window: TimeWindow) -> DataFrame:
+        return run_deriver_locally_with_source_data(  # type: ignore
+            nortech_api, deriver, run_time_window, batch_size, batch_mode, chunk, prefetch
+        )
+
+    if cached_time_window is None or not (cached_time_window.start <= time_window.start <= cached_time_window.end):
+        cache.write(run(time_window), time_window)
+    elif time_window.end > cached_time_window.end:
+        # Only the tail after the cached outputs is computed, replaying `warm_up` of inputs before it so that stateful
+        # derivers reach the state they had at the end of the cached run.
+        df_tail = run(TimeWindow(start=cached_time_window.end - warm_up, end=time_window.end))
+        if "timestamp" in df_tail.index.names:
+            df_tail = df_tail[df_tail.index > cached_time_window.end]
+        cache.write(df_tail, time_window, append=True)
+
+    return cache.read(time_window)
+
+
+def run_derivers_locally_with_source_data(
+    nortech_api: NortechAPI,
+    derivers: Iterable[type[Deriver]],
+    time_window: TimeWindow,
+    batch_size: int = 10000,
+) -> Dict[str, DataFrame]:
+    derivers = list(derivers)
+    for deriver in derivers:
+        validate_deriver(deriver)
+    if len({deriver.__name__ for deriver in derivers}) != len(derivers):
+        raise ValueError("Derivers must have unique names")
+    ordered_derivers = deriver_order(derivers)
+
+    produced_paths = {output.path: deriver for deriver in derivers for _, output in deriver.Outputs.list()}
+    signals = list(
+        {
+            _input.path: _input
+            for deriver in derivers
+            for _, _input in deriver.Inputs.list()
+            if _input.path not in produced_paths
+        }.values()
+    )
+    df = get_df(nortech_api, signals=signals, time_window=time_window)
+
+    # Each deriver reads the shared source rows and the outputs of the derivers producing its other inputs, joined on
+    # their timestamps.
+    consumed_paths = {_input.path for deriver in derivers for _, _input in deriver.Inputs.list()}
+    flow = Dataflow("derivers")
+    source_records = op.input("input", flow, ColumnarSource(df.tz_convert("UTC"), None, batch_size=batch_size))
+    output_records = {}
+    sinks = {deriver: ColumnarSink() for deriver in derivers}
+    for deriver in ordered_derivers:
+        input_paths = [_input.path for _, _input in deriver.Inputs.list()]
+        upstream_derivers = dict.fromkeys(produced_paths[path] for path in input_paths if path in produced_paths)
+        upstreams = [output_records[upstream] for upstream in upstream_derivers]
+        if any(path not in produced_paths for path in input_paths):
+            upstreams.insert(0, source_records)
+
+        records = upstreams[0] if len(upstreams) == 1 else join_records(f"{deriver.__name__}_inputs", *upstreams)
+        outputs = run_deriver(deriver.__name__, records, deriver)
+        op.output(f"{deriver.__name__}_out", outputs, sinks[deriver])
+        if any(output.path in consumed_paths for _, output in deriver.Outputs.list()):
+            output_records[deriver] = op.flat_map_batch(
+                f"{deriver.__name__}_records", outputs, outputs_to_records(deriver.Outputs)
+            )
+
+    run_main(flow)
+
+    df_outs: Dict[str, DataFrame] = {}
+    for deriver in derivers:
+        df_out = sinks[deriver].to_df()
+        if "timestamp" in df_out.columns:
+            df_out = df_out.set_index("timestamp").tz_convert(time_window.start.tzinfo)  # type: ignore
+        df_outs[deriver.__name__] = df_out
+    return df_outs
+
+
+def run_deriver_backfill_locally(
+    nortech_api: NortechAPI,
+    deriver: type[Deriver],
+    time_window: TimeWindow,
+    chunk: timedelta,
+    checkpoint_dir: str | Path,
+    checkpoint_interval: timedelta = timedelta(seconds=10),
+    prefetch: int = 1,
+    batch_size: int = 10000,
+) -> DataFrame:
+    validate_deriver(deriver)
+
+    checkpoint = BackfillCheckpoint(checkpoint_dir, backfill_manifest(deriver, time_window, chunk))
+    if not checkpoint.complete:
+        inputs = deriver.Inputs.list()
+        signals = [_input for _, _input in inputs]
+        path_to_name = {_input.path: name for name, _input in inputs}
+
+        def fetch_chunks(chunks_time_window: TimeWindow):
+            for df in get_df_chunks(nortech_api, signals, chunks_time_window, chunk=chunk, prefetch=prefetch):
+                yield df.rename(columns=path_to_name).tz_convert("UTC")
+
+        source = BackfillSource(time_window.split(chunk), fetch_chunks, deriver.Inputs, batch_size)
+        flow = Dataflow(deriver.__name__)
+        stream = op.input("input", flow, source)
+        transformed_stream = deriver().run(stream)
+        op.output(
+            "out",
+            op.key_on("key_outputs", transformed_stream, lambda _: "outputs"),
+            CheckpointSink(checkpoint, deriver.Outputs),
+        )
+
+        run_main(flow, epoch_interval=checkpoint_interval, recovery_config=RecoveryConfig(checkpoint.recovery_dir))
+        checkpoint.mark_complete()
+
+    df_out = checkpoint.read_outputs()
+    if "timestamp" in df_out.columns:
+        df_out = df_out.set_index("timestamp").tz_convert(time_window.start.tzinfo)  # type: ignore
+        # Parquet parts store microseconds, which pandas may read back at a different resolution than a single run.
+        df_out.index = df_out.index.as_unit(datetime_unit())  # type: ignore
+    return df_out
+
+
+def follow_deriver_locally(
+    nortech_api: NortechAPI,
+    deriver: type[Deriver],
+    sink: Callable[[DataFrame], None] | DynamicSink,
+    start: datetime | None = None,
+    until: datetime | None = None,
+    poll_interval: timedelta = timedelta(seconds=10),
+    lag: timedelta = timedelta(0),
+    max_window: timedelta = timedelta(hours=1),
+    batch_size: int = 10000,
+) -> None:
+    validate_deriver(deriver)
+
+    inputs = deriver.Inputs.list()
+    signals = [_input for _, _input in inputs]
+    path_to_name = {_input.path: name for name, _input in inputs}
+    start = start or datetime.now(timezone.utc)
+
+    def fetch(time_window: TimeWindow) -> DataFrame:
+        polars_df = get_lazy_polars_df_from_hot_storage(nortech_api, signals, time_window).collect()
+        return polars_df.to_pandas().set_index("timestamp").rename(columns=path_to_name).tz_convert("UTC")
+
+    source = FollowSource(fetch, deriver.Inputs, start, until, poll_interval, lag, max_window, batch_size)
+    flow = Dataflow(deriver.__name__)
+    stream = op.input("input", flow, source)
+    transformed_stream = deriver().run(stream)
+    op.output(
+        "out",
+        transformed_stream,
+        sink if isinstance(sink, DynamicSink) else CallbackSink(sink, deriver.Outputs, start.tzinfo),
+    )
+
+    run_main(flow)
@@ -0,0 +1,46 @@
+"""
+Pytest fixtures for deriver performance regression tests.
+
+Enable them by adding `pytest_plugins = ["nortech.derivers.pytest_plugin"]` to a `conftest.py`. The reports of the load
+tests run by each test are listed in the terminal summary.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, List, Tuple
+
+import pytest
+
+from nortech.derivers.handlers.deriver import load_test_deriver
+from nortech.derivers.services.load_test import LoadTestReport
+
+_reports_key = pytest.StashKey[List[Tuple[str, str, LoadTestReport]]]()
+
+
+@pytest.fixture
+def deriver_load_test(request: pytest.FixtureRequest) -> Callable[..., LoadTestReport]:
+    """Run a deriver load test and return its report, with the arguments of `Derivers.load_test_locally`."""
+    reports = request.config.stash.setdefault(_reports_key, [])
+
+    def load_test(deriver, *args, **kwargs) -> LoadTestReport:
+        report = load_test_deriver(deriver, *args, **kwargs)
+        reports.append((request.node.nodeid, deriver.__name__, report))
+        return report
+
+    return load_test
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus: int, config: pytest.Config) -> None:
+    reports = config.stash.get(_reports_key, [])
+    if not reports:
+        return
+
+    terminalreporter.section("deriver load tests")
+    for nodeid, deriver_name, report in reports:
+        latencies = " ".join(
+            f"p{percentile}={latency * 1000:.1f}ms" for percentile, latency in report.latency_percentiles.items()
+        )
+        memory = f" peak={report.peak_memory / 2**20:.1f}MiB" if report.peak_memory is not None else ""
+        terminalreporter.write_line(
+            f"{nodeid} {deriver_name}: {report.items_per_second:,.0f} items/s {latencies}{memory}"
+        )
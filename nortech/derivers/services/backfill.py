@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+from inspect import getsource
+from pathlib import Path
+from typing import Any, Callable, Generator, Iterator, List, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from bytewax.inputs import FixedPartitionedSource, StatefulSourcePartition
+from bytewax.outputs import FixedPartitionedSink, StatefulSinkPartition
+from bytewax.recovery import init_db_dir
+from pandas import DataFrame, concat, read_parquet
+from pydantic import BaseModel
+
+from nortech.datatools.values.windowing import TimeWindow
+from nortech.derivers.services.columnar import (
+    df_to_records,
+    models_adapter,
+    output_json_fields,
+    output_schema,
+    outputs_to_columns,
+)
+from nortech.derivers.services.nortech_api import deriver_source_hash
+from nortech.derivers.values.deriver import Deriver, DeriverInputs, DeriverOutputs
+
+# Index of the next chunk to fetch and number of rows of that chunk already emitted.
+SourceState = Tuple[int, int]
+
+
+class BackfillCheckpoint:
+    """
+    Local directory holding the progress of a backfill.
+
+    The directory contains the bytewax recovery database, with the snapshots of the source position and of the
+    operators state, the output parts committed with each snapshot and a manifest of the backfill parameters.
+    """
+
+    def __init__(self, path: str | Path, manifest: dict[str, Any]):
+        self.path = Path(path)
+        self.recovery_dir = self.path / "recovery"
+        self.outputs_dir = self.path / "outputs"
+        self.manifest_path = self.path / "backfill.json"
+        self.complete_path = self.path / "complete"
+
+        if self.manifest_path.exists():
+            existing_manifest = json.loads(self.manifest_path.read_text())
+            if existing_manifest != manifest:
+                raise ValueError(
+                    f"Checkpoint directory {self.path} belongs to a different backfill: {existing_manifest}"
+                )
+        else:
+            self.path.mkdir(parents=True, exist_ok=True)
+            self.manifest_path.write_text(json.dumps(manifest))
+
+        self.outputs_dir.mkdir(exist_ok=True)
+        if not self.recovery_dir.exists():
+            self.recovery_dir.mkdir()
+            init_db_dir(self.recovery_dir, 1)
+
+    @property
+    def complete(self) -> bool:
+        return self.complete_path.exists()
+
+    def mark_complete(self) -> None:
+        self.complete_path.touch()
+
+    def part_path(self, part: int) -> Path:
+        return self.outputs_dir / f"part-{part:06d}.parquet"
+
+    def parts(self) -> List[Path]:
+        return sorted(self.outputs_dir.glob("part-*.parquet"))
+
+    def read_outputs(self) -> DataFrame:
+        dfs = [read_parquet(part) for part in self.parts()]
+        if not dfs:
+            return DataFrame()
+        return concat(dfs, ignore_index=True)
+
+
+class _BackfillSourcePartition(StatefulSourcePartition[DeriverInputs, SourceState]):
+    def __init__(
+        self,
+        fetch_chunks: Callable[[int], Generator[DataFrame, None, None]],
+        inputs: type[DeriverInputs],
+        batch_size: int,
+        resume_state: SourceState,
+    ):
+        self.chunk_index, self.position = resume_state
+        self.chunks = fetch_chunks(self.chunk_index)
+        self.df: DataFrame | None = None
+        self.adapter = models_adapter(inputs)
+        self.batch_size = batch_size
+
+    def next_batch(self) -> List[DeriverInputs]:
+        if self.df is None:
+            # Raises StopIteration once all chunks are consumed, which ends the partition.
+            self.df = next(self.chunks)
+
+        batch = self.df.iloc[self.position : self.position + self.batch_size]
+        self.position += len(batch)
+        if self.position >= len(self.df):
+            self.df = None
+            self.chunk_index += 1
+            self.position = 0
+        return self.adapter.validate_python(df_to_records(batch))
+
+    def snapshot(self) -> SourceState:
+        return (self.chunk_index, self.position)
+
+    def close(self) -> None:
+        self.chunks.close()
+
+
+class BackfillSource(FixedPartitionedSource[DeriverInputs, SourceState]):
+    """
+    Source emitting the inputs of a backfill one time chunk at a time.
+
+    Its snapshots record the chunk being emitted and the position in it, so that a resumed backfill fetches the input
+    data again from that chunk on.
+    """
+
+    def __init__(
+        self,
+        time_windows: List[TimeWindow],
+        fetch_chunks: Callable[[TimeWindow], Iterator[DataFrame]],
+        inputs: type[DeriverInputs],
+        batch_size: int = 10000,
+    ):
+        self.time_windows = time_windows
+        self.fetch_chunks = fetch_chunks
+        self.inputs = inputs
+        self.batch_size = batch_size
+
+    def _fetch_chunks_from(self, chunk_index: int) -> Generator[DataFrame, None, None]:
+        # A generator even when resuming after the last chunk, so that the partition can always close it.
+        if chunk_index < len(self.time_windows):
+            yield from self.fetch_chunks(
+                TimeWindow(start=self.time_windows[chunk_index].start, end=self.time_windows[-1].end)
+            )
+
+    def list_parts(self) -> List[str]:
+        return ["chunks"]
+
+    def build_part(self, step_id: str, for_part: str, resume_state: SourceState | None) -> _BackfillSourcePartition:
+        return _BackfillSourcePartition(self._fetch_chunks_from, self.inputs, self.batch_size, resume_state or (0, 0))
+
+
+class _CheckpointSinkPartition(StatefulSinkPartition[BaseModel, int]):
+    def __init__(self, checkpoint: BackfillCheckpoint, schema: pa.Schema, json_fields: List[str], part: int):
+        self.checkpoint = checkpoint
+        self.schema = schema
+        self.json_fields = json_fields
+        self.part = part
+        self.items: List[BaseModel] = []
+
+        # Parts written after the snapshot the backfill resumes from are produced again.
+        for path in checkpoint.parts()[part:]:
+            path.unlink()
+
+    def write_batch(self, values: List[BaseModel]) -> None:
+        self.items.extend(values)
+
+    def snapshot(self) -> int:
+        if self.items:
+            table = pa.Table.from_pydict(
+                outputs_to_columns(self.items, self.schema, self.json_fields), schema=self.schema
+            )
+            pq.write_table(table, self.checkpoint.part_path(self.part))
+            self.part += 1
+            self.items = []
+        return self.part
+
+    def close(self) -> None:
+        self.snapshot()
+
+
+class CheckpointSink(FixedPartitionedSink[BaseModel, int]):
+    """
+    Sink writing deriver outputs to the parts of a backfill checkpoint.
+
+    The outputs of each epoch are written as a new part when the epoch snapshot is taken, and a resumed backfill drops
+    the parts written after the snapshot it resumes from, so that each output is kept exactly once.
+    """
+
+    def __init__(self, checkpoint: BackfillCheckpoint, outputs: type[DeriverOutputs]):
+        self.checkpoint = checkpoint
+        self.outputs = outputs
+
+    def list_parts(self) -> List[str]:
+        return ["outputs"]
+
+    def build_part(self, step_id: str, for_part: str, resume_state: int | None) -> _CheckpointSinkPartition:
+        return _CheckpointSinkPartition(
+            self.checkpoint, output_schema(self.outputs), output_json_fields(self.outputs), resume_state or 0
+        )
+
+
+def backfill_manifest(deriver: type[Deriver], time_window: TimeWindow, chunk: timedelta) -> dict[str, Any]:
+    return {
+        "deriver": deriver.__name__,
+        # Checkpoints of a deriver whose code changed hold outputs of the previous code.
+        "source": deriver_source_hash(getsource(deriver)),
+        "start": time_window.start.isoformat(),
+        "end": time_window.end.isoformat(),
+        "chunk": chunk.total_seconds(),
+    }
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from bytewax.inputs import FixedPartitionedSource, StatefulSourcePartition
+from bytewax.outputs import DynamicSink, StatelessSinkPartition
+from pandas import DataFrame, DatetimeIndex, concat
+from polars import DataFrame as PolarsDataFrame
+from polars import concat as polars_concat
+from polars import from_arrow
+from pydantic import BaseModel, TypeAdapter
+
+from nortech.derivers.values.deriver import DeriverInputs, DeriverOutputs
+
+ARROW_TYPES: Dict[type, pa.DataType] = {
+    float: pa.float64(),
+    str: pa.string(),
+    bool: pa.bool_(),
+    dict: pa.string(),
+    list: pa.string(),
+}
+
+
+@lru_cache(maxsize=None)
+def models_adapter(model: type[BaseModel]) -> TypeAdapter[List[Any]]:
+    return TypeAdapter(List[model])  # type: ignore
+
+
+def df_to_records(df: DataFrame) -> List[Dict[str, Any]]:
+    """Convert a DataFrame with a timestamp index to row dictionaries, with None for missing values."""
+    columns: Dict[str, List[Any]] = {"timestamp": list(df.index.to_pydatetime())}
+    for name, column in df.items():
+        columns[str(name)] = column.astype(object).where(column.notna(), None).tolist()
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+
+class _ColumnarSourcePartition(StatefulSourcePartition[DeriverInputs, int]):
+    def __init__(self, dfs: Iterator[DataFrame], inputs: type[DeriverInputs] | None, batch_size: int, offset: int):
+        self.dfs = dfs
+        self.df = DataFrame()
+        self.position = 0
+        self.adapter = models_adapter(inputs) if inputs is not None else None
+        self.batch_size = batch_size
+        self.offset = 0
+        while self.offset < offset:
+            self._next_chunk(offset - self.offset)
+
+    def _next_chunk(self, size: int) -> DataFrame:
+        while self.position >= len(self.df):
+            # Raises StopIteration once all DataFrames are consumed, which ends the partition.
+            self.df = next(self.dfs)
+            self.position = 0
+
+        chunk = self.df.iloc[self.position : self.position + size]
+        self.position += len(chunk)
+        self.offset += len(chunk)
+        return chunk
+
+    def next_batch(self) -> List[Any]:
+        records = df_to_records(self._next_chunk(self.batch_size))
+        return records if self.adapter is None else self.adapter.validate_python(records)
+
+    def snapshot(self) -> int:
+        return self.offset
+
+
+class ColumnarSource(FixedPartitionedSource[DeriverInputs, int]):
+    """
+    Source emitting the rows of a DataFrame as deriver inputs.
+
+    The rows are converted column by column and validated a whole batch at a time, instead of one model at a time.
+    The source can also be given an iterable of DataFrames, e.g. time chunks fetched while the dataflow runs, which
+    are only pulled when the previous one has been emitted. Without `inputs`, the rows are emitted as dictionaries
+    keyed by column name.
+    """
+
+    def __init__(
+        self, df: DataFrame | Iterable[DataFrame], inputs: type[DeriverInputs] | None, batch_size: int = 10000
+    ):
+        self.df = df
+        self.inputs = inputs
+        self.batch_size = batch_size
+
+    def list_parts(self) -> List[str]:
+        return ["columns"]
+
+    def build_part(self, step_id: str, for_part: str, resume_state: int | None) -> _ColumnarSourcePartition:
+        dfs = iter([self.df]) if isinstance(self.df, DataFrame) else iter(self.df)
+        return _ColumnarSourcePartition(dfs, self.inputs, self.batch_size, resume_state or 0)
+
+
+class _PolarsSourcePartition(StatefulSourcePartition[DeriverInputs, int]):
+    def __init__(self, df: PolarsDataFrame, inputs: type[DeriverInputs], batch_size: int, offset: int):
+        self.df = df
+        self.adapter = models_adapter(inputs)
+        self.batch_size = batch_size
+        self.offset = offset
+
+    def next_batch(self) -> List[DeriverInputs]:
+        if self.offset >= len(self.df):
+            raise StopIteration
+        # Slices share the memory of the DataFrame, only the rows of the batch are converted to Python objects.
+        batch = self.df.slice(self.offset, self.batch_size)
+        self.offset += len(batch)
+        return self.adapter.validate_python(batch.to_dicts())
+
+    def snapshot(self) -> int:
+        return self.offset
+
+
+class PolarsSource(FixedPartitionedSource[DeriverInputs, int]):
+    """Source emitting the rows of a polars DataFrame with a `timestamp` column as deriver inputs, a batch at a time."""
+
+    def __init__(self, df: PolarsDataFrame, inputs: type[DeriverInputs], batch_size: int = 10000):
+        self.df = df
+        self.inputs = inputs
+        self.batch_size = batch_size
+
+    def list_parts(self) -> List[str]:
+        return ["rows"]
+
+    def build_part(self, step_id: str, for_part: str, resume_state: int | None) -> _PolarsSourcePartition:
+        return _PolarsSourcePartition(self.df, self.inputs, self.batch_size, resume_state or 0)
+
+
+class _ColumnarSinkPartition(StatelessSinkPartition[BaseModel]):
+    def __init__(self):
+        self.columns: Dict[str, List[Any]] = {}
+        self.size = 0
+
+    def write_batch(self, items: List[BaseModel]) -> None:
+        if not items:
+            return
+
+        for name in type(items[0]).model_fields:
+            self.columns.setdefault(name, [None] * self.size).extend([getattr(item, name, None) for item in items])
+
+        for index, item in enumerate(items):
+            for name, value in (item.__pydantic_extra__ or {}).items():
+                column = self.columns.setdefault(name, [None] * self.size)
+                column.extend([None] * (self.size + index + 1 - len(column)))
+                column[self.size + index] = value
+
+        self.size += len(items)
+        for column in self.columns.values():
+            column.extend([None] * (self.size - len(column)))
+
+    def to_df(self) -> DataFrame:
+        return DataFrame(self.columns)
+
+    def to_polars_df(self) -> PolarsDataFrame:
+        return PolarsDataFrame(self.columns, strict=False)
+
+
+class ColumnarSink(DynamicSink[BaseModel]):
+    """Sink accumulating deriver outputs into column buffers, to build a single DataFrame at the end of the run."""
+
+    def __init__(self):
+        self.partitions: List[_ColumnarSinkPartition] = []
+
+    def build(self, step_id: str, worker_index: int, worker_count: int) -> _ColumnarSinkPartition:
+        partition = _ColumnarSinkPartition()
+        self.partitions.append(partition)
+        return partition
+
+    def to_df(self) -> DataFrame:
+        dfs = [partition.to_df() for partition in self.partitions if partition.size]
+        if not dfs:
+            return DataFrame()
+        if len(dfs) == 1:
+            return dfs[0]
+        return concat(dfs, ignore_index=True).sort_values("timestamp", kind="stable", ignore_index=True)
+
+    def to_polars_df(self, outputs: type[DeriverOutputs]) -> PolarsDataFrame:
+        dfs = [partition.to_polars_df() for partition in self.partitions if partition.size]
+        if not dfs:
+            return from_arrow(output_schema(outputs).empty_table())  # type: ignore
+        if len(dfs) == 1:
+            return dfs[0]
+        return polars_concat(dfs, how="diagonal_relaxed").sort("timestamp", maintain_order=True)
+
+
+def output_schema(outputs: type[DeriverOutputs]) -> pa.Schema:
+    return pa.schema(
+        [("timestamp", pa.timestamp("us", tz="UTC"))]
+        + [(name, ARROW_TYPES[output_type]) for name, output_type in outputs.list_types()]
+    )
+
+
+@lru_cache(maxsize=None)
+def datetime_unit() -> str:
+    """Return the resolution pandas gives to datetimes, which the outputs of in-memory runs are indexed with."""
+    return DatetimeIndex([datetime(2000, 1, 1)]).unit
+
+
+def output_json_fields(outputs: type[DeriverOutputs]) -> List[str]:
+    return [name for name, output_type in outputs.list_types() if output_type in (dict, list)]
+
+
+def outputs_to_columns(items: List[BaseModel], schema: pa.Schema, json_fields: List[str]) -> Dict[str, List[Any]]:
+    columns: Dict[str, List[Any]] = {}
+    for name in schema.names:
+        values = [getattr(item, name, None) for item in items]
+        if name in json_fields:
+            values = [None if value is None else json.dumps(value) for value in values]
+        columns[name] = values
+    return columns
+
+
+class _ParquetSinkPartition(StatelessSinkPartition[BaseModel]):
+    def __init__(self, writer: pq.ParquetWriter, json_fields: List[str], batch_size: int):
+        self.writer = writer
+        self.json_fields = json_fields
+        self.batch_size = batch_size
+        self.columns: Dict[str, List[Any]] = {name: [] for name in writer.schema.names}
+
+    def write_batch(self, items: List[BaseModel]) -> None:
+        for name, values in outputs_to_columns(items, self.writer.schema, self.json_fields).items():
+            self.columns[name].extend(values)
+
+        if len(self.columns["timestamp"]) >= self.batch_size:
+            self.flush()
+
+    def write_df(self, df: DataFrame) -> None:
+        """Write a DataFrame of outputs with a timestamp index, e.g. from `run_batch`."""
+        self.flush()
+        df = df.reset_index().reindex(columns=self.writer.schema.names)
+        for name in self.json_fields:
+            df[name] = [None if value is None else json.dumps(value) for value in df[name].astype(object)]
+        self.writer.write_table(pa.Table.from_pandas(df, schema=self.writer.schema, preserve_index=False))
+
+    def flush(self) -> None:
+        if self.columns["timestamp"]:
+            self.writer.write_table(pa.Table.from_pydict(self.columns, schema=self.writer.schema))
+            self.columns = {name: [] for name in self.columns}
+
+    def close(self) -> None:
+        self.flush()
+        self.writer.close()
+
+
+class ParquetSink(DynamicSink[BaseModel]):
+    """
+    Sink writing deriver outputs to a parquet file as they are produced.
+
+    Outputs are buffered until `batch_size` rows are ready and then written as a row group, so memory use does not
+    grow with the length of the run. Only the timestamp and the declared outputs are written, with `dict` and `list`
+    outputs encoded as JSON strings.
+    """
+
+    def __init__(self, path: str | Path, outputs: type[DeriverOutputs], batch_size: int = 10000):
+        self.path = path
+        self.outputs = outputs
+        self.batch_size = batch_size
+
+    def build(self, step_id: str, worker_index: int, worker_count: int) -> _ParquetSinkPartition:
+        path = Path(self.path)
+        if worker_count > 1:
+            path = path.with_name(f"{path.stem}-{worker_index}{path.suffix}")
+        return _ParquetSinkPartition(
+            pq.ParquetWriter(path, output_schema(self.outputs)),
+            json_fields=output_json_fields(self.outputs),
+            batch_size=self.batch_size,
+        )
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List
+
+from bytewax.inputs import FixedPartitionedSource, StatefulSourcePartition
+from bytewax.outputs import DynamicSink, StatelessSinkPartition
+from pandas import DataFrame
+
+from nortech.datatools.values.windowing import TimeWindow
+from nortech.derivers.services.columnar import df_to_records, models_adapter, output_schema, outputs_to_columns
+from nortech.derivers.values.deriver import DeriverInputs, DeriverOutputs
+
+
+class _FollowSourcePartition(StatefulSourcePartition[DeriverInputs, datetime]):
+    def __init__(
+        self,
+        fetch: Callable[[TimeWindow], DataFrame],
+        inputs: type[DeriverInputs],
+        last_seen: datetime,
+        until: datetime | None,
+        poll_interval: timedelta,
+        lag: timedelta,
+        max_window: timedelta,
+        batch_size: int,
+    ):
+        self.fetch = fetch
+        self.adapter = models_adapter(inputs)
+        self.last_seen = last_seen
+        self.emitted_until = last_seen
+        self.until = until
+        self.poll_interval = poll_interval
+        self.lag = lag
+        self.max_window = max_window
+        self.batch_size = batch_size
+        self.buffer = DataFrame()
+        self.position = 0
+        self.next_poll = datetime.now(timezone.utc)
+
+    def _poll(self) -> None:
+        now = datetime.now(timezone.utc)
+        end = min(now - self.lag, self.last_seen + self.max_window)
+        if self.until is not None:
+            end = min(end, self.until)
+        if end > self.last_seen:
+            df = self.fetch(TimeWindow(start=self.last_seen, end=end))
+            # Time windows include both ends, so rows at the end of the previous poll are fetched again.
+            self.buffer = df[df.index > self.last_seen]
+            self.position = 0
+            self.last_seen = end
+
+        # Windows capped by `max_window` are followed right away, until the source has caught up.
+        caught_up = self.last_seen >= now - self.lag - self.poll_interval
+        self.next_poll = now + self.poll_interval if caught_up else now
+
+    def next_batch(self) -> List[DeriverInputs]:
+        if self.position >= len(self.buffer):
+            self.emitted_until = self.last_seen
+            if self.until is not None and self.last_seen >= self.until:
+                raise StopIteration
+            if datetime.now(timezone.utc) < self.next_poll:
+                return []
+            # New data is only fetched once the previous poll has been fed through the dataflow.
+            self._poll()
+
+        batch = self.buffer.iloc[self.position : self.position + self.batch_size]
+        self.position += len(batch)
+        if len(batch):
+            self.emitted_until = batch.index[-1].to_pydatetime()
+        return self.adapter.validate_python(df_to_records(batch))
+
+    def next_awake(self) -> datetime | None:
+        return None if self.position < len(self.buffer) else self.next_poll
+
+    def snapshot(self) -> datetime:
+        return self.emitted_until
+
+
+class FollowSource(FixedPartitionedSource[DeriverInputs, datetime]):
+    """
+    Source following live input data, by polling for the rows newer than the last ones it emitted.
+
+    Each poll fetches at most `max_window` of data, and the next poll only happens once the rows of the previous one
+    have all been emitted, so a source that is behind catches up one bounded window at a time. Rows at the boundary
+    between two polls, which are fetched twice, are only emitted once. Its snapshots record the timestamp of the last
+    emitted row, so that a resumed source fetches the rows after it.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[TimeWindow], DataFrame],
+        inputs: type[DeriverInputs],
+        start: datetime,
+        until: datetime | None = None,
+        poll_interval: timedelta = timedelta(seconds=10),
+        lag: timedelta = timedelta(0),
+        max_window: timedelta = timedelta(hours=1),
+        batch_size: int = 10000,
+    ):
+        self.fetch = fetch
+        self.inputs = inputs
+        self.start = start
+        self.until = until
+        self.poll_interval = poll_interval
+        self.lag = lag
+        self.max_window = max_window
+        self.batch_size = batch_size
+
+    def list_parts(self) -> List[str]:
+        return ["follow"]
+
+    def build_part(self, step_id: str, for_part: str, resume_state: datetime | None) -> _FollowSourcePartition:
+        # Rows are emitted when strictly newer than the last seen timestamp, so the start is moved back to include it.
+        last_seen = resume_state if resume_state is not None else self.start - timedelta(microseconds=1)
+        return _FollowSourcePartition(
+            self.fetch,
+            self.inputs,
+            last_seen,
+            self.until,
+            self.poll_interval,
+            self.lag,
+            self.max_window,
+            self.batch_size,
+        )
+
+
+class _CallbackSinkPartition(StatelessSinkPartition[DeriverOutputs]):
+    def __init__(self, callback: Callable[[DataFrame], None], outputs: type[DeriverOutputs], tz):
+        self.callback = callback
+        self.schema = output_schema(outputs)
+        self.tz = tz
+
+    def write_batch(self, items: List[DeriverOutputs]) -> None:
+        if items:
+            df = DataFrame(outputs_to_columns(items, self.schema, [])).set_index("timestamp")
+            self.callback(df.tz_convert(self.tz))  # type: ignore
+
+
+class CallbackSink(DynamicSink[DeriverOutputs]):
+    """Sink calling a function with each batch of deriver outputs, as a DataFrame with a timestamp index."""
+
+    def __init__(self, callback: Callable[[DataFrame], None], outputs: type[DeriverOutputs], tz=timezone.utc):
+        self.callback = callback
+        self.outputs = outputs
+        self.tz = tz
+
+    def build(self, step_id: str, worker_index: int, worker_count: int) -> _CallbackSinkPartition:
+        return _CallbackSinkPartition(self.callback, self.outputs, self.tz)
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from copy import deepcopy
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+import bytewax.operators as op
+from bytewax.dataflow import Stream, operator
+from bytewax.operators import StatefulBatchLogic
+
+from nortech.derivers.services.columnar import models_adapter
+from nortech.derivers.services.operators import key_all, unkey_all
+from nortech.derivers.values.deriver import Deriver, DeriverOutputs
+
+# Row of signal values keyed by signal path, plus its timestamp.
+Record = Dict[str, Any]
+
+
+def deriver_order(derivers: List[type[Deriver]]) -> List[type[Deriver]]:
+    """
+    Sort derivers so that each one comes after the derivers producing its inputs.
+
+    Derivers that do not depend on each other keep their given order.
+
+    Raises:
+        ValueError: If two derivers produce the same signal or the derivers depend on each other in a cycle.
+
+    """
+    producers: Dict[str, type[Deriver]] = {}
+    for deriver in derivers:
+        for _, output in deriver.Outputs.list():
+            if output.path in producers:
+                raise ValueError(
+                    f"Signal {output.path} is produced by both {producers[output.path].__name__} and {deriver.__name__}"
+                )
+            producers[output.path] = deriver
+
+    dependencies = {
+        deriver: {producers[_input.path] for _, _input in deriver.Inputs.list() if _input.path in producers}
+        for deriver in derivers
+    }
+
+    ordered: List[type[Deriver]] = []
+    while len(ordered) < len(derivers):
+        ready = [
+            deriver
+            for deriver in derivers
+            if deriver not in ordered and all(dependency in ordered for dependency in dependencies[deriver])
+        ]
+        if not ready:
+            cycle = [deriver.__name__ for deriver in derivers if deriver not in ordered]
+            raise ValueError(f"Derivers have circular dependencies: {cycle}")
+        ordered.extend(ready)
+    return ordered
+
+
+def outputs_to_records(outputs: type[DeriverOutputs]):
+    names_and_paths = [(name, output.path) for name, output in outputs.list()]
+
+    def to_records(items: List[DeriverOutputs]) -> List[Record]:
+        return [
+            {"timestamp": item.timestamp, **{path: getattr(item, name, None) for name, path in names_and_paths}}
+            for item in items
+        ]
+
+    return to_records
+
+
+class _JoinRecordsLogic(StatefulBatchLogic[Tuple[int, Record], Record, Dict[str, Any]]):
+    def __init__(self, sides: int, state: Optional[Dict[str, Any]]):
+        self.state: Dict[str, Any] = state or {"pending": {}, "latest": [None] * sides}
+
+    def on_batch(self, values: List[Tuple[int, Record]]) -> Tuple[Iterable[Record], bool]:
+        pending = self.state["pending"]
+        latest = self.state["latest"]
+        for side, record in values:
+            pending.setdefault(record["timestamp"], {}).update(record)
+            latest[side] = record["timestamp"]
+
+        # Each side is ordered by timestamp, so rows before the latest timestamp of every side are complete.
+        if None in latest:
+            return [], StatefulBatchLogic.RETAIN
+        watermark = min(latest)
+        complete = sorted(timestamp for timestamp in pending if timestamp < watermark)
+        return [pending.pop(timestamp) for timestamp in complete], StatefulBatchLogic.RETAIN
+
+    def on_eof(self) -> Tuple[Iterable[Record], bool]:
+        pending = self.state["pending"]
+        return [pending[timestamp] for timestamp in sorted(pending)], StatefulBatchLogic.DISCARD
+
+    def snapshot(self) -> Dict[str, Any]:
+        return deepcopy(self.state)
+
+
+@operator
+def join_records(step_id: str, *ups: Stream[Record]) -> Stream[Record]:
+    """
+    Join streams of records on their timestamps, into one record per timestamp with the values of every stream.
+
+    Each stream must be ordered by timestamp. A row is emitted once every stream has moved past its timestamp, or at
+    the end of the streams, so rows are emitted in timestamp order.
+    """
+    sides = [
+        op.map(f"side_{index}", up, lambda record, index=index: (index, record))  # type: ignore
+        for index, up in enumerate(ups)
+    ]
+    joined = op.stateful_batch(
+        "join",
+        key_all("key_all", op.merge("merge", *sides)),
+        lambda state: _JoinRecordsLogic(len(ups), state),
+    )
+    return unkey_all("unkey_all", joined)
+
+
+@operator
+def run_deriver(step_id: str, up: Stream[Record], deriver: Type[Deriver]) -> Stream[DeriverOutputs]:
+    """
+    Run a deriver on a stream of records keyed by signal path.
+
+    Each record is converted to the deriver inputs, and records without any of its inputs are dropped, so the deriver
+    sees the same items as when run on its own input signals. The steps of the deriver are scoped under `step_id`, so
+    derivers sharing step names can run in the same dataflow.
+    """
+    paths_and_names = [(_input.path, name) for name, _input in deriver.Inputs.list()]
+    adapter = models_adapter(deriver.Inputs)
+
+    def to_inputs(records: List[Record]) -> List[Any]:
+        inputs = []
+        for record in records:
+            values = {name: record[path] for path, name in paths_and_names if record.get(path) is not None}
+            if values:
+                inputs.append({"timestamp": record["timestamp"], **values})
+        return adapter.validate_python(inputs)
+
+    return deriver().run(op.flat_map_batch("to_inputs", up, to_inputs))
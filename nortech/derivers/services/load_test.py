@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+from bytewax.inputs import FixedPartitionedSource, StatefulSourcePartition
+from bytewax.outputs import DynamicSink, StatelessSinkPartition
+from pandas import DataFrame, DatetimeIndex
+from pydantic import BaseModel
+
+from nortech.derivers.values.deriver import DeriverInputs
+
+LATENCY_PERCENTILES = (50, 90, 99)
+
+
+def synthetic_inputs(
+    inputs: type[DeriverInputs],
+    duration: timedelta,
+    rate: float,
+    null_ratio: float = 0.0,
+    jitter: float = 0.0,
+    start: datetime = datetime(2024, 1, 1, tzinfo=timezone.utc),
+    seed: int = 0,
+) -> DataFrame:
+    """
+    Generate a DataFrame of random deriver inputs, with one column per input of the type it declares.
+
+    Rows are `1 / rate` seconds apart, each shifted by up to `jitter` times that interval, and each value is missing
+    with probability `null_ratio`. Floats follow a random walk, so that derivers see realistic consecutive values.
+    """
+    if rate <= 0:
+        raise ValueError("rate must be positive")
+    if not 0 <= null_ratio <= 1:
+        raise ValueError("null_ratio must be between 0 and 1")
+
+    rng = np.random.default_rng(seed)
+    size = int(duration.total_seconds() * rate)
+    offsets = (np.arange(size) + rng.uniform(-jitter, jitter, size)) / rate
+    index = DatetimeIndex(
+        np.datetime64(start.astimezone(timezone.utc).replace(tzinfo=None), "us")
+        + np.sort(np.round(offsets * 1e6)).astype("timedelta64[us]"),
+        tz="UTC",
+        name="timestamp",
+    )
+
+    columns: Dict[str, List[Any]] = {}
+    for name, input_type in inputs.list_types():
+        walk = rng.normal(size=size).cumsum()
+        if input_type is bool:
+            values: List[Any] = (walk > 0).tolist()
+        elif input_type is int:
+            values = np.round(walk).astype(np.int64).tolist()
+        elif input_type is str:
+            values = [["low", "medium", "high"][choice] for choice in rng.integers(0, 3, size)]
+        elif input_type is dict:
+            values = [{"value": value} for value in walk.tolist()]
+        elif input_type is list:
+            values = [[value] for value in walk.tolist()]
+        else:
+            values = walk.tolist()
+        nulls = rng.random(size) < null_ratio
+        columns[name] = [None if null else value for value, null in zip(values, nulls)]
+    return DataFrame(columns, index=index)
+
+
+class _TimedSourcePartition(StatefulSourcePartition):
+    def __init__(self, partition: StatefulSourcePartition, emitted: List[Tuple[datetime, float]]):
+        self.partition = partition
+        self.emitted = emitted
+
+    def next_batch(self) -> List[Any]:
+        batch = self.partition.next_batch()
+        if batch:
+            self.emitted.append((batch[-1].timestamp, perf_counter()))
+        return batch
+
+    def snapshot(self) -> Any:
+        return self.partition.snapshot()
+
+    def close(self) -> None:
+        self.partition.close()
+
+
+class TimedSource(FixedPartitionedSource):
+    """Source recording when each batch of inputs is emitted, by the timestamp of its last input."""
+
+    def __init__(self, source: FixedPartitionedSource):
+        self.source = source
+        self.emitted: List[Tuple[datetime, float]] = []
+
+    def list_parts(self) -> List[str]:
+        return self.source.list_parts()
+
+    def build_part(self, step_id: str, for_part: str, resume_state: Any) -> _TimedSourcePartition:
+        return _TimedSourcePartition(self.source.build_part(step_id, for_part, resume_state), self.emitted)
+
+
+class _TimedSinkPartition(StatelessSinkPartition[BaseModel]):
+    def __init__(self, received: List[Tuple[datetime, float]]):
+        self.received = received
+
+    def write_batch(self, items: List[BaseModel]) -> None:
+        now = perf_counter()
+        self.received.extend((item.timestamp, now) for item in items)  # type: ignore
+
+
+class TimedSink(DynamicSink[BaseModel]):
+    """Sink recording when each output is received, by its timestamp, and discarding it."""
+
+    def __init__(self):
+        self.received: List[Tuple[datetime, float]] = []
+
+    def build(self, step_id: str, worker_index: int, worker_count: int) -> _TimedSinkPartition:
+        return _TimedSinkPartition(self.received)
+
+
+@dataclass
+class LoadTestReport:
+    """
+    Results of a deriver load test.
+
+    Attributes:
+        items (int): The number of inputs fed to the deriver.
+        outputs (int): The number of outputs produced.
+        seconds (float): The wall time of the run.
+        latency_percentiles (dict[int, float]): Percentiles of the seconds between an input being emitted by the
+            source and the outputs with its timestamp reaching the sink, by percentile, e.g. `{50: ..., 99: ...}`.
+        peak_memory (int | None): The peak memory allocated during a second run of the deriver, in bytes, or None if
+            not measured.
+
+    """
+
+    items: int
+    outputs: int
+    seconds: float
+    latency_percentiles: Dict[int, float] = field(default_factory=dict)
+    peak_memory: int | None = None
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.seconds if self.seconds else 0.0
+
+
+def output_latencies(emitted: List[Tuple[datetime, float]], received: List[Tuple[datetime, float]]) -> np.ndarray:
+    """
+    Match each output to the batch of inputs that contains its timestamp and return the seconds in between.
+
+    Outputs timestamped after the last input are matched to the last batch.
+    """
+    if not emitted or not received:
+        return np.empty(0)
+
+    batch_ends = np.array([timestamp.timestamp() for timestamp, _ in emitted])
+    emitted_at = np.array([wall_time for _, wall_time in emitted])
+    batches = np.minimum(
+        np.searchsorted(batch_ends, [timestamp.timestamp() for timestamp, _ in received]), len(emitted) - 1
+    )
+    return np.array([wall_time for _, wall_time in received]) - emitted_at[batches]
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import ast
+import threading
 from datetime import datetime, timezone
+from functools import cached_property
+from hashlib import sha256
 from inspect import getsource
+from textwrap import dedent
 from typing import Literal
+from weakref import WeakValueDictionary
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, computed_field
 
 from nortech.derivers.values.deriver import Deriver, get_deriver_from_script
 from nortech.gateways.nortech_api import (
@@ -17,17 +23,56 @@ from nortech.metadata.values.pagination import (
 )
 from nortech.metadata.values.signal import SignalOutput
 
+# Held weakly, so that a compiled deriver is only kept while a deployed deriver or a caller references it.
+_compiled_derivers: WeakValueDictionary[str, type[Deriver]] = WeakValueDictionary()
+_compiled_derivers_lock = threading.Lock()
+
+
+def compile_deriver(definition: str) -> type[Deriver]:
+    """Compile a deriver script, reusing the class compiled earlier for the same source."""
+    source_hash = sha256(definition.encode()).hexdigest()
+    with _compiled_derivers_lock:
+        deriver = _compiled_derivers.get(source_hash)
+    if deriver is None:
+        deriver = get_deriver_from_script(definition)
+        with _compiled_derivers_lock:
+            deriver = _compiled_derivers.setdefault(source_hash, deriver)
+    return deriver
+
+
+def deriver_source_hash(definition: str) -> str:
+    """Hash a deriver script by its syntax tree, so that formatting, comments and indentation do not change it."""
+    return sha256(ast.dump(ast.parse(dedent(definition))).encode()).hexdigest()
+
 
 class DeployedDeriverList(BaseModel):
-    deriver: type[Deriver] = Field(alias="definition")
+    definition: str = Field(exclude=True, repr=False)
     description: str | None = None
     start_at: datetime | None = Field(alias="startAt")
     status: Literal["STARTING", "RUNNING", "STOPPED", "ERROR"]
 
-    @field_validator("deriver", mode="before")
-    @classmethod
-    def convert_deriver_string(cls, v: str):
-        return get_deriver_from_script(v)
+    @computed_field(alias="definition")  # type: ignore[prop-decorator]
+    @cached_property
+    def deriver(self) -> type[Deriver]:
+        """The deriver class, compiled from its definition on first access."""
+        return compile_deriver(self.definition)
+
+    @cached_property
+    def name(self) -> str | None:
+        """The name of the deriver class, parsed from its definition without compiling it."""
+        try:
+            tree = ast.parse(dedent(self.definition))
+        except SyntaxError:
+            return None
+        return next((node.name for node in tree.body if isinstance(node, ast.ClassDef)), None)
+
+    @cached_property
+    def source_hash(self) -> str | None:
+        """The hash of the definition, see `deriver_source_hash`."""
+        try:
+            return deriver_source_hash(self.definition)
+        except SyntaxError:
+            return None
 
 
 class DeployedDeriver(DeployedDeriverList):
@@ -1,24 +1,41 @@
 from __future__ import annotations
 
+import warnings
+from bisect import bisect_right
+from collections import deque
 from collections.abc import Iterable
+from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from operator import attrgetter
 from typing import (
     Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Literal,
+    Optional,
     Protocol,
     Sequence,
     Tuple,
     Type,
     TypeVar,
+    Union,
 )
 
 import bytewax.operators as op
+import numpy as np
 import pandas as pd
 from bytewax.dataflow import Stream, operator
-from bytewax.operators.windowing import EventClock, TumblingWindower, collect_window
-from pandas import DataFrame
+from bytewax.operators import StatefulBatchLogic, StatefulLogic
+from bytewax.operators.windowing import EventClock, TumblingWindower, collect_window, fold_window
+from pandas import DataFrame, DatetimeIndex
 from pydantic import BaseModel
 
+from nortech.datatools.services.units import unit_conversion
+from nortech.derivers.services.columnar import models_adapter
 from nortech.derivers.values.deriver import DeriverInputs, InputType
 
 FilteredInputType = TypeVar("FilteredInputType", bound=DeriverInputs)
@@ -36,34 +53,58 @@ def unkey_all(step_id: str, up: op.KeyedStream[T]) -> Stream[T]:
     return op.map(step_id="map", up=up, mapper=lambda item: item[1])
 
 
+@lru_cache(maxsize=None)
+def field_names(model: type[BaseModel]) -> Tuple[str, ...]:
+    """Return the timestamp and the declared fields of a model, in order."""
+    return ("timestamp", *(name for name in model.model_fields if name != "timestamp"))
+
+
+@lru_cache(maxsize=None)
+def fields_getter(model: type[BaseModel]) -> Callable[[BaseModel], Tuple[Any, ...]]:
+    """Return a function reading the values of `field_names(model)` from an item as a tuple."""
+    return attrgetter(*field_names(model))  # type: ignore
+
+
 @operator
 def filter_none(
     step_id: str, up: Stream[InputType], filtered_type: Type[FilteredInputType]
 ) -> Stream[FilteredInputType]:
-    def filter_none_mapper(
-        item: InputType,
-    ) -> FilteredInputType | None:
-        model_dict = item.model_dump()
+    adapter = models_adapter(filtered_type)
 
-        if not all(value is not None for value in model_dict.values()):
-            return None
-        return filtered_type(**model_dict)
+    def filter_none_batch_mapper(items: List[InputType]) -> List[FilteredInputType]:
+        # The kept items are validated from their attributes, without building a dict for each of them.
+        kept = [item for item in items if None not in fields_getter(type(item))(item)]
+        return adapter.validate_python(kept, from_attributes=True)
 
-    return op.filter_map(step_id="filter", up=up, mapper=filter_none_mapper)
+    return op.flat_map_batch(step_id="filter", up=up, mapper=filter_none_batch_mapper)
 
 
 @operator
 def ffill(step_id: str, up: Stream[InputType]) -> Stream[InputType]:
-    def ffill_mapper(state: dict[str, Any] | None, item: InputType):
+    def ffill_mapper(state: Dict[str, Any] | None, item: InputType) -> Tuple[Dict[str, Any], InputType]:
         if state is None:
             state = {}
 
-        for key, value in item.model_dump().items():
-            if value is not None:
-                state[key] = value
-
-        for key, value in state.items():
-            setattr(item, key, value)
+        # The state keeps the format of earlier versions, the latest value of each field by name, so that existing
+        # recovery snapshots can be resumed.
+        model = type(item)
+        extra = item.__pydantic_extra__ or {}
+        filled = 0
+        for values in (zip(field_names(model), fields_getter(model)(item)), extra.items()):
+            for name, value in values:
+                if value is not None:
+                    state[name] = value
+                elif name in state:
+                    setattr(item, name, state[name])
+                else:
+                    continue
+                filled += 1
+
+        # Values seen in earlier items for extra fields that this item does not have are added to it.
+        if filled < len(state):
+            for name, value in state.items():
+                if name not in model.model_fields and name not in extra:
+                    setattr(item, name, value)
 
         return state, item
 
@@ -84,16 +125,218 @@ class ResampleFunction(Protocol):
 
 @dataclass
 class Resampler:
+    """
+    Functions resampling the data of a `resample` window to its frequency.
+
+    `upsample_function` is deprecated and ignored: `resample` windows always hold data denser than their frequency, and
+    sparse data is upsampled by the `interpolate` operator, with an `interpolator` method, instead.
+    """
+
     downsample_function: ResampleFunction
-    upsample_function: ResampleFunction
+    upsample_function: ResampleFunction | None = None
+
+    def __post_init__(self):
+        if self.upsample_function is not None:
+            warnings.warn(
+                "Resampler.upsample_function is ignored, upsample with the interpolate operator instead.",
+                DeprecationWarning,
+                stacklevel=3,
+            )
 
 
 def smart_resample(df: DataFrame, frequency: timedelta, resampler: Resampler) -> DataFrame:
+    # `resample` calls this on tumbling windows of `frequency`, which always hold data denser than the target grid.
+    # Sparse data is upsampled by the `interpolate` operator instead.
     return resampler.downsample_function(df, frequency)
 
 
+InterpolationMethod = Literal["linear", "previous", "nearest"]
+
+EPOCH = datetime(year=1970, month=1, day=1, tzinfo=timezone.utc)
+GRID_ALIGN_TO = datetime(year=2022, month=1, day=1, tzinfo=timezone.utc)
+
+
+def to_microseconds(timestamp: datetime) -> int:
+    return (timestamp - EPOCH) // timedelta(microseconds=1)
+
+
+def grid_start(timestamp: int, frequency: int) -> int:
+    """Return the first grid point at or after a timestamp, in microseconds, for a grid aligned like `resample`."""
+    align_to = to_microseconds(GRID_ALIGN_TO)
+    return align_to - ((align_to - timestamp) // frequency) * frequency
+
+
+def interpolate_values(
+    sample_times: np.ndarray, sample_values: Sequence[Any], grid: np.ndarray, method: InterpolationMethod
+) -> np.ndarray:
+    """
+    Interpolate samples onto grid points, both given as sorted microsecond timestamps.
+
+    Returns an object array with None where there is no value: before the first sample, and after the last one for
+    linear interpolation. Non numeric values are interpolated with the previous value for the linear method.
+    """
+    size = len(sample_values)
+    values = np.empty(size + 1, dtype=object)
+    values[:size] = sample_values
+    values[size] = None
+    previous = np.searchsorted(sample_times, grid, side="right") - 1
+
+    numeric = all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in sample_values)
+    if method == "linear" and numeric and size:
+        result = np.interp(grid, sample_times, np.asarray(sample_values, dtype=np.float64)).astype(object)
+        result[(grid < sample_times[0]) | (grid > sample_times[-1])] = None
+        return result
+
+    if method == "nearest":
+        following = np.minimum(previous + 1, size)
+        distance_to_previous = grid - sample_times[np.maximum(previous, 0)] if size else grid
+        distance_to_following = sample_times[np.minimum(following, size - 1)] - grid if size else grid
+        use_following = (following < size) & ((previous < 0) | (distance_to_following < distance_to_previous))
+        return values[np.where(use_following, following, np.where(previous < 0, size, previous))]
+
+    return values[np.where(previous < 0, size, previous)]
+
+
+def interpolator(method: InterpolationMethod) -> ResampleFunction:
+    """Return a function interpolating every column of a DataFrame onto a grid aligned like `resample`."""
+
+    def upsample(df: DataFrame, frequency: timedelta) -> DataFrame:
+        times = (df.index - EPOCH) // timedelta(microseconds=1)
+        times = np.asarray(times, dtype=np.int64)
+        step = frequency // timedelta(microseconds=1)
+        grid = np.arange(grid_start(int(times[0]), step), times[-1] + 1, step) if len(times) else times[:0]
+
+        columns = {}
+        for name, column in df.items():
+            present = column.notna().to_numpy()
+            columns[name] = interpolate_values(times[present], column[present].tolist(), grid, method)
+
+        index = DatetimeIndex(pd.to_datetime(grid, unit="us", utc=True), name=df.index.name).tz_convert(df.index.tz)
+        return DataFrame(columns, index=index).infer_objects()
+
+    return upsample
+
+
+class _InterpolateLogic(StatefulBatchLogic[BaseModel, BaseModel, Dict[str, Any]]):
+    """
+    Interpolates the fields of a stream onto a grid.
+
+    Each field keeps its samples from the last one before the next grid point on. A grid point is emitted once the
+    value of every field is known: right away for the previous method, once a later sample of the field arrives or
+    the lookahead elapses for the linear method, and once no later sample could be nearer for the nearest method.
+    """
+
+    def __init__(
+        self, frequency: int, method: InterpolationMethod, lookahead: int | None, state: Dict[str, Any] | None
+    ):
+        self.frequency = frequency
+        self.method = method
+        self.lookahead = lookahead
+        self.state: Dict[str, Any] = state or {"model": None, "samples": {}, "next_grid": None, "latest": None}
+
+    def on_batch(self, values: List[BaseModel]) -> Tuple[Iterable[BaseModel], bool]:
+        state = self.state
+        if state["model"] is None:
+            state["model"] = type(values[0])
+            state["samples"] = {name: ([], []) for name in state["model"].model_fields if name != "timestamp"}
+
+        samples = state["samples"]
+        for item in values:
+            timestamp = to_microseconds(item.timestamp)  # type: ignore
+            if state["next_grid"] is None:
+                state["next_grid"] = grid_start(timestamp, self.frequency)
+            state["latest"] = timestamp
+            for name, (times, field_values) in samples.items():
+                value = getattr(item, name)
+                if value is not None:
+                    times.append(timestamp)
+                    field_values.append(value)
+
+        return self._emit(self._resolved_until()), StatefulBatchLogic.RETAIN
+
+    def on_eof(self) -> Tuple[Iterable[BaseModel], bool]:
+        if self.state["latest"] is None:
+            return [], StatefulBatchLogic.DISCARD
+        return self._emit(self.state["latest"]), StatefulBatchLogic.DISCARD
+
+    def snapshot(self) -> Dict[str, Any]:
+        return deepcopy(self.state)
+
+    def _resolved_until(self) -> int:
+        latest = self.state["latest"]
+        if self.method == "previous":
+            return latest
+
+        resolved_until = latest
+        for times, _ in self.state["samples"].values():
+            if not times:
+                field_resolved_until = -(2**63)
+            elif self.method == "linear":
+                field_resolved_until = times[-1]
+            else:
+                field_resolved_until = (latest + times[-1]) // 2
+            if self.lookahead is not None:
+                field_resolved_until = max(field_resolved_until, latest - self.lookahead)
+            resolved_until = min(resolved_until, field_resolved_until)
+        return resolved_until
+
+    def _emit(self, until: int) -> List[BaseModel]:
+        state = self.state
+        if state["next_grid"] > until:
+            return []
+
+        grid = np.arange(state["next_grid"], until + 1, self.frequency, dtype=np.int64)
+        state["next_grid"] = int(grid[-1]) + self.frequency
+
+        columns: Dict[str, List[Any]] = {"timestamp": list(pd.to_datetime(grid, unit="us", utc=True).to_pydatetime())}
+        for name, (times, values) in state["samples"].items():
+            columns[name] = interpolate_values(np.asarray(times, dtype=np.int64), values, grid, self.method).tolist()
+
+            # Only the last sample before the next grid point is still needed.
+            keep_from = max(bisect_right(times, state["next_grid"]) - 1, 0)
+            del times[:keep_from]
+            del values[:keep_from]
+
+        records = [dict(zip(columns, row)) for row in zip(*columns.values())]
+        return models_adapter(state["model"]).validate_python(records)
+
+
+@operator
+def interpolate(
+    step_id: str,
+    up: Stream[InputType],
+    frequency: timedelta,
+    method: InterpolationMethod = "linear",
+    lookahead: Optional[timedelta] = None,
+) -> Stream[InputType]:
+    """
+    Upsample a stream onto a regular grid of `frequency`, aligned like `resample`, interpolating each field.
+
+    `method` is "linear", "previous" or "nearest". Grid points are emitted in bulk as soon as their values are known,
+    which for linear interpolation means once the next sample of every field has arrived. If `lookahead` is set, grid
+    points older than `lookahead` before the latest item are emitted anyway, with None for the fields that could not
+    be interpolated.
+    """
+    frequency_us = frequency // timedelta(microseconds=1)
+    lookahead_us = lookahead // timedelta(microseconds=1) if lookahead is not None else None
+
+    interpolated_stream = op.stateful_batch(
+        step_id="interpolate",
+        up=key_all(step_id="key_all", up=up),
+        builder=lambda state: _InterpolateLogic(frequency_us, method, lookahead_us, state),
+    )
+
+    return unkey_all(step_id="unkey_all", up=interpolated_stream)
+
+
 @operator
 def resample(step_id: str, up: Stream[InputType], frequency: timedelta, resampler: Resampler):
+    """
+    Resample a stream on tumbling windows of `frequency`, with the `downsample_function` of `resampler`.
+
+    Windows are aligned like `incremental_resample`. Sparse data is not upsampled, use `interpolate` for that.
+    """
+
     def ts_getter(item: InputType) -> datetime:
         return item.timestamp
 
@@ -161,6 +404,425 @@ def resample(step_id: str, up: Stream[InputType], frequency: timedelta, resample
     return resampled_stream
 
 
+def event_time_clock() -> EventClock:
+    # With a constant system time, the watermark only follows the item timestamps, so that no item of a time ordered
+    # replay is deemed late because processing it took time.
+    return EventClock(
+        ts_getter=lambda item: item.timestamp,
+        wait_for_system_duration=timedelta(seconds=0),
+        now_getter=lambda: datetime(year=2022, month=1, day=1, tzinfo=timezone.utc),
+    )
+
+
+Aggregation = Literal["mean", "sum", "min", "max", "first", "last", "count"]
+
+
+class _ResampleAccumulator:
+    """Running aggregations of the fields of the items in a window."""
+
+    __slots__ = (
+        "model",
+        "fields",
+        "counts",
+        "totals",
+        "minimums",
+        "maximums",
+        "firsts",
+        "lasts",
+        "first_ts",
+        "last_ts",
+    )
+
+    def __init__(self):
+        self.model: type[BaseModel] | None = None
+
+    def _start(self, item: BaseModel, aggregation: Union[Aggregation, Dict[str, Aggregation]]):
+        self.model = type(item)
+        self.fields: List[Tuple[str, Aggregation]] = (
+            [(name, aggregation) for name in self.model.model_fields if name != "timestamp"]
+            if isinstance(aggregation, str)
+            else list(aggregation.items())
+        )
+        size = len(self.fields)
+        self.counts: List[int] = [0] * size
+        self.totals: List[Any] = [0] * size
+        self.minimums: List[Any] = [None] * size
+        self.maximums: List[Any] = [None] * size
+        self.firsts: List[Any] = [None] * size
+        self.lasts: List[Any] = [None] * size
+        self.first_ts: List[datetime | None] = [None] * size
+        self.last_ts: List[datetime | None] = [None] * size
+
+    def add(self, item: BaseModel, aggregation: Union[Aggregation, Dict[str, Aggregation]]) -> _ResampleAccumulator:
+        if self.model is None:
+            self._start(item, aggregation)
+
+        timestamp = item.timestamp  # type: ignore
+        for index, (name, field_aggregation) in enumerate(self.fields):
+            value = getattr(item, name)
+            if value is None:
+                continue
+
+            self.counts[index] += 1
+            if field_aggregation in ("mean", "sum"):
+                self.totals[index] += value
+            elif field_aggregation == "min":
+                if self.minimums[index] is None or value < self.minimums[index]:
+                    self.minimums[index] = value
+            elif field_aggregation == "max":
+                if self.maximums[index] is None or value > self.maximums[index]:
+                    self.maximums[index] = value
+            elif field_aggregation == "first":
+                if self.first_ts[index] is None or timestamp < self.first_ts[index]:
+                    self.firsts[index], self.first_ts[index] = value, timestamp
+            elif field_aggregation == "last":
+                if self.last_ts[index] is None or timestamp >= self.last_ts[index]:
+                    self.lasts[index], self.last_ts[index] = value, timestamp
+        return self
+
+    def result(self, timestamp: datetime) -> BaseModel:
+        # Fields without an aggregation are set to None rather than left out, as models may declare them without default.
+        values: Dict[str, Any] = dict.fromkeys(self.model.model_fields)  # type: ignore
+        values["timestamp"] = timestamp
+        for index, (name, field_aggregation) in enumerate(self.fields):
+            count = self.counts[index]
+            if field_aggregation == "count":
+                values[name] = count
+            elif count == 0:
+                values[name] = None
+            elif field_aggregation == "mean":
+                values[name] = self.totals[index] / count
+            elif field_aggregation == "sum":
+                values[name] = self.totals[index]
+            elif field_aggregation == "min":
+                values[name] = self.minimums[index]
+            elif field_aggregation == "max":
+                values[name] = self.maximums[index]
+            elif field_aggregation == "first":
+                values[name] = self.firsts[index]
+            else:
+                values[name] = self.lasts[index]
+        return self.model(**values)  # type: ignore
+
+
+@operator
+def incremental_resample(
+    step_id: str,
+    up: Stream[InputType],
+    frequency: timedelta,
+    aggregation: Union[Aggregation, Dict[str, Aggregation]] = "mean",
+) -> Stream[InputType]:
+    """
+    Resample into tumbling windows like `resample`, keeping running aggregations instead of buffering the items.
+
+    `aggregation` is one of "mean", "sum", "min", "max", "first", "last" or "count", for every field or per field name
+    (fields missing from the dict are set to None, so they must be optional). Each window is emitted when it closes, timestamped at its start.
+    Windows without items are not emitted and `None` values are skipped.
+    """
+    align_to = datetime(year=2022, month=1, day=1, tzinfo=timezone.utc)
+
+    windows = fold_window(
+        step_id="fold_window",
+        up=key_all(step_id="key_all", up=up),
+        clock=event_time_clock(),
+        windower=TumblingWindower(length=frequency, align_to=align_to),
+        builder=_ResampleAccumulator,
+        folder=lambda accumulator, item: accumulator.add(item, aggregation),
+        merger=lambda accumulator, _: accumulator,
+        ordered=False,
+    )
+
+    return op.map(
+        step_id="window_result",
+        up=unkey_all(step_id="unkey_all", up=windows.down),
+        mapper=lambda window: window[1].result(align_to + window[0] * frequency),
+    )
+
+
+class _FieldWindow:
+    """
+    Incremental aggregation of a field over a sliding window.
+
+    Sums are kept as running totals and minimums and maximums as monotonic deques, so that adding or evicting a value
+    takes amortized constant time.
+    """
+
+    __slots__ = ("aggregation", "samples", "total", "extremes")
+
+    def __init__(self, aggregation: Aggregation):
+        self.aggregation = aggregation
+        self.samples: Deque[Tuple[int, Any]] = deque()
+        self.total: Any = 0
+        self.extremes: Deque[Tuple[int, Any]] = deque()
+
+    def add(self, timestamp: int, value: Any) -> None:
+        self.samples.append((timestamp, value))
+        if self.aggregation in ("mean", "sum"):
+            self.total += value
+        elif self.aggregation == "min":
+            while self.extremes and self.extremes[-1][1] >= value:
+                self.extremes.pop()
+            self.extremes.append((timestamp, value))
+        elif self.aggregation == "max":
+            while self.extremes and self.extremes[-1][1] <= value:
+                self.extremes.pop()
+            self.extremes.append((timestamp, value))
+
+    def evict(self, start: int) -> None:
+        samples = self.samples
+        while samples and samples[0][0] < start:
+            _, value = samples.popleft()
+            if self.aggregation in ("mean", "sum"):
+                self.total -= value
+        extremes = self.extremes
+        while extremes and extremes[0][0] < start:
+            extremes.popleft()
+
+    def result(self) -> Any:
+        if self.aggregation == "count":
+            return len(self.samples)
+        if not self.samples:
+            return None
+        if self.aggregation == "mean":
+            return self.total / len(self.samples)
+        if self.aggregation == "sum":
+            return self.total
+        if self.aggregation in ("min", "max"):
+            return self.extremes[0][1]
+        if self.aggregation == "first":
+            return self.samples[0][1]
+        return self.samples[-1][1]
+
+
+class _SlidingWindowLogic(StatefulLogic[BaseModel, BaseModel, Dict[str, Any]]):
+    def __init__(
+        self,
+        length: int,
+        hop: int,
+        aggregation: Union[Aggregation, Dict[str, Aggregation]],
+        state: Dict[str, Any] | None,
+    ):
+        self.length = length
+        self.hop = hop
+        self.aggregation = aggregation
+        self.state: Dict[str, Any] = state or {"model": None, "fields": {}, "next_end": None, "size": 0}
+
+    def on_item(self, value: BaseModel) -> Tuple[Iterable[BaseModel], bool]:
+        state = self.state
+        if state["model"] is None:
+            state["model"] = type(value)
+            state["fields"] = {
+                name: _FieldWindow(field_aggregation)
+                for name, field_aggregation in (
+                    [(name, self.aggregation) for name in state["model"].model_fields if name != "timestamp"]
+                    if isinstance(self.aggregation, str)
+                    else self.aggregation.items()
+                )
+            }
+
+        timestamp = to_microseconds(value.timestamp)  # type: ignore
+        if state["next_end"] is None:
+            state["next_end"] = grid_start(timestamp + 1, self.hop)
+        windows = self._emit_until(timestamp)
+
+        state["size"] += 1
+        for name, field_window in state["fields"].items():
+            field_value = getattr(value, name)
+            if field_value is not None:
+                field_window.add(timestamp, field_value)
+        return windows, StatefulLogic.RETAIN
+
+    def on_eof(self) -> Tuple[Iterable[BaseModel], bool]:
+        return self._emit_until(None), StatefulLogic.DISCARD
+
+    def snapshot(self) -> Dict[str, Any]:
+        return deepcopy(self.state)
+
+    def _emit_until(self, timestamp: int | None) -> List[BaseModel]:
+        # Emits the windows ending at or before the timestamp, or all windows with items if it is None.
+        state = self.state
+        windows: List[BaseModel] = []
+        while state["size"] and (timestamp is None or state["next_end"] <= timestamp):
+            start = state["next_end"] - self.length
+            for field_window in state["fields"].values():
+                field_window.evict(start)
+            state["size"] = max((len(field_window.samples) for field_window in state["fields"].values()), default=0)
+            if not state["size"]:
+                break
+
+            # Fields without an aggregation are set to None, like in `incremental_resample`.
+            values: Dict[str, Any] = dict.fromkeys(state["model"].model_fields)
+            values.update((name, field_window.result()) for name, field_window in state["fields"].items())
+            values["timestamp"] = EPOCH + timedelta(microseconds=state["next_end"])
+            windows.append(state["model"](**values))
+            state["next_end"] += self.hop
+
+        if timestamp is not None and state["next_end"] <= timestamp:
+            # Skip the windows of a gap without items.
+            state["next_end"] = grid_start(timestamp + 1, self.hop)
+        return windows
+
+
+@operator
+def sliding_window(
+    step_id: str,
+    up: Stream[InputType],
+    length: timedelta,
+    hop: timedelta,
+    aggregation: Union[Aggregation, Dict[str, Aggregation]] = "mean",
+    key: Optional[Callable[[InputType], str]] = None,
+) -> Stream[Any]:
+    """
+    Aggregate the items of the last `length` every `hop`, e.g. a 5 minute rolling mean every 10 seconds.
+
+    Windows end on a grid of `hop` aligned like `resample`, include their start and exclude their end, and are emitted
+    timestamped at their end once an item at or after their end arrives, or at the end of the stream. Windows without
+    items are not emitted and `None` values are skipped. `aggregation` is as in `incremental_resample`, with means and
+    sums kept as running totals and minimums and maximums as monotonic deques instead of aggregating every window
+    again. If `key` is set, the items of each key are aggregated separately and the windows are emitted as
+    `(key, window)` pairs, like a keyed stream.
+    """
+    length_us = length // timedelta(microseconds=1)
+    hop_us = hop // timedelta(microseconds=1)
+
+    keyed_stream = key_all(step_id="key_all", up=up) if key is None else op.key_on("key_on", up, key)
+    windows_stream = op.stateful(
+        step_id="sliding_window",
+        up=keyed_stream,
+        builder=lambda state: _SlidingWindowLogic(length_us, hop_us, aggregation, state),
+    )
+
+    if key is not None:
+        return windows_stream
+    return unkey_all(step_id="unkey_all", up=windows_stream)
+
+
+class _AlignLogic(StatefulBatchLogic[BaseModel, BaseModel, Dict[str, Any]]):
+    def __init__(
+        self,
+        aligned_type: type[BaseModel],
+        trigger: Union[str, timedelta],
+        state: Dict[str, Any] | None,
+    ):
+        self.adapter = models_adapter(aligned_type)
+        self.fields = [name for name in aligned_type.model_fields if name != "timestamp"]
+        self.get_values = (
+            attrgetter(*self.fields) if len(self.fields) > 1 else lambda item: (getattr(item, self.fields[0]),)
+        )
+        self.trigger = trigger
+        self.grid = trigger // timedelta(microseconds=1) if isinstance(trigger, timedelta) else None
+        self.state: Dict[str, Any] = state or {"values": [None] * len(self.fields), "next_grid": None, "latest": None}
+
+    def on_batch(self, values: List[BaseModel]) -> Tuple[Iterable[BaseModel], bool]:
+        state = self.state
+        get_values = self.get_values
+        keys = ["timestamp", *self.fields]
+        primary = None if self.grid is not None or self.trigger == "any" else self.trigger
+        records: List[Dict[str, Any]] = []
+
+        for item in values:
+            if self.grid is not None:
+                self._emit_grid_until(to_microseconds(item.timestamp), records)  # type: ignore
+
+            state["values"] = latest_values = [
+                latest if value is None else value for value, latest in zip(get_values(item), state["values"])
+            ]
+
+            if self.grid is None and (primary is None or getattr(item, primary) is not None):
+                if None not in latest_values:
+                    records.append(dict(zip(keys, [item.timestamp, *latest_values])))  # type: ignore
+
+        return self.adapter.validate_python(records), StatefulBatchLogic.RETAIN
+
+    def on_eof(self) -> Tuple[Iterable[BaseModel], bool]:
+        records: List[Dict[str, Any]] = []
+        if self.grid is not None and self.state["latest"] is not None:
+            self._emit_grid_until(self.state["latest"] + 1, records)
+        return self.adapter.validate_python(records), StatefulBatchLogic.DISCARD
+
+    def snapshot(self) -> Dict[str, Any]:
+        return deepcopy(self.state)
+
+    def _emit_grid_until(self, timestamp: int, records: List[Dict[str, Any]]) -> None:
+        # Grid points before the timestamp have seen all the values at or before them.
+        state = self.state
+        state["latest"] = timestamp
+        if state["next_grid"] is None:
+            state["next_grid"] = grid_start(timestamp, self.grid)  # type: ignore
+        if state["next_grid"] >= timestamp:
+            return
+
+        if None in state["values"]:
+            state["next_grid"] = grid_start(timestamp, self.grid)  # type: ignore
+            return
+
+        values = dict(zip(self.fields, state["values"]))
+        while state["next_grid"] < timestamp:
+            records.append({"timestamp": EPOCH + timedelta(microseconds=state["next_grid"]), **values})
+            state["next_grid"] += self.grid
+
+
+@operator
+def align(
+    step_id: str,
+    up: Stream[InputType],
+    aligned_type: Type[FilteredInputType],
+    trigger: Union[str, timedelta] = "any",
+) -> Stream[FilteredInputType]:
+    """
+    Join the fields of a stream as of each emitted row, replacing `ffill` followed by `filter_none`.
+
+    Only the latest value of each field of `aligned_type` is kept, and rows are emitted once every field has a value.
+    `trigger` decides when: "any" on every item, a field name on every item with a value for that field, and a
+    timedelta on a grid of that frequency aligned like `resample`, with the latest values at or before each grid point.
+    """
+    aligned_stream = op.stateful_batch(
+        step_id="align",
+        up=key_all(step_id="key_all", up=up),
+        builder=lambda state: _AlignLogic(aligned_type, trigger, state),
+    )
+
+    return unkey_all(step_id="unkey_all", up=aligned_stream)
+
+
+@operator
+def convert_units(
+    step_id: str, up: Stream[InputType], converted_type: Type[InputType], units: Dict[str, Tuple[str, str]]
+) -> Stream[InputType]:
+    """
+    Convert fields between physical units, given as `{field: (from_unit, to_unit)}`, e.g. `("degC", "degF")`.
+
+    The factor and offset of each conversion are computed once, and applied to the values of a batch as an array.
+    Converted items are copies, so other steps reading `up` keep the original values. Missing values are left as None.
+
+    Raises:
+        ValueError: If a field is not a float field of `converted_type`, or its units cannot be converted.
+
+    """
+    for name in units:
+        field = converted_type.model_fields.get(name)
+        if field is None or field.annotation not in (float, Optional[float]):
+            raise ValueError(f"Field '{name}' of {converted_type.__name__} is not a float field.")
+    conversions = {name: unit_conversion(from_unit, to_unit) for name, (from_unit, to_unit) in units.items()}
+
+    def convert_units_batch_mapper(items: List[InputType]) -> List[InputType]:
+        columns = []
+        for name, (factor, offset) in conversions.items():
+            values = np.array([getattr(item, name) for item in items], dtype=float)
+            columns.append(
+                [
+                    None if missing else value
+                    for value, missing in zip((values * factor + offset).tolist(), np.isnan(values).tolist())
+                ]
+            )
+        return [
+            item.model_copy(update={name: value for name, value in zip(conversions, row) if value is not None})
+            for item, *row in zip(items, *columns)
+        ]
+
+    return op.flat_map_batch(step_id="convert_units", up=up, mapper=convert_units_batch_mapper)
+
+
 @operator
 def list_to_dataframe(step_id: str, up: Stream[Sequence[BaseModel]]) -> Stream[DataFrame]:
     def list_to_df_mapper(items: Sequence[BaseModel]) -> DataFrame:
@@ -175,5 +837,11 @@ __all__ = [
     "filter_none",
     "ffill",
     "resample",
+    "incremental_resample",
+    "interpolate",
+    "interpolator",
+    "sliding_window",
+    "align",
+    "convert_units",
     "list_to_dataframe",
 ]
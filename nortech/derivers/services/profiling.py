@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Callable, Iterable, List, Optional, Set, Tuple
+
+from bytewax.dataflow import Dataflow, Operator
+from bytewax.inputs import FixedPartitionedSource, StatefulSourcePartition
+from bytewax.operators import StatefulBatchLogic
+from bytewax.outputs import DynamicSink, StatelessSinkPartition
+from pandas import DataFrame
+
+
+@dataclass
+class StepProfile:
+    """
+    Time spent in a dataflow step and the number of items it processed.
+
+    Attributes:
+        step_id (str): The id of the step, e.g. "map_output".
+        items_in (int): The number of items received by the step.
+        items_out (int): The number of items emitted by the step.
+        seconds (float): The wall time spent in the step functions.
+
+    """
+
+    step_id: str
+    items_in: int = 0
+    items_out: int = 0
+    seconds: float = 0.0
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items_in / self.seconds if self.seconds else 0.0
+
+
+@dataclass
+class DeriverProfile:
+    """
+    Profile of a local deriver run.
+
+    Attributes:
+        steps (list[StepProfile]): The profile of each step of the deriver, in dataflow order.
+        input_conversion_seconds (float): The wall time spent converting input rows to deriver inputs.
+        output_conversion_seconds (float): The wall time spent collecting deriver outputs into the output DataFrame.
+        total_seconds (float): The wall time of the whole run.
+
+    """
+
+    steps: List[StepProfile] = field(default_factory=list)
+    input_conversion_seconds: float = 0.0
+    output_conversion_seconds: float = 0.0
+    total_seconds: float = 0.0
+
+    def to_df(self) -> DataFrame:
+        """Return one row per step, with its items, seconds and items/sec."""
+        return DataFrame(
+            [
+                {
+                    "step_id": step.step_id,
+                    "items_in": step.items_in,
+                    "items_out": step.items_out,
+                    "seconds": step.seconds,
+                    "items_per_second": step.items_per_second,
+                }
+                for step in self.steps
+            ]
+        ).set_index("step_id")
+
+
+@dataclass
+class _CoreProfile:
+    up: Set[str]
+    down: Set[str]
+    items_in: int = 0
+    items_out: int = 0
+    seconds: float = 0.0
+
+    def record(self, start: float, items_in: int, items_out: int) -> None:
+        self.seconds += perf_counter() - start
+        self.items_in += items_in
+        self.items_out += items_out
+
+
+class _ProfiledLogic(StatefulBatchLogic):
+    def __init__(self, logic: StatefulBatchLogic, profile: _CoreProfile):
+        self.logic = logic
+        self.profile = profile
+
+    def _timed(self, method: Callable[[], Tuple[Iterable[Any], bool]], items_in: int) -> Tuple[List[Any], bool]:
+        start = perf_counter()
+        items, discard = method()
+        items = list(items)
+        self.profile.record(start, items_in, len(items))
+        return items, discard
+
+    def on_batch(self, values: List[Any]) -> Tuple[List[Any], bool]:
+        return self._timed(lambda: self.logic.on_batch(values), len(values))
+
+    def on_notify(self) -> Tuple[List[Any], bool]:
+        return self._timed(self.logic.on_notify, 0)
+
+    def on_eof(self) -> Tuple[List[Any], bool]:
+        return self._timed(self.logic.on_eof, 0)
+
+    def notify_at(self):
+        return self.logic.notify_at()
+
+    def snapshot(self) -> Any:
+        return self.logic.snapshot()
+
+
+class _ProfiledSourcePartition(StatefulSourcePartition):
+    def __init__(self, partition: StatefulSourcePartition, profile: _CoreProfile):
+        self.partition = partition
+        self.profile = profile
+
+    def next_batch(self) -> List[Any]:
+        start = perf_counter()
+        batch = self.partition.next_batch()
+        self.profile.record(start, 0, len(batch))
+        return batch
+
+    def next_awake(self):
+        return self.partition.next_awake()
+
+    def snapshot(self) -> Any:
+        return self.partition.snapshot()
+
+    def close(self) -> None:
+        self.partition.close()
+
+
+class _ProfiledSource(FixedPartitionedSource):
+    def __init__(self, source: FixedPartitionedSource, profile: _CoreProfile):
+        self.source = source
+        self.profile = profile
+
+    def list_parts(self) -> List[str]:
+        return self.source.list_parts()
+
+    def build_part(self, step_id: str, for_part: str, resume_state: Any) -> _ProfiledSourcePartition:
+        return _ProfiledSourcePartition(self.source.build_part(step_id, for_part, resume_state), self.profile)
+
+
+class _ProfiledSinkPartition(StatelessSinkPartition):
+    def __init__(self, partition: StatelessSinkPartition, profile: _CoreProfile):
+        self.partition = partition
+        self.profile = profile
+
+    def write_batch(self, items: List[Any]) -> None:
+        start = perf_counter()
+        self.partition.write_batch(items)
+        self.profile.record(start, len(items), 0)
+
+    def close(self) -> None:
+        self.partition.close()
+
+
+class _ProfiledSink(DynamicSink):
+    def __init__(self, sink: DynamicSink, profile: _CoreProfile):
+        self.sink = sink
+        self.profile = profile
+
+    def build(self, step_id: str, worker_index: int, worker_count: int) -> _ProfiledSinkPartition:
+        return _ProfiledSinkPartition(self.sink.build(step_id, worker_index, worker_count), self.profile)
+
+
+def _stream_ids(step: Operator, names: List[str]) -> Set[str]:
+    return {stream_id for name in names for stream_id in getattr(step, name).stream_ids.values()}
+
+
+def _core_steps(step: Operator) -> Iterable[Operator]:
+    if not step.substeps:
+        yield step
+    for substep in step.substeps:
+        yield from _core_steps(substep)
+
+
+class DataflowProfiler:
+    """
+    Instruments the steps of a dataflow to time them and count their items.
+
+    The functions, logics, source and sink of the core operators under each top level step of the dataflow are
+    wrapped, so the time of a step is the time spent in its Python code, excluding the scheduling between steps.
+    Core operators without Python code, e.g. `merge`, are not timed.
+    """
+
+    def __init__(self, flow: Dataflow):
+        self.steps: List[Tuple[Operator, List[_CoreProfile]]] = []
+        self.input_profiles: List[_CoreProfile] = []
+        self.output_profiles: List[_CoreProfile] = []
+        for step in flow.substeps:
+            profiles = [profile for core in _core_steps(step) if (profile := self._instrument(core)) is not None]
+            if type(step).__name__ == "input":
+                self.input_profiles.extend(profiles)
+            elif type(step).__name__ == "output":
+                self.output_profiles.extend(profiles)
+            elif profiles:
+                self.steps.append((step, profiles))
+
+    @staticmethod
+    def _instrument(core: Operator) -> Optional[_CoreProfile]:
+        profile = _CoreProfile(up=_stream_ids(core, core.ups_names), down=_stream_ids(core, core.dwn_names))
+        # Core operators are frozen dataclasses named after their operator, which are only read when the dataflow is run.
+        if type(core).__name__ == "flat_map_batch":
+            mapper = core.mapper
+
+            def profiled_mapper(batch: List[Any]) -> List[Any]:
+                start = perf_counter()
+                items = list(mapper(batch))
+                profile.record(start, len(batch), len(items))
+                return items
+
+            object.__setattr__(core, "mapper", profiled_mapper)
+        elif type(core).__name__ == "stateful_batch":
+            builder = core.builder
+            object.__setattr__(core, "builder", lambda resume_state: _ProfiledLogic(builder(resume_state), profile))
+        elif type(core).__name__ == "input" and isinstance(core.source, FixedPartitionedSource):
+            object.__setattr__(core, "source", _ProfiledSource(core.source, profile))
+        elif type(core).__name__ == "output" and isinstance(core.sink, DynamicSink):
+            object.__setattr__(core, "sink", _ProfiledSink(core.sink, profile))
+        else:
+            return None
+        return profile
+
+    def report(self, total_seconds: float, output_conversion_seconds: float = 0.0) -> DeriverProfile:
+        """Build the profile of the run, adding the time spent collecting outputs after the dataflow ended."""
+        steps = []
+        for step, profiles in self.steps:
+            up, down = _stream_ids(step, step.ups_names), _stream_ids(step, step.dwn_names)
+            steps.append(
+                StepProfile(
+                    step_id=step.step_name,
+                    items_in=sum(profile.items_in for profile in profiles if profile.up & up),
+                    items_out=sum(profile.items_out for profile in profiles if profile.down & down),
+                    seconds=sum(profile.seconds for profile in profiles),
+                )
+            )
+        return DeriverProfile(
+            steps=steps,
+            input_conversion_seconds=sum(profile.seconds for profile in self.input_profiles),
+            output_conversion_seconds=sum(profile.seconds for profile in self.output_profiles)
+            + output_conversion_seconds,
+            total_seconds=total_seconds,
+        )
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from hashlib import sha256
+from inspect import getsource
+from pathlib import Path
+
+from pandas import DataFrame, concat, read_parquet
+
+from nortech.datatools.values.windowing import TimeWindow
+from nortech.derivers.services.columnar import output_json_fields
+from nortech.derivers.services.nortech_api import deriver_source_hash
+from nortech.derivers.values.deriver import Deriver
+
+
+def result_cache_key(deriver: type[Deriver], batch_mode: bool) -> str:
+    """Hash the deriver source, its input signals and the execution mode, which determine its outputs."""
+    key = {
+        "source": deriver_source_hash(getsource(deriver)),
+        "inputs": [_input.path for _, _input in deriver.Inputs.list()],
+        "batch_mode": batch_mode,
+    }
+    return sha256(json.dumps(key).encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    Local directory holding the outputs of a deriver run over a time window.
+
+    The outputs are stored as parquet parts, one per computed time window, and a manifest records the time window they
+    cover, so that a run over a longer window only computes the outputs after it.
+    """
+
+    def __init__(self, cache_dir: str | Path, deriver: type[Deriver], batch_mode: bool = False):
+        self.path = Path(cache_dir) / result_cache_key(deriver, batch_mode)
+        self.manifest_path = self.path / "cache.json"
+        self.json_fields = output_json_fields(deriver.Outputs)
+
+    def _manifest(self) -> dict:
+        if not self.manifest_path.exists():
+            return {"parts": 0}
+        return json.loads(self.manifest_path.read_text())
+
+    @property
+    def time_window(self) -> TimeWindow | None:
+        manifest = self._manifest()
+        if "start" not in manifest:
+            return None
+        return TimeWindow(start=datetime.fromisoformat(manifest["start"]), end=datetime.fromisoformat(manifest["end"]))
+
+    def part_path(self, part: int) -> Path:
+        return self.path / f"part-{part:06d}.parquet"
+
+    def read(self, time_window: TimeWindow) -> DataFrame:
+        dfs = [read_parquet(self.part_path(part)) for part in range(self._manifest()["parts"])]
+        if not dfs:
+            return DataFrame()
+
+        df = concat(dfs) if len(dfs) > 1 else dfs[0]
+        for name in self.json_fields:
+            df[name] = [None if value is None else json.loads(value) for value in df[name]]
+        df = df[(df.index >= time_window.start) & (df.index <= time_window.end)]
+        return df.tz_convert(time_window.start.tzinfo)  # type: ignore
+
+    def write(self, df: DataFrame, time_window: TimeWindow, append: bool = False) -> None:
+        """Store the outputs computed for a time window, either replacing the cached outputs or following them."""
+        manifest = self._manifest() if append else {"parts": 0, "start": time_window.start.isoformat()}
+        parts = manifest["parts"]
+
+        # Parts left over by an interrupted write are not in the manifest and are overwritten.
+        self.path.mkdir(parents=True, exist_ok=True)
+        for path in self.path.glob("part-*.parquet"):
+            if int(path.stem.split("-")[1]) >= parts:
+                path.unlink()
+
+        if "timestamp" in df.index.names and len(df):
+            df = df.tz_convert("UTC").copy()  # type: ignore
+            for name in self.json_fields:
+                df[name] = [None if value is None else json.dumps(value) for value in df[name]]
+            df.to_parquet(self.part_path(parts))
+            parts += 1
+
+        self.manifest_path.write_text(json.dumps({**manifest, "parts": parts, "end": time_window.end.isoformat()}))
@@ -2,15 +2,20 @@ from __future__ import annotations
 
 import ast
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, TypeVar
+from typing import Any, Callable, Dict, Tuple, TypeVar
+from weakref import WeakKeyDictionary
 
 import bytewax.operators as op
+from pandas import DataFrame
 from pydantic import BaseModel, ConfigDict, Field
 
 from nortech.derivers.values.errors import InvalidDeriverError
 from nortech.metadata.values.signal import CreateSignalInput, SignalInput
 
+T = TypeVar("T")
+
 
 def DeriverInput(workspace: str, asset: str, division: str, unit: str, signal: str):  # noqa: N802
     return Field(
@@ -87,10 +92,24 @@ def get_type_from_json_schema(type_str: str | list[str]) -> type:
         return type_map[normalized]
 
 
-class DeriverInputs(DeriverIO):
-    @classmethod
-    def list_types(cls) -> list[tuple[str, type]]:
-        return [
+# Introspection results of each deriver IO class by name, held weakly so that derivers compiled from scripts can be
+# garbage collected.
+_fields: WeakKeyDictionary[type, Dict[str, Any]] = WeakKeyDictionary()
+
+
+def _cached_field(cls: type, name: str, compute: Callable[[], T]) -> T:
+    cache = _fields.setdefault(cls, {})
+    if name not in cache:
+        cache[name] = compute()
+    return cache[name]
+
+
+def describe_fields(cls: type[DeriverIO], title: str) -> Tuple[Tuple[str, type, dict[str, Any]], ...]:
+    """Return the name, type and JSON schema of the fields of a deriver IO class with a given title, computed once."""
+    return _cached_field(
+        cls,
+        title,
+        lambda: tuple(
             (
                 field,
                 get_type_from_json_schema(
@@ -99,18 +118,43 @@ class DeriverInputs(DeriverIO):
                         list(map(lambda x: x.get("type"), value.get("anyOf", []))),
                     )
                 ),
+                value,
             )
             for field, value in cls.model_json_schema()["properties"].items()
-            if value.get("title") == "DeriverInput"
-        ]
+            if value.get("title") == title
+        ),
+    )
+
+
+def _input_signals(cls: type[DeriverInputs]) -> Tuple[Tuple[str, SignalInput], ...]:
+    return _cached_field(
+        cls,
+        "input_signals",
+        lambda: tuple(
+            (field, SignalInput.model_validate(value)) for field, _, value in describe_fields(cls, "DeriverInput")
+        ),
+    )
+
+
+def _output_signals(cls: type[DeriverOutputs]) -> Tuple[Tuple[str, CreateSignalInput], ...]:
+    return _cached_field(
+        cls,
+        "output_signals",
+        lambda: tuple(
+            (field, CreateSignalInput.model_validate(value))
+            for field, _, value in describe_fields(cls, "DeriverOutput")
+        ),
+    )
+
+
+class DeriverInputs(DeriverIO):
+    @classmethod
+    def list_types(cls) -> list[tuple[str, type]]:
+        return [(field, typ) for field, typ, _ in describe_fields(cls, "DeriverInput")]
 
     @classmethod
     def list(cls) -> list[tuple[str, SignalInput]]:
-        return [
-            (field, SignalInput.model_validate(value))
-            for field, value in cls.model_json_schema()["properties"].items()
-            if value.get("title") == "DeriverInput"
-        ]
+        return [(field, signal.model_copy()) for field, signal in _input_signals(cls)]
 
 
 InputType = TypeVar("InputType", bound=DeriverInputs)
@@ -119,27 +163,11 @@ InputType = TypeVar("InputType", bound=DeriverInputs)
 class DeriverOutputs(DeriverIO):
     @classmethod
     def list_types(cls) -> list[tuple[str, type]]:
-        return [
-            (
-                field,
-                get_type_from_json_schema(
-                    value.get(
-                        "type",
-                        list(map(lambda x: x.get("type"), value.get("anyOf", []))),
-                    )
-                ),
-            )
-            for field, value in cls.model_json_schema()["properties"].items()
-            if value.get("title") == "DeriverOutput"
-        ]
+        return [(field, typ) for field, typ, _ in describe_fields(cls, "DeriverOutput")]
 
     @classmethod
     def list(cls) -> list[tuple[str, CreateSignalInput]]:
-        return [
-            (field, CreateSignalInput.model_validate(value))
-            for field, value in cls.model_json_schema()["properties"].items()
-            if value.get("title") == "DeriverOutput"
-        ]
+        return [(field, signal.model_copy()) for field, signal in _output_signals(cls)]
 
 
 OutputType = TypeVar("OutputType", bound=DeriverOutputs)
@@ -156,33 +184,90 @@ class Deriver(ABC):
     def run(self, stream: op.Stream[Inputs]) -> op.Stream[Outputs]:
         raise NotImplementedError
 
+    def run_batch(self, df: DataFrame) -> DataFrame:
+        """
+        Run the deriver on a chunk of inputs at once.
+
+        Optional vectorized equivalent of `run`, used when running locally in batch mode. It is called with consecutive
+        chunks of the input data, in timestamp order and on the same deriver instance, so any state needed across chunks
+        can be kept in the instance.
+
+        Args:
+            df (DataFrame): A chunk of inputs, with a UTC timestamp index and one column per input. Missing values are NaN.
+
+        Returns:
+            DataFrame: The outputs for the chunk, with a timestamp index and one column per output.
+
+        """
+        raise NotImplementedError
+
+
+def has_run_batch(deriver: type[Deriver]) -> bool:
+    return deriver.run_batch is not Deriver.run_batch
 
-def validate_deriver(deriver: type) -> type[Deriver]:
-    if not issubclass(deriver, Deriver):
-        raise InvalidDeriverError("Deriver must be a subclass of Deriver.")
 
-    deriver_inputs = deriver.Inputs.list_types()
-    if len(deriver_inputs) == 0:
-        raise InvalidDeriverError("Deriver must have at least one input.")
+@dataclass(frozen=True)
+class DeriverDescriptor:
+    """
+    Introspection results of a deriver class, computed once per class.
 
-    deriver_outputs = deriver.Outputs.list_types()
-    if len(deriver_outputs) == 0:
-        raise InvalidDeriverError("Deriver must have at least one output.")
-    for name, typ in deriver_outputs:
+    Attributes:
+        inputs (tuple[tuple[str, type], ...]): The name and type of each input.
+        outputs (tuple[tuple[str, type], ...]): The name and type of each output.
+        error (str | None): Why the class is not a valid deriver, or None if it is.
+
+    """
+
+    inputs: Tuple[Tuple[str, type], ...]
+    outputs: Tuple[Tuple[str, type], ...]
+    error: str | None = None
+
+
+_descriptors: WeakKeyDictionary[type, DeriverDescriptor] = WeakKeyDictionary()
+
+
+def _validation_error(deriver: type[Deriver], inputs: list[tuple[str, type]], outputs: list[tuple[str, type]]):
+    if len(inputs) == 0:
+        return "Deriver must have at least one input."
+
+    if len(outputs) == 0:
+        return "Deriver must have at least one output."
+    for name, typ in outputs:
         if typ not in [float, str, bool, dict, list]:
-            raise InvalidDeriverError(
-                f"Deriver output '{name}' has type '{typ.__name__}', which is not allowed. Allowed types: float, str, bool, dict, list."
-            )
+            return f"Deriver output '{name}' has type '{typ.__name__}', which is not allowed. Allowed types: float, str, bool, dict, list."
 
+    if getattr(deriver.run, "__isabstractmethod__", False):
+        return "Deriver must implement the run method."
     try:
         deriver().run(None)  # type: ignore
-    except Exception as e:
-        if isinstance(e, NotImplementedError) or (
-            isinstance(e, TypeError)
-            and f"Can't instantiate abstract class {deriver.__name__} with abstract method run" in str(e)
-        ):
-            raise InvalidDeriverError("Deriver must implement the run method.")  # noqa: B904
-        return deriver
+    except NotImplementedError:
+        return "Deriver must implement the run method."
+    except Exception:
+        return None
+    return None
+
+
+def describe_deriver(deriver: type[Deriver]) -> DeriverDescriptor:
+    descriptor = _descriptors.get(deriver)
+    if descriptor is None:
+        try:
+            inputs = deriver.Inputs.list_types()
+            outputs = deriver.Outputs.list_types()
+            error = _validation_error(deriver, inputs, outputs)
+        except InvalidDeriverError as e:
+            inputs, outputs, error = [], [], str(e)
+        descriptor = DeriverDescriptor(inputs=tuple(inputs), outputs=tuple(outputs), error=error)
+        _descriptors[deriver] = descriptor
+    return descriptor
+
+
+def validate_deriver(deriver: type) -> type[Deriver]:
+    if not issubclass(deriver, Deriver):
+        raise InvalidDeriverError("Deriver must be a subclass of Deriver.")
+
+    error = describe_deriver(deriver).error
+    if error is not None:
+        raise InvalidDeriverError(error)
     return deriver
 
 
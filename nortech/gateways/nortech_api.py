@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Sequence
+from typing import Any, Sequence
 from urllib.parse import urljoin
 
 from pydantic import Field
@@ -12,6 +12,11 @@ from urllib3.util.retry import Retry
 
 from nortech.__version__ import __version__
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 
 class NortechAPISettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="NORTECH_API_", env_file=(".env", ".env.prod"), extra="ignore")
@@ -21,6 +26,8 @@ class NortechAPISettings(BaseSettings):
     USER_AGENT: str = Field(default=f"nortech-python/{__version__}")
     IGNORE_PAGINATION: bool = True
     EXPERIMENTAL_FEATURES: bool = False
+    SIGNAL_BATCH_SIZE: int = Field(default=100, gt=0)
+    SIGNAL_BATCH_WINDOW: float | None = Field(default=None, ge=0)
     TIMEOUT: float | Timeout = Field(default=Timeout(connect=10, read=60))
     RETRY: int | Retry = Field(
         default=Retry(
@@ -95,3 +102,8 @@ def validate_response(
         assert response.status_code in (valid_status_codes or [200])
     except AssertionError as e:
         raise AssertionError(f"{error_message} Status code: {response.status_code}. Response: {response.text}") from e
+
+
+def response_json(response: Response) -> Any:
+    """Decode a JSON response body, with orjson if it is installed."""
+    return json_loads(response.content)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Literal
+from typing import Dict, List, Literal, Sequence, overload
 
 import nortech.metadata.services.asset as asset_service
 import nortech.metadata.services.division as division_service
@@ -8,6 +8,8 @@ import nortech.metadata.services.signal as signal_service
 import nortech.metadata.services.unit as unit_service
 import nortech.metadata.services.workspace as workspace_service
 from nortech.gateways.nortech_api import NortechAPI
+from nortech.metadata.services.signal_catalog import SignalCatalog, fetch_signal_catalog
+from nortech.metadata.services.signal_loader import SignalLoader
 from nortech.metadata.values.asset import (
     AssetInput,
     AssetInputDict,
@@ -21,7 +23,9 @@ from nortech.metadata.values.division import (
     DivisionListOutput,
     DivisionOutput,
 )
+from nortech.metadata.values.errors import SignalNotFoundError
 from nortech.metadata.values.pagination import (
+    ColumnarPaginatedResponse,
     NextRef,
     PaginatedResponse,
     PaginationOptions,
@@ -43,6 +47,7 @@ from nortech.metadata.values.workspace import (
     WorkspaceInputDict,
     WorkspaceListOutput,
     WorkspaceOutput,
+    parse_workspace_input,
 )
 
 
@@ -136,11 +141,32 @@ class Asset:
         """
         return asset_service.get_workspace_asset(self.nortech_api, asset)
 
+    @overload
     def list(
         self,
         workspace: int | str | WorkspaceInputDict | WorkspaceInput | WorkspaceOutput | WorkspaceListOutput,
         pagination_options: PaginationOptions[Literal["id", "name", "description"]] | None = None,
-    ) -> PaginatedResponse[AssetListOutput, Literal["id", "name", "description"]]:
+        columnar: Literal[False] = False,
+    ) -> PaginatedResponse[AssetListOutput, Literal["id", "name", "description"]]: ...
+
+    @overload
+    def list(
+        self,
+        workspace: int | str | WorkspaceInputDict | WorkspaceInput | WorkspaceOutput | WorkspaceListOutput,
+        pagination_options: PaginationOptions[Literal["id", "name", "description"]] | None = None,
+        *,
+        columnar: Literal[True],
+    ) -> ColumnarPaginatedResponse[Literal["id", "name", "description"]]: ...
+
+    def list(
+        self,
+        workspace: int | str | WorkspaceInputDict | WorkspaceInput | WorkspaceOutput | WorkspaceListOutput,
+        pagination_options: PaginationOptions[Literal["id", "name", "description"]] | None = None,
+        columnar: bool = False,
+    ) -> (
+        PaginatedResponse[AssetListOutput, Literal["id", "name", "description"]]
+        | ColumnarPaginatedResponse[Literal["id", "name", "description"]]
+    ):
         """
         List all assets in a workspace.
 
@@ -153,12 +179,16 @@ class Asset:
                 - [WorkspaceOutput](#workspaceoutput): A pydantic model representing a workspace output.
                 - [WorkspaceListOutput](#workspacelistoutput): A pydantic model representing a listed workspace output.
             pagination_options (PaginationOptions, optional): Pagination settings.
+            columnar (bool, optional): Whether to build the listed items directly as columns, without instancing a
+                pydantic model per item. Defaults to False.
 
         Returns:
             PaginatedResponse[AssetListOutput]: A paginated list of assets.
+                If columnar, a [ColumnarPaginatedResponse](#columnarpaginatedresponse) with the items as a polars
+                DataFrame instead.
 
         """
-        return asset_service.list_workspace_assets(self.nortech_api, workspace, pagination_options)
+        return asset_service.list_workspace_assets(self.nortech_api, workspace, pagination_options, columnar)
 
 
 class Division:
@@ -250,11 +280,29 @@ class Unit:
         """
         return unit_service.get_workspace_asset_division_unit(self.nortech_api, unit)
 
+    @overload
     def list(
         self,
         division: int | DivisionInputDict | DivisionInput | DivisionOutput | DivisionListOutput,
         pagination_options: PaginationOptions[Literal["id", "name"]] | None = None,
-    ) -> PaginatedResponse[UnitListOutput, Literal["id", "name"]]:
+        columnar: Literal[False] = False,
+    ) -> PaginatedResponse[UnitListOutput, Literal["id", "name"]]: ...
+
+    @overload
+    def list(
+        self,
+        division: int | DivisionInputDict | DivisionInput | DivisionOutput | DivisionListOutput,
+        pagination_options: PaginationOptions[Literal["id", "name"]] | None = None,
+        *,
+        columnar: Literal[True],
+    ) -> ColumnarPaginatedResponse[Literal["id", "name"]]: ...
+
+    def list(
+        self,
+        division: int | DivisionInputDict | DivisionInput | DivisionOutput | DivisionListOutput,
+        pagination_options: PaginationOptions[Literal["id", "name"]] | None = None,
+        columnar: bool = False,
+    ) -> PaginatedResponse[UnitListOutput, Literal["id", "name"]] | ColumnarPaginatedResponse[Literal["id", "name"]]:
         """
         List all units in a division.
 
@@ -266,58 +314,117 @@ class Unit:
                 - [DivisionOutput](#divisionoutput): A pydantic model representing a division output.
                 - [DivisionListOutput](#divisionlistoutput): A pydantic model representing a listed division output.
             pagination_options (PaginationOptions, optional): Pagination settings.
+            columnar (bool, optional): Whether to build the listed items directly as columns, without instancing a
+                pydantic model per item. Defaults to False.
 
         Returns:
             PaginatedResponse[UnitListOutput]: A paginated list of units.
+                If columnar, a [ColumnarPaginatedResponse](#columnarpaginatedresponse) with the items as a polars
+                DataFrame instead.
 
         """
-        return unit_service.list_workspace_asset_division_units(self.nortech_api, division, pagination_options)
+        return unit_service.list_workspace_asset_division_units(
+            self.nortech_api, division, pagination_options, columnar
+        )
 
+    @overload
     def list_by_workspace_id(
         self,
         workspace_id: int,
         pagination_options: PaginationOptions[Literal["id", "name"]] | None = None,
-    ) -> PaginatedResponse[UnitListOutput, Literal["id", "name"]]:
+        columnar: Literal[False] = False,
+    ) -> PaginatedResponse[UnitListOutput, Literal["id", "name"]]: ...
+
+    @overload
+    def list_by_workspace_id(
+        self,
+        workspace_id: int,
+        pagination_options: PaginationOptions[Literal["id", "name"]] | None = None,
+        *,
+        columnar: Literal[True],
+    ) -> ColumnarPaginatedResponse[Literal["id", "name"]]: ...
+
+    def list_by_workspace_id(
+        self,
+        workspace_id: int,
+        pagination_options: PaginationOptions[Literal["id", "name"]] | None = None,
+        columnar: bool = False,
+    ) -> PaginatedResponse[UnitListOutput, Literal["id", "name"]] | ColumnarPaginatedResponse[Literal["id", "name"]]:
         """
         List all units in a workspace.
 
         Args:
             workspace_id (int): The workspace ID.
             pagination_options (PaginationOptions, optional): Pagination settings.
+            columnar (bool, optional): Whether to build the listed items directly as columns, without instancing a
+                pydantic model per item. Defaults to False.
 
         Returns:
             PaginatedResponse[UnitListOutput]: A paginated list of units.
+                If columnar, a [ColumnarPaginatedResponse](#columnarpaginatedresponse) with the items as a polars
+                DataFrame instead.
 
         """
-        return unit_service.list_workspace_units(self.nortech_api, workspace_id, pagination_options)
+        return unit_service.list_workspace_units(self.nortech_api, workspace_id, pagination_options, columnar)
+
+    @overload
+    def list_by_asset_id(
+        self,
+        asset_id: int,
+        pagination_options: PaginationOptions[Literal["id", "name"]] | None = None,
+        columnar: Literal[False] = False,
+    ) -> PaginatedResponse[UnitListOutput, Literal["id", "name"]]: ...
+
+    @overload
+    def list_by_asset_id(
+        self,
+        asset_id: int,
+        pagination_options: PaginationOptions[Literal["id", "name"]] | None = None,
+        *,
+        columnar: Literal[True],
+    ) -> ColumnarPaginatedResponse[Literal["id", "name"]]: ...
 
     def list_by_asset_id(
         self,
         asset_id: int,
         pagination_options: PaginationOptions[Literal["id", "name"]] | None = None,
-    ) -> PaginatedResponse[UnitListOutput, Literal["id", "name"]]:
+        columnar: bool = False,
+    ) -> PaginatedResponse[UnitListOutput, Literal["id", "name"]] | ColumnarPaginatedResponse[Literal["id", "name"]]:
         """
         List all units in an asset.
 
         Args:
             asset_id (int): The asset ID.
             pagination_options (PaginationOptions, optional): Pagination settings.
+            columnar (bool, optional): Whether to build the listed items directly as columns, without instancing a
+                pydantic model per item. Defaults to False.
 
         Returns:
             PaginatedResponse[UnitListOutput]: A paginated list of units.
+                If columnar, a [ColumnarPaginatedResponse](#columnarpaginatedresponse) with the items as a polars
+                DataFrame instead.
 
         """
-        return unit_service.list_asset_units(self.nortech_api, asset_id, pagination_options)
+        return unit_service.list_asset_units(self.nortech_api, asset_id, pagination_options, columnar)
 
 
 class Signal:
     def __init__(self, nortech_api: NortechAPI):
         self.nortech_api = nortech_api
+        self.loader = SignalLoader(
+            nortech_api,
+            max_batch_size=nortech_api.settings.SIGNAL_BATCH_SIZE,
+            batch_window=nortech_api.settings.SIGNAL_BATCH_WINDOW,
+        )
+        self._catalogs: Dict[int | str | None, SignalCatalog] = {}
 
     def get(self, signal: int | SignalInputDict | SignalInput | SignalOutput | SignalListOutput) -> SignalOutput:
         """
         Get a signal by ID or input.
 
+        If a signal batch window is configured, lookups by ID made concurrently within that window are coalesced into
+        bulk requests.
+
         Args:
             signal (int | SignalInputDict | SignalInput | SignalOutput | SignalListOutput): The signal identifier, which can be:
                 - *int*: The signal "ID".
@@ -333,8 +440,106 @@ class Signal:
         if isinstance(signal, dict):
             signal = SignalInput.model_validate(signal)
 
+        if isinstance(signal, int) and self.loader.batch_window is not None:
+            return self.loader.load(signal).result()
+
         return signal_service.get_workspace_asset_division_unit_signal(self.nortech_api, signal)
 
+    def get_many(
+        self,
+        signals: Sequence[int | SignalInputDict | SignalInput | SignalOutput | SignalListOutput],
+        chunk_size: int | None = None,
+        max_workers: int = 4,
+    ) -> List[SignalOutput | None]:
+        """
+        Get many signals by ID or input with bulk requests.
+
+        The signals are fetched in chunks of at most `chunk_size` signals, with up to `max_workers` chunks requested
+        concurrently. Signals that do not exist do not fail the request, their result is None instead.
+
+        Args:
+            signals (Sequence[int | SignalInputDict | SignalInput | SignalOutput | SignalListOutput]): The signal identifiers, which can be:
+                - *int*: The signal "ID".
+                - [SignalInputDict](#signalinputdict): A dictionary representation of a signal input.
+                - [SignalInput](#signalinput): A pydantic model representing a signal input.
+                - [SignalOutput](#signaloutput): A pydantic model representing a signal output. Obtained from requesting a signal metadata.
+                - [SignalListOutput](#signallistoutput): A pydantic model representing a listed signal output. Obtained from requesting signals metadata.
+            chunk_size (int | None, optional): The maximum number of signals fetched per request. Defaults to the
+                configured signal batch size.
+            max_workers (int, optional): The maximum number of concurrent requests. Defaults to 4.
+
+        Returns:
+            list[SignalOutput | None]: The signal details, in the same order as the requested signals. None for signals
+                that were not found.
+
+        """
+        return signal_service.get_signals(self.nortech_api, signals, chunk_size, max_workers)
+
+    def batch(self, max_batch_size: int | None = None) -> SignalLoader:
+        """
+        Create a batch context to fetch many signals by ID with bulk requests.
+
+        Lookups queued with `load` inside the context are fetched in bulk requests of at most `max_batch_size` signals,
+        at the latest when the context exits. Each lookup returns a future resolved with its signal, and repeated
+        lookups for the same ID reuse the same future.
+
+        Args:
+            max_batch_size (int | None, optional): The maximum number of signals fetched per request. Defaults to the
+                configured signal batch size.
+
+        Returns:
+            SignalLoader: The batch context.
+
+        Raises:
+            SignalNotFoundError: Raised by a lookup future when its signal does not exist.
+
+        """
+        return SignalLoader(
+            self.nortech_api,
+            max_batch_size=max_batch_size or self.nortech_api.settings.SIGNAL_BATCH_SIZE,
+            cache=True,
+        )
+
+    def catalog(
+        self,
+        workspace: int
+        | str
+        | WorkspaceInputDict
+        | WorkspaceInput
+        | WorkspaceOutput
+        | WorkspaceListOutput
+        | None = None,
+        refresh: bool = False,
+        max_workers: int = 4,
+    ) -> SignalCatalog:
+        """
+        Get a searchable snapshot of the signals of a workspace, or of all workspaces.
+
+        The snapshot is fetched on the first call and cached by the client, later calls reuse it unless `refresh` is
+        set. Use `SignalCatalog.save` and `SignalCatalog.load` to keep snapshots across sessions.
+
+        Args:
+            workspace (int | str | WorkspaceInputDict | WorkspaceInput | WorkspaceOutput | WorkspaceListOutput | None, optional): The workspace identifier, which can be:
+                - *int*: The workspace "ID".
+                - *str*: The workspace "name".
+                - [WorkspaceInputDict](#workspaceinputdict): A dictionary representation of a workspace input.
+                - [WorkspaceInput](#workspaceinput): A pydantic model representing a workspace input.
+                - [WorkspaceOutput](#workspaceoutput): A pydantic model representing a workspace output. Obtained from requesting a workspace metadata.
+                - [WorkspaceListOutput](#workspacelistoutput): A pydantic model representing a listed workspace output. Obtained from requesting workspaces metadata.
+                Defaults to all workspaces.
+            refresh (bool, optional): Whether to fetch a new snapshot instead of reusing the cached one. Defaults to False.
+            max_workers (int, optional): The maximum number of concurrent requests while fetching. Defaults to 4.
+
+        Returns:
+            SignalCatalog: The signal catalog, searchable with `search`.
+
+        """
+        key = parse_workspace_input(workspace) if workspace is not None else None
+        if refresh or key not in self._catalogs:
+            self._catalogs[key] = SignalCatalog(fetch_signal_catalog(self.nortech_api, workspace, max_workers))
+        return self._catalogs[key]
+
+    @overload
     def list(
         self,
         unit: int | UnitInputDict | UnitInput | UnitOutput,
@@ -349,9 +554,55 @@ class Signal:
             ]
         ]
         | None = None,
+        columnar: Literal[False] = False,
     ) -> PaginatedResponse[
         SignalListOutput, Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
-    ]:
+    ]: ...
+
+    @overload
+    def list(
+        self,
+        unit: int | UnitInputDict | UnitInput | UnitOutput,
+        pagination_options: PaginationOptions[
+            Literal[
+                "id",
+                "name",
+                "physical_unit",
+                "data_type",
+                "description",
+                "long_description",
+            ]
+        ]
+        | None = None,
+        *,
+        columnar: Literal[True],
+    ) -> ColumnarPaginatedResponse[
+        Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
+    ]: ...
+
+    def list(
+        self,
+        unit: int | UnitInputDict | UnitInput | UnitOutput,
+        pagination_options: PaginationOptions[
+            Literal[
+                "id",
+                "name",
+                "physical_unit",
+                "data_type",
+                "description",
+                "long_description",
+            ]
+        ]
+        | None = None,
+        columnar: bool = False,
+    ) -> (
+        PaginatedResponse[
+            SignalListOutput, Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
+        ]
+        | ColumnarPaginatedResponse[
+            Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
+        ]
+    ):
         """
         List all signals in a unit.
 
@@ -362,17 +613,24 @@ class Signal:
                 - [UnitInput](#unitinput): A pydantic model representing a unit input.
                 - [UnitOutput](#unitoutput): A pydantic model representing a unit output.
             pagination_options (PaginationOptions, optional): Pagination settings.
+            columnar (bool, optional): Whether to build the listed items directly as columns, without instancing a
+                pydantic model per item. Defaults to False.
 
         Returns:
             PaginatedResponse[SignalListOutput]: A paginated list of signals.
+                If columnar, a [ColumnarPaginatedResponse](#columnarpaginatedresponse) with the items as a polars
+                DataFrame instead.
 
 
         """
         if isinstance(unit, dict):
             unit = UnitInput.model_validate(unit)
 
-        return signal_service.list_workspace_asset_division_unit_signals(self.nortech_api, unit, pagination_options)
+        return signal_service.list_workspace_asset_division_unit_signals(
+            self.nortech_api, unit, pagination_options, columnar
+        )
 
+    @overload
     def list_by_workspace_id(
         self,
         workspace_id: int,
@@ -387,23 +645,74 @@ class Signal:
             ]
         ]
         | None = None,
+        columnar: Literal[False] = False,
     ) -> PaginatedResponse[
         SignalListOutput, Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
-    ]:
+    ]: ...
+
+    @overload
+    def list_by_workspace_id(
+        self,
+        workspace_id: int,
+        pagination_options: PaginationOptions[
+            Literal[
+                "id",
+                "name",
+                "physical_unit",
+                "data_type",
+                "description",
+                "long_description",
+            ]
+        ]
+        | None = None,
+        *,
+        columnar: Literal[True],
+    ) -> ColumnarPaginatedResponse[
+        Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
+    ]: ...
+
+    def list_by_workspace_id(
+        self,
+        workspace_id: int,
+        pagination_options: PaginationOptions[
+            Literal[
+                "id",
+                "name",
+                "physical_unit",
+                "data_type",
+                "description",
+                "long_description",
+            ]
+        ]
+        | None = None,
+        columnar: bool = False,
+    ) -> (
+        PaginatedResponse[
+            SignalListOutput, Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
+        ]
+        | ColumnarPaginatedResponse[
+            Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
+        ]
+    ):
         """
         List all signals in a workspace.
 
         Args:
             workspace_id (int): The workspace ID.
             pagination_options (PaginationOptions, optional): Pagination settings.
+            columnar (bool, optional): Whether to build the listed items directly as columns, without instancing a
+                pydantic model per item. Defaults to False.
 
         Returns:
             PaginatedResponse[SignalListOutput]: A paginated list of signals.
+                If columnar, a [ColumnarPaginatedResponse](#columnarpaginatedresponse) with the items as a polars
+                DataFrame instead.
 
 
         """
-        return signal_service.list_workspace_signals(self.nortech_api, workspace_id, pagination_options)
+        return signal_service.list_workspace_signals(self.nortech_api, workspace_id, pagination_options, columnar)
 
+    @overload
     def list_by_asset_id(
         self,
         asset_id: int,
@@ -418,23 +727,74 @@ class Signal:
             ]
         ]
         | None = None,
+        columnar: Literal[False] = False,
     ) -> PaginatedResponse[
         SignalListOutput, Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
-    ]:
+    ]: ...
+
+    @overload
+    def list_by_asset_id(
+        self,
+        asset_id: int,
+        pagination_options: PaginationOptions[
+            Literal[
+                "id",
+                "name",
+                "physical_unit",
+                "data_type",
+                "description",
+                "long_description",
+            ]
+        ]
+        | None = None,
+        *,
+        columnar: Literal[True],
+    ) -> ColumnarPaginatedResponse[
+        Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
+    ]: ...
+
+    def list_by_asset_id(
+        self,
+        asset_id: int,
+        pagination_options: PaginationOptions[
+            Literal[
+                "id",
+                "name",
+                "physical_unit",
+                "data_type",
+                "description",
+                "long_description",
+            ]
+        ]
+        | None = None,
+        columnar: bool = False,
+    ) -> (
+        PaginatedResponse[
+            SignalListOutput, Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
+        ]
+        | ColumnarPaginatedResponse[
+            Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
+        ]
+    ):
         """
         List all signals in an asset.
 
         Args:
             asset_id (int): The asset ID.
             pagination_options (PaginationOptions, optional): Pagination settings.
+            columnar (bool, optional): Whether to build the listed items directly as columns, without instancing a
+                pydantic model per item. Defaults to False.
 
         Returns:
             PaginatedResponse[SignalListOutput]: A paginated list of signals.
+                If columnar, a [ColumnarPaginatedResponse](#columnarpaginatedresponse) with the items as a polars
+                DataFrame instead.
 
 
         """
-        return signal_service.list_asset_signals(self.nortech_api, asset_id, pagination_options)
+        return signal_service.list_asset_signals(self.nortech_api, asset_id, pagination_options, columnar)
 
+    @overload
     def list_by_division_id(
         self,
         division_id: int,
@@ -449,22 +809,79 @@ class Signal:
             ]
         ]
         | None = None,
+        columnar: Literal[False] = False,
     ) -> PaginatedResponse[
         SignalListOutput, Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
-    ]:
+    ]: ...
+
+    @overload
+    def list_by_division_id(
+        self,
+        division_id: int,
+        pagination_options: PaginationOptions[
+            Literal[
+                "id",
+                "name",
+                "physical_unit",
+                "data_type",
+                "description",
+                "long_description",
+            ]
+        ]
+        | None = None,
+        *,
+        columnar: Literal[True],
+    ) -> ColumnarPaginatedResponse[
+        Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
+    ]: ...
+
+    def list_by_division_id(
+        self,
+        division_id: int,
+        pagination_options: PaginationOptions[
+            Literal[
+                "id",
+                "name",
+                "physical_unit",
+                "data_type",
+                "description",
+                "long_description",
+            ]
+        ]
+        | None = None,
+        columnar: bool = False,
+    ) -> (
+        PaginatedResponse[
+            SignalListOutput, Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
+        ]
+        | ColumnarPaginatedResponse[
+            Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
+        ]
+    ):
         """
         List all signals in a division.
 
         Args:
             division_id (int): The division ID.
             pagination_options (PaginationOptions, optional): Pagination settings.
+            columnar (bool, optional): Whether to build the listed items directly as columns, without instancing a
+                pydantic model per item. Defaults to False.
 
         Returns:
             PaginatedResponse[SignalListOutput]: A paginated list of signals.
+                If columnar, a [ColumnarPaginatedResponse](#columnarpaginatedresponse) with the items as a polars
+                DataFrame instead.
 
 
         """
-        return signal_service.list_division_signals(self.nortech_api, division_id, pagination_options)
+        return signal_service.list_division_signals(self.nortech_api, division_id, pagination_options, columnar)
 
 
-__all__ = ["MetadataOutput", "NextRef"]
+__all__ = [
+    "ColumnarPaginatedResponse",
+    "MetadataOutput",
+    "NextRef",
+    "SignalCatalog",
+    "SignalLoader",
+    "SignalNotFoundError",
+]
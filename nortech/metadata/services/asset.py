@@ -6,6 +6,7 @@ from nortech.gateways.nortech_api import (
     NortechAPI,
     validate_response,
 )
+from nortech.metadata.services.columnar import list_columnar
 from nortech.metadata.values.asset import (
     AssetInput,
     AssetInputDict,
@@ -14,6 +15,7 @@ from nortech.metadata.values.asset import (
     parse_asset_input,
 )
 from nortech.metadata.values.pagination import (
+    ColumnarPaginatedResponse,
     PaginatedResponse,
     PaginationOptions,
 )
@@ -25,22 +27,31 @@ from nortech.metadata.values.workspace import (
     parse_workspace_input,
 )
 
+AssetListResponse = PaginatedResponse[AssetListOutput, Literal["id", "name", "description"]]
+
 
 def list_workspace_assets(
     nortech_api: NortechAPI,
     workspace: WorkspaceInputDict | WorkspaceInput | WorkspaceOutput | WorkspaceListOutput | int | str,
     pagination_options: PaginationOptions[Literal["id", "name", "description"]] | None = None,
-) -> PaginatedResponse[AssetListOutput, Literal["id", "name", "description"]]:
+    columnar: bool = False,
+) -> (
+    PaginatedResponse[AssetListOutput, Literal["id", "name", "description"]]
+    | ColumnarPaginatedResponse[Literal["id", "name", "description"]]
+):
     workspace_input = parse_workspace_input(workspace)
+    if columnar:
+        return list_columnar(
+            nortech_api, f"/api/v1/workspaces/{workspace_input}/assets", AssetListOutput, pagination_options
+        )
+
     response = nortech_api.get(
         url=f"/api/v1/workspaces/{workspace_input}/assets",
         params=pagination_options.model_dump(exclude_none=True, by_alias=True) if pagination_options else None,
     )
     validate_response(response)
 
-    resp = PaginatedResponse[AssetListOutput, Literal["id", "name", "description"]].model_validate(
-        {**response.json(), "pagination_options": pagination_options}
-    )
+    resp = AssetListResponse.model_validate_page(response.content, pagination_options)
 
     if nortech_api.ignore_pagination and resp.next and resp.next.token:
         next_resp = list_workspace_assets(nortech_api, workspace, resp.next_pagination_options())
@@ -69,7 +80,7 @@ def get_workspace_asset(
         url=f"/api/v1/workspaces/{asset_input.workspace}/assets/{asset_input.asset}",
     )
     validate_response(response)
-    return AssetOutput.model_validate(response.json())
+    return AssetOutput.model_validate_json(response.content)
 
 
 def get_asset(nortech_api: NortechAPI, asset_id: int):
@@ -77,4 +88,4 @@ def get_asset(nortech_api: NortechAPI, asset_id: int):
         url=f"/api/v1/assets/{asset_id}",
     )
     validate_response(response)
-    return AssetOutput.model_validate(response.json())
+    return AssetOutput.model_validate_json(response.content)
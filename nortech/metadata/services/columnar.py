@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from pydantic import BaseModel
+
+from nortech.gateways.nortech_api import (
+    NortechAPI,
+    response_json,
+    validate_response,
+)
+from nortech.metadata.values.pagination import (
+    ColumnarPaginatedResponse,
+    PaginationOptions,
+    SortBy,
+    columnar_paginated_response_from_pages,
+)
+
+
+def list_columnar(
+    nortech_api: NortechAPI,
+    url: str,
+    model: type[BaseModel],
+    pagination_options: PaginationOptions[SortBy] | None = None,
+) -> ColumnarPaginatedResponse[SortBy]:
+    pages: List[Dict[str, Any]] = []
+    page_pagination_options = pagination_options
+
+    while True:
+        response = nortech_api.get(
+            url=url,
+            params=page_pagination_options.model_dump(exclude_none=True, by_alias=True)
+            if page_pagination_options
+            else None,
+        )
+        validate_response(response)
+        pages.append(response_json(response))
+
+        next_token = (pages[-1].get("next") or {}).get("token")
+        if not (nortech_api.ignore_pagination and next_token):
+            break
+        page_pagination_options = (
+            page_pagination_options.model_copy(update={"next_token": next_token})
+            if page_pagination_options
+            else PaginationOptions(nextToken=next_token)
+        )
+
+    return columnar_paginated_response_from_pages(pages, model, pagination_options)
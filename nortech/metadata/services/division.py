@@ -25,6 +25,8 @@ from nortech.metadata.values.pagination import (
     PaginationOptions,
 )
 
+DivisionListResponse = PaginatedResponse[DivisionListOutput, Literal["id", "name", "description"]]
+
 
 def list_workspace_asset_divisions(
     nortech_api: NortechAPI,
@@ -43,9 +45,7 @@ def list_workspace_asset_divisions(
     )
     validate_response(response)
 
-    resp = PaginatedResponse[DivisionListOutput, Literal["id", "name", "description"]].model_validate(
-        {**response.json(), "pagination_options": pagination_options}
-    )
+    resp = DivisionListResponse.model_validate_page(response.content, pagination_options)
 
     if nortech_api.ignore_pagination and resp.next and resp.next.token:
         next_resp = list_workspace_asset_divisions(nortech_api, asset, resp.next_pagination_options())
@@ -74,7 +74,7 @@ def get_workspace_asset_division(
         url=f"/api/v1/workspaces/{division_input.workspace}/assets/{division_input.asset}/divisions/{division_input.division}",
     )
     validate_response(response)
-    return DivisionOutput.model_validate(response.json())
+    return DivisionOutput.model_validate_json(response.content)
 
 
 def list_workspace_divisions(
@@ -88,9 +88,7 @@ def list_workspace_divisions(
     )
     validate_response(response)
 
-    resp = PaginatedResponse[DivisionListOutput, Literal["id", "name", "description"]].model_validate(
-        {**response.json(), "pagination_options": pagination_options}
-    )
+    resp = DivisionListResponse.model_validate_page(response.content, pagination_options)
 
     if nortech_api.ignore_pagination and resp.next and resp.next.token:
         next_resp = list_workspace_divisions(nortech_api, workspace_id, resp.next_pagination_options())
@@ -116,9 +114,7 @@ def list_asset_divisions(
     )
     validate_response(response)
 
-    resp = PaginatedResponse[DivisionListOutput, Literal["id", "name", "description"]].model_validate(
-        {**response.json(), "pagination_options": pagination_options}
-    )
+    resp = DivisionListResponse.model_validate_page(response.content, pagination_options)
 
     if nortech_api.ignore_pagination and resp.next and resp.next.token:
         next_resp = list_asset_divisions(nortech_api, asset_id, resp.next_pagination_options())
@@ -138,4 +134,4 @@ def get_division(nortech_api: NortechAPI, division_id: int):
         url=f"/api/v1/divisions/{division_id}",
     )
     validate_response(response)
-    return DivisionOutput.model_validate(response.json())
+    return DivisionOutput.model_validate_json(response.content)
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from typing import List, Literal, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Literal, Sequence, Union
+
+from pydantic import TypeAdapter
 
 from nortech.gateways.nortech_api import (
     NortechAPI,
     validate_response,
 )
+from nortech.metadata.services.columnar import list_columnar
 from nortech.metadata.services.unit import (
     UnitInput,
     UnitInputDict,
@@ -14,6 +18,7 @@ from nortech.metadata.services.unit import (
     parse_unit_input,
 )
 from nortech.metadata.values.pagination import (
+    ColumnarPaginatedResponse,
     PaginatedResponse,
     PaginationOptions,
 )
@@ -25,6 +30,12 @@ from nortech.metadata.values.signal import (
     parse_signal_input,
 )
 
+SignalOutputList = TypeAdapter(List[SignalOutput])
+
+SignalListResponse = PaginatedResponse[
+    SignalListOutput, Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
+]
+
 
 def list_workspace_asset_division_unit_signals(
     nortech_api: NortechAPI,
@@ -40,22 +51,25 @@ def list_workspace_asset_division_unit_signals(
         ]
     ]
     | None = None,
+    columnar: bool = False,
 ):
     if isinstance(unit, int):
-        return list_unit_signals(nortech_api, unit, pagination_options)
+        return list_unit_signals(nortech_api, unit, pagination_options, columnar)
     if isinstance(unit, UnitListOutput):
-        return list_unit_signals(nortech_api, unit.id, pagination_options)
+        return list_unit_signals(nortech_api, unit.id, pagination_options, columnar)
 
     unit_input = parse_unit_input(unit)
+    url = f"/api/v1/workspaces/{unit_input.workspace}/assets/{unit_input.asset}/divisions/{unit_input.division}/units/{unit_input.unit}/signals"
+    if columnar:
+        return list_columnar(nortech_api, url, SignalListOutput, pagination_options)
+
     response = nortech_api.get(
-        url=f"/api/v1/workspaces/{unit_input.workspace}/assets/{unit_input.asset}/divisions/{unit_input.division}/units/{unit_input.unit}/signals",
+        url=url,
         params=pagination_options.model_dump(exclude_none=True, by_alias=True) if pagination_options else None,
     )
     validate_response(response)
 
-    resp = PaginatedResponse[
-        SignalListOutput, Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
-    ].model_validate({**response.json(), "pagination_options": pagination_options})
+    resp = SignalListResponse.model_validate_page(response.content, pagination_options)
 
     if nortech_api.ignore_pagination and resp.next and resp.next.token:
         next_resp = list_workspace_asset_division_unit_signals(nortech_api, unit, resp.next_pagination_options())
@@ -84,7 +98,7 @@ def get_workspace_asset_division_unit_signal(
         url=f"/api/v1/workspaces/{signal_input.workspace}/assets/{signal_input.asset}/divisions/{signal_input.division}/units/{signal_input.unit}/signals/{signal_input.signal}",
     )
     validate_response(response)
-    return SignalOutput.model_validate(response.json())
+    return SignalOutput.model_validate_json(response.content)
 
 
 def list_workspace_signals(
@@ -101,16 +115,20 @@ def list_workspace_signals(
         ]
     ]
     | None = None,
+    columnar: bool = False,
 ):
+    if columnar:
+        return list_columnar(
+            nortech_api, f"/api/v1/workspaces/{workspace_id}/signals", SignalListOutput, pagination_options
+        )
+
     response = nortech_api.get(
         url=f"/api/v1/workspaces/{workspace_id}/signals",
         params=pagination_options.model_dump(exclude_none=True, by_alias=True) if pagination_options else None,
     )
     validate_response(response)
 
-    resp = PaginatedResponse[
-        SignalListOutput, Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
-    ].model_validate({**response.json(), "pagination_options": pagination_options})
+    resp = SignalListResponse.model_validate_page(response.content, pagination_options)
 
     if nortech_api.ignore_pagination and resp.next and resp.next.token:
         next_resp = list_workspace_signals(nortech_api, workspace_id, resp.next_pagination_options())
@@ -139,18 +157,23 @@ def list_asset_signals(
         ]
     ]
     | None = None,
-) -> PaginatedResponse[
-    SignalListOutput, Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
-]:
+    columnar: bool = False,
+) -> (
+    PaginatedResponse[
+        SignalListOutput, Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
+    ]
+    | ColumnarPaginatedResponse[Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]]
+):
+    if columnar:
+        return list_columnar(nortech_api, f"/api/v1/assets/{asset_id}/signals", SignalListOutput, pagination_options)
+
     response = nortech_api.get(
         url=f"/api/v1/assets/{asset_id}/signals",
         params=pagination_options.model_dump(exclude_none=True, by_alias=True) if pagination_options else None,
     )
     validate_response(response)
 
-    resp = PaginatedResponse[
-        SignalListOutput, Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
-    ].model_validate({**response.json(), "pagination_options": pagination_options})
+    resp = SignalListResponse.model_validate_page(response.content, pagination_options)
 
     if nortech_api.ignore_pagination and resp.next and resp.next.token:
         next_resp = list_asset_signals(nortech_api, asset_id, resp.next_pagination_options())
@@ -179,18 +202,25 @@ def list_division_signals(
         ]
     ]
     | None = None,
-) -> PaginatedResponse[
-    SignalListOutput, Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
-]:
+    columnar: bool = False,
+) -> (
+    PaginatedResponse[
+        SignalListOutput, Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
+    ]
+    | ColumnarPaginatedResponse[Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]]
+):
+    if columnar:
+        return list_columnar(
+            nortech_api, f"/api/v1/divisions/{division_id}/signals", SignalListOutput, pagination_options
+        )
+
     response = nortech_api.get(
         url=f"/api/v1/divisions/{division_id}/signals",
         params=pagination_options.model_dump(exclude_none=True, by_alias=True) if pagination_options else None,
     )
     validate_response(response)
 
-    resp = PaginatedResponse[
-        SignalListOutput, Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
-    ].model_validate({**response.json(), "pagination_options": pagination_options})
+    resp = SignalListResponse.model_validate_page(response.content, pagination_options)
 
     if nortech_api.ignore_pagination and resp.next and resp.next.token:
         next_resp = list_division_signals(nortech_api, division_id, resp.next_pagination_options())
@@ -219,18 +249,23 @@ def list_unit_signals(
         ]
     ]
     | None = None,
-) -> PaginatedResponse[
-    SignalListOutput, Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
-]:
+    columnar: bool = False,
+) -> (
+    PaginatedResponse[
+        SignalListOutput, Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
+    ]
+    | ColumnarPaginatedResponse[Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]]
+):
+    if columnar:
+        return list_columnar(nortech_api, f"/api/v1/units/{unit_id}/signals", SignalListOutput, pagination_options)
+
     response = nortech_api.get(
         url=f"/api/v1/units/{unit_id}/signals",
         params=pagination_options.model_dump(exclude_none=True, by_alias=True) if pagination_options else None,
     )
     validate_response(response)
 
-    resp = PaginatedResponse[
-        SignalListOutput, Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
-    ].model_validate({**response.json(), "pagination_options": pagination_options})
+    resp = SignalListResponse.model_validate_page(response.content, pagination_options)
 
     if nortech_api.ignore_pagination and resp.next and resp.next.token:
         next_resp = list_unit_signals(nortech_api, unit_id, resp.next_pagination_options())
@@ -250,7 +285,7 @@ def get_signal(nortech_api: NortechAPI, signal_id: int):
         url=f"/api/v1/signals/{signal_id}",
     )
     validate_response(response)
-    return SignalOutput.model_validate(response.json())
+    return SignalOutput.model_validate_json(response.content)
 
 
 def _get_signals(
@@ -272,7 +307,78 @@ def _get_signals(
         json={"signals": [signal_to_api_input(signal) for signal in signals]},
     )
     validate_response(response, [200], "Failed to get signals.")
-    return [SignalOutput.model_validate(signal) for signal in response.json()]
+    return SignalOutputList.validate_json(response.content)
+
+
+SignalKey = Union[int, str]
+
+
+def _get_signals_by_key(
+    nortech_api: NortechAPI,
+    signals: Dict[SignalKey, Union[int, SignalInput]],
+) -> Dict[SignalKey, SignalOutput]:
+    response = nortech_api.post(
+        url="/api/v1/signals",
+        json={
+            "signals": [
+                signal if isinstance(signal, int) else signal.model_dump(by_alias=True) for signal in signals.values()
+            ]
+        },
+    )
+
+    if response.status_code == 404:
+        # At least one signal does not exist, split the request to find which ones do.
+        if len(signals) == 1:
+            return {}
+        keys = list(signals)
+        middle = len(keys) // 2
+        return {
+            **_get_signals_by_key(nortech_api, {key: signals[key] for key in keys[:middle]}),
+            **_get_signals_by_key(nortech_api, {key: signals[key] for key in keys[middle:]}),
+        }
+
+    validate_response(response, [200], "Failed to get signals.")
+
+    found: Dict[SignalKey, SignalOutput] = {}
+    for signal in SignalOutputList.validate_json(response.content):
+        for key in (signal.id, signal.to_signal_input().path):
+            if key in signals:
+                found[key] = signal
+    return found
+
+
+def get_signals(
+    nortech_api: NortechAPI,
+    signals: Sequence[int | SignalInputDict | SignalInput | SignalOutput | SignalListOutput],
+    chunk_size: int | None = None,
+    max_workers: int = 4,
+) -> List[SignalOutput | None]:
+    signal_keys: List[SignalKey] = []
+    unique_signals: Dict[SignalKey, Union[int, SignalInput]] = {}
+    for signal in signals:
+        if isinstance(signal, int):
+            key, api_input = signal, signal
+        elif isinstance(signal, SignalListOutput):
+            key, api_input = signal.id, signal.id
+        else:
+            api_input = parse_signal_input(signal)
+            key = api_input.path
+        signal_keys.append(key)
+        unique_signals.setdefault(key, api_input)
+
+    keys = list(unique_signals)
+    chunk_size = chunk_size or nortech_api.settings.SIGNAL_BATCH_SIZE
+    chunks = [
+        {key: unique_signals[key] for key in keys[start : start + chunk_size]}
+        for start in range(0, len(keys), chunk_size)
+    ]
+
+    found: Dict[SignalKey, SignalOutput] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for chunk_found in executor.map(lambda chunk: _get_signals_by_key(nortech_api, chunk), chunks):
+            found.update(chunk_found)
+
+    return [found.get(key) for key in signal_keys]
 
 
 def parse_signal_input_or_output_or_id_union_to_signal_input(
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+from polars import DataFrame as PolarsDataFrame
+from polars import Int64, String, col, concat, concat_str, lit, read_parquet
+from pydantic import TypeAdapter
+
+from nortech.gateways.nortech_api import NortechAPI
+from nortech.metadata.services.asset import list_workspace_assets
+from nortech.metadata.services.division import list_asset_divisions
+from nortech.metadata.services.signal import list_unit_signals
+from nortech.metadata.services.unit import list_division_units
+from nortech.metadata.services.workspace import get_workspace, list_workspaces
+from nortech.metadata.values.signal import SignalInput
+from nortech.metadata.values.workspace import (
+    WorkspaceInput,
+    WorkspaceInputDict,
+    WorkspaceListOutput,
+    WorkspaceOutput,
+)
+
+SignalInputList = TypeAdapter(List[SignalInput])
+
+PATH_COLUMNS = ["workspace", "asset", "division", "unit", "signal"]
+CATALOG_SCHEMA = {
+    **{column: String for column in PATH_COLUMNS},
+    "id": Int64,
+    "data_type": String,
+    "physical_unit": String,
+    "description": String,
+}
+
+
+def _list_all(list_page: Callable[..., Any], *args: Any) -> List[Any]:
+    pages = [list_page(*args)]
+    while pages[-1].next and pages[-1].next.token:
+        pages.append(list_page(*args, pages[-1].next_pagination_options()))
+    return pages
+
+
+def fetch_signal_catalog(
+    nortech_api: NortechAPI,
+    workspace: WorkspaceInputDict | WorkspaceInput | WorkspaceOutput | WorkspaceListOutput | int | str | None = None,
+    max_workers: int = 4,
+) -> PolarsDataFrame:
+    workspaces = (
+        [get_workspace(nortech_api, workspace)]
+        if workspace is not None
+        else [workspace_output for page in _list_all(list_workspaces, nortech_api) for workspace_output in page.data]
+    )
+
+    units: List[Dict[str, Any]] = []
+    for workspace_output in workspaces:
+        for assets in _list_all(list_workspace_assets, nortech_api, workspace_output.id):
+            for asset in assets.data:
+                for divisions in _list_all(list_asset_divisions, nortech_api, asset.id):
+                    for division in divisions.data:
+                        for unit_page in _list_all(list_division_units, nortech_api, division.id):
+                            units.extend(
+                                {
+                                    "id": unit.id,
+                                    "workspace": workspace_output.name,
+                                    "asset": asset.name,
+                                    "division": division.name,
+                                    "unit": unit.name,
+                                }
+                                for unit in unit_page.data
+                            )
+
+    def fetch_unit_signals(unit: Dict[str, Any]) -> PolarsDataFrame:
+        signals = concat(
+            [
+                page.data
+                for page in _list_all(
+                    lambda *args: list_unit_signals(*args, columnar=True),
+                    nortech_api,
+                    unit["id"],
+                )
+            ]
+        )
+        return signals.select(
+            *(lit(unit[column], dtype=String).alias(column) for column in PATH_COLUMNS[:-1]),
+            col("name").alias("signal"),
+            "id",
+            "data_type",
+            "physical_unit",
+            "description",
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        frames = list(executor.map(fetch_unit_signals, units))
+
+    return concat(frames) if frames else PolarsDataFrame(schema=CATALOG_SCHEMA)
+
+
+class _SubstringIndex:
+    """Case insensitive substring index of a column, backed by an inverted index of the trigrams of its values."""
+
+    def __init__(self, values: List[Optional[str]]):
+        rows_by_value: Dict[str, List[int]] = {}
+        for row, value in enumerate(values):
+            if value is not None:
+                rows_by_value.setdefault(value.lower(), []).append(row)
+
+        self.vocabulary = list(rows_by_value)
+        self.rows = [np.array(rows, dtype=np.int64) for rows in rows_by_value.values()]
+
+        trigrams: Dict[str, set[int]] = {}
+        for value_id, value in enumerate(self.vocabulary):
+            for start in range(len(value) - 2):
+                trigrams.setdefault(value[start : start + 3], set()).add(value_id)
+        self.trigrams = trigrams
+
+    def value_ids(self, text: str) -> List[int]:
+        text = text.lower()
+        if len(text) < 3:
+            return [value_id for value_id, value in enumerate(self.vocabulary) if text in value]
+
+        postings = sorted(
+            (self.trigrams.get(text[start : start + 3], set()) for start in range(len(text) - 2)),
+            key=len,
+        )
+        candidates = postings[0].intersection(*postings[1:])
+        return sorted(value_id for value_id in candidates if text in self.vocabulary[value_id])
+
+    def search(self, text: str) -> np.ndarray:
+        value_ids = self.value_ids(text)
+        if not value_ids:
+            return np.empty(0, dtype=np.int64)
+        return np.sort(np.concatenate([self.rows[value_id] for value_id in value_ids]))
+
+
+class SignalCatalog:
+    """
+    Snapshot of signal metadata with a prebuilt search index.
+
+    The signals are kept sorted by path. Path prefixes are looked up by bisection, substrings through trigram
+    inverted indexes over the distinct names of each path level and over descriptions, and data types and physical
+    units through exact value indexes. Regular expressions are matched against the paths left by the other filters.
+
+    Attributes:
+        signals (DataFrame): A polars DataFrame with one row per signal and the columns `workspace`, `asset`,
+            `division`, `unit`, `signal`, `id`, `data_type`, `physical_unit` and `description`.
+
+    """
+
+    def __init__(self, signals: PolarsDataFrame):
+        self.signals = (
+            signals.select(list(CATALOG_SCHEMA))
+            .cast(CATALOG_SCHEMA)  # type: ignore
+            .with_columns(concat_str(PATH_COLUMNS, separator="/").alias("path"))
+            .sort("path")
+        )
+        self._paths: List[str] = self.signals["path"].to_list()
+        self._lowercase_paths = [path.lower() for path in self._paths]
+        self._columns = {column: self.signals[column].to_list() for column in PATH_COLUMNS}
+        self._name_indexes = {column: _SubstringIndex(self._columns[column]) for column in PATH_COLUMNS}
+        self._description_index = _SubstringIndex(self.signals["description"].to_list())
+        self._exact_indexes = {
+            column: {
+                value: np.array(rows, dtype=np.int64)
+                for value, rows in self.signals.with_row_index("row").group_by(column).agg("row").iter_rows()
+                if value is not None
+            }
+            for column in ("data_type", "physical_unit")
+        }
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    @classmethod
+    def load(cls, path: str | Path) -> SignalCatalog:
+        """
+        Load a catalog snapshot saved with `save`.
+
+        Args:
+            path (str | Path): The parquet file of the snapshot.
+
+        Returns:
+            SignalCatalog: The catalog, with its search index rebuilt.
+
+        """
+        return cls(read_parquet(path))
+
+    def save(self, path: str | Path) -> None:
+        """
+        Save the catalog snapshot to a parquet file.
+
+        Args:
+            path (str | Path): The parquet file to write.
+
+        """
+        self.signals.drop("path").write_parquet(path)
+
+    def search(
+        self,
+        prefix: str | None = None,
+        contains: str | None = None,
+        regex: str | re.Pattern[str] | None = None,
+        data_type: str | None = None,
+        physical_unit: str | None = None,
+        description: str | None = None,
+        limit: int | None = None,
+    ) -> List[SignalInput]:
+        """
+        Search signals in the catalog.
+
+        All given filters must match. Paths are the signal names joined by "/", from the workspace to the signal.
+
+        Args:
+            prefix (str | None, optional): Case sensitive prefix of the signal paths, e.g. "my-workspace/my-asset/".
+            contains (str | None, optional): Case insensitive substring of the signal paths.
+            regex (str | Pattern | None, optional): Regular expression searched in the signal paths.
+            data_type (str | None, optional): The data type of the signals.
+            physical_unit (str | None, optional): The physical unit of the signals.
+            description (str | None, optional): Case insensitive substring of the signal descriptions.
+            limit (int | None, optional): The maximum number of signals returned. Defaults to all matches.
+
+        Returns:
+            list[SignalInput]: The matching signals, sorted by path.
+
+        """
+        candidates: List[np.ndarray] = []
+        if prefix is not None:
+            start = bisect_left(self._paths, prefix)
+            end = bisect_left(self._paths, prefix + "\U0010ffff", lo=start)
+            candidates.append(np.arange(start, end, dtype=np.int64))
+        if data_type is not None:
+            candidates.append(self._exact_indexes["data_type"].get(data_type, np.empty(0, dtype=np.int64)))
+        if physical_unit is not None:
+            candidates.append(self._exact_indexes["physical_unit"].get(physical_unit, np.empty(0, dtype=np.int64)))
+        if description is not None:
+            candidates.append(self._description_index.search(description))
+        if contains is not None:
+            candidates.append(self._search_paths(contains))
+
+        rows: np.ndarray | range = range(len(self._paths))
+        if candidates:
+            candidates.sort(key=len)
+            rows = candidates[0]
+            for other in candidates[1:]:
+                rows = np.intersect1d(rows, other, assume_unique=True)
+
+        if regex is not None:
+            pattern = re.compile(regex)
+            rows = [row for row in rows if pattern.search(self._paths[row])]
+
+        if limit is not None:
+            rows = rows[:limit]
+
+        return SignalInputList.validate_python(
+            [{column: self._columns[column][row] for column in PATH_COLUMNS} for row in rows]
+        )
+
+    def _search_paths(self, text: str) -> np.ndarray:
+        if "/" not in text:
+            return np.unique(np.concatenate([index.search(text) for index in self._name_indexes.values()]))
+
+        # Look up the longest piece between separators and check the full text against the candidate paths.
+        piece = max(text.split("/"), key=len)
+        rows = self._search_paths(piece) if piece else np.arange(len(self._paths), dtype=np.int64)
+        text = text.lower()
+        return np.array([row for row in rows if text in self._lowercase_paths[row]], dtype=np.int64)
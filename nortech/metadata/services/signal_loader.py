@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+
+from nortech.gateways.nortech_api import NortechAPI
+from nortech.metadata.services.signal import _get_signals_by_key
+from nortech.metadata.values.errors import SignalNotFoundError
+from nortech.metadata.values.signal import SignalOutput
+
+
+class SignalLoader:
+    """
+    Coalesces signal lookups by ID into bulk requests.
+
+    Lookups queued with `load` are sent as bulk requests of at most `max_batch_size` signals whenever the queue is full,
+    `dispatch` is called, the loader context exits or, if set, `batch_window` seconds have passed since the first
+    queued lookup.
+
+    Attributes:
+        max_batch_size (int): The maximum number of signals fetched per request.
+        batch_window (float | None): The number of seconds to wait for more lookups before dispatching. If None,
+            lookups are only dispatched when the batch is full, `dispatch` is called or the loader context exits.
+        cache (bool): Whether lookups for an ID already requested by this loader reuse the previous result.
+
+    """
+
+    def __init__(
+        self,
+        nortech_api: NortechAPI,
+        max_batch_size: int = 100,
+        batch_window: float | None = None,
+        cache: bool = False,
+    ):
+        self.nortech_api = nortech_api
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window
+        self.cache = cache
+        self._loaded: dict[int, Future[SignalOutput]] = {}
+        self._lock = threading.Lock()
+        self._pending: dict[int, Future[SignalOutput]] = {}
+        self._timer: threading.Timer | None = None
+
+    def __enter__(self) -> SignalLoader:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.dispatch()
+
+    def load(self, signal_id: int) -> Future[SignalOutput]:
+        """
+        Queue a signal lookup.
+
+        Args:
+            signal_id (int): The signal "ID".
+
+        Returns:
+            Future[SignalOutput]: A future resolved with the signal once its batch is fetched. Lookups for the same ID
+                in the same batch, or in the same loader if caching is enabled, share the same future.
+
+        """
+        with self._lock:
+            future = self._pending.get(signal_id) or self._loaded.get(signal_id)
+            if future is not None:
+                return future
+
+            future = Future()
+            self._pending[signal_id] = future
+            if self.cache:
+                self._loaded[signal_id] = future
+
+            full_batch = self._take_pending() if len(self._pending) >= self.max_batch_size else {}
+
+            if self._pending and self.batch_window is not None and self._timer is None:
+                self._timer = threading.Timer(self.batch_window, self.dispatch)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if full_batch:
+            self._fetch(full_batch)
+
+        return future
+
+    def dispatch(self) -> None:
+        """Fetch all queued lookups."""
+        with self._lock:
+            pending = self._take_pending()
+
+        signal_ids = list(pending)
+        for start in range(0, len(signal_ids), self.max_batch_size):
+            self._fetch(
+                {signal_id: pending[signal_id] for signal_id in signal_ids[start : start + self.max_batch_size]}
+            )
+
+    def _take_pending(self) -> dict[int, Future[SignalOutput]]:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        pending = self._pending
+        self._pending = {}
+        return pending
+
+    def _fetch(self, batch: dict[int, Future[SignalOutput]]) -> None:
+        try:
+            signals_by_id = _get_signals_by_key(self.nortech_api, {signal_id: signal_id for signal_id in batch})
+        except Exception as e:
+            for future in batch.values():
+                future.set_exception(e)
+            return
+
+        for signal_id, future in batch.items():
+            if signal_id in signals_by_id:
+                future.set_result(signals_by_id[signal_id])
+            else:
+                future.set_exception(SignalNotFoundError(f"Signal {signal_id} not found."))
@@ -6,6 +6,7 @@ from nortech.gateways.nortech_api import (
     NortechAPI,
     validate_response,
 )
+from nortech.metadata.services.columnar import list_columnar
 from nortech.metadata.services.division import (
     DivisionInput,
     DivisionInputDict,
@@ -14,6 +15,7 @@ from nortech.metadata.services.division import (
     parse_division_input,
 )
 from nortech.metadata.values.pagination import (
+    ColumnarPaginatedResponse,
     PaginatedResponse,
     PaginationOptions,
 )
@@ -25,27 +27,32 @@ from nortech.metadata.values.unit import (
     parse_unit_input,
 )
 
+UnitListResponse = PaginatedResponse[UnitListOutput, Literal["id", "name"]]
+
 
 def list_workspace_asset_division_units(
     nortech_api: NortechAPI,
     division: int | DivisionInputDict | DivisionInput | DivisionOutput | DivisionListOutput,
     pagination_options: PaginationOptions[Literal["id", "name"]] | None = None,
-) -> PaginatedResponse[UnitListOutput, Literal["id", "name"]]:
+    columnar: bool = False,
+) -> PaginatedResponse[UnitListOutput, Literal["id", "name"]] | ColumnarPaginatedResponse[Literal["id", "name"]]:
     if isinstance(division, int):
-        return list_division_units(nortech_api, division, pagination_options)
+        return list_division_units(nortech_api, division, pagination_options, columnar)
     if isinstance(division, DivisionListOutput):
-        return list_division_units(nortech_api, division.id, pagination_options)
+        return list_division_units(nortech_api, division.id, pagination_options, columnar)
 
     division_input = parse_division_input(division)
+    url = f"/api/v1/workspaces/{division_input.workspace}/assets/{division_input.asset}/divisions/{division_input.division}/units"
+    if columnar:
+        return list_columnar(nortech_api, url, UnitListOutput, pagination_options)
+
     response = nortech_api.get(
-        url=f"/api/v1/workspaces/{division_input.workspace}/assets/{division_input.asset}/divisions/{division_input.division}/units",
+        url=url,
         params=pagination_options.model_dump(exclude_none=True, by_alias=True) if pagination_options else None,
     )
     validate_response(response)
 
-    resp = PaginatedResponse[UnitListOutput, Literal["id", "name"]].model_validate(
-        {**response.json(), "pagination_options": pagination_options}
-    )
+    resp = UnitListResponse.model_validate_page(response.content, pagination_options)
 
     if nortech_api.ignore_pagination and resp.next and resp.next.token:
         next_resp = list_workspace_asset_division_units(nortech_api, division, resp.next_pagination_options())
@@ -74,23 +81,27 @@ def get_workspace_asset_division_unit(
         url=f"/api/v1/workspaces/{unit_input.workspace}/assets/{unit_input.asset}/divisions/{unit_input.division}/units/{unit_input.unit}",
     )
     validate_response(response)
-    return UnitOutput.model_validate(response.json())
+    return UnitOutput.model_validate_json(response.content)
 
 
 def list_workspace_units(
     nortech_api: NortechAPI,
     workspace_id: int,
     pagination_options: PaginationOptions[Literal["id", "name"]] | None = None,
-) -> PaginatedResponse[UnitListOutput, Literal["id", "name"]]:
+    columnar: bool = False,
+) -> PaginatedResponse[UnitListOutput, Literal["id", "name"]] | ColumnarPaginatedResponse[Literal["id", "name"]]:
+    if columnar:
+        return list_columnar(
+            nortech_api, f"/api/v1/workspaces/{workspace_id}/units", UnitListOutput, pagination_options
+        )
+
     response = nortech_api.get(
         url=f"/api/v1/workspaces/{workspace_id}/units",
         params=pagination_options.model_dump(exclude_none=True, by_alias=True) if pagination_options else None,
     )
     validate_response(response)
 
-    resp = PaginatedResponse[UnitListOutput, Literal["id", "name"]].model_validate(
-        {**response.json(), "pagination_options": pagination_options}
-    )
+    resp = UnitListResponse.model_validate_page(response.content, pagination_options)
 
     if nortech_api.ignore_pagination and resp.next and resp.next.token:
         next_resp = list_workspace_units(nortech_api, workspace_id, resp.next_pagination_options())
@@ -109,16 +120,18 @@ def list_asset_units(
     nortech_api: NortechAPI,
     asset_id: int,
     pagination_options: PaginationOptions[Literal["id", "name"]] | None = None,
-) -> PaginatedResponse[UnitListOutput, Literal["id", "name"]]:
+    columnar: bool = False,
+) -> PaginatedResponse[UnitListOutput, Literal["id", "name"]] | ColumnarPaginatedResponse[Literal["id", "name"]]:
+    if columnar:
+        return list_columnar(nortech_api, f"/api/v1/assets/{asset_id}/units", UnitListOutput, pagination_options)
+
     response = nortech_api.get(
         url=f"/api/v1/assets/{asset_id}/units",
         params=pagination_options.model_dump(exclude_none=True, by_alias=True) if pagination_options else None,
     )
     validate_response(response)
 
-    resp = PaginatedResponse[UnitListOutput, Literal["id", "name"]].model_validate(
-        {**response.json(), "pagination_options": pagination_options}
-    )
+    resp = UnitListResponse.model_validate_page(response.content, pagination_options)
 
     if nortech_api.ignore_pagination and resp.next and resp.next.token:
         next_resp = list_asset_units(nortech_api, asset_id, resp.next_pagination_options())
@@ -137,16 +150,18 @@ def list_division_units(
     nortech_api: NortechAPI,
     division_id: int,
     pagination_options: PaginationOptions[Literal["id", "name"]] | None = None,
-) -> PaginatedResponse[UnitListOutput, Literal["id", "name"]]:
+    columnar: bool = False,
+) -> PaginatedResponse[UnitListOutput, Literal["id", "name"]] | ColumnarPaginatedResponse[Literal["id", "name"]]:
+    if columnar:
+        return list_columnar(nortech_api, f"/api/v1/divisions/{division_id}/units", UnitListOutput, pagination_options)
+
     response = nortech_api.get(
         url=f"/api/v1/divisions/{division_id}/units",
         params=pagination_options.model_dump(exclude_none=True, by_alias=True) if pagination_options else None,
     )
     validate_response(response)
 
-    resp = PaginatedResponse[UnitListOutput, Literal["id", "name"]].model_validate(
-        {**response.json(), "pagination_options": pagination_options}
-    )
+    resp = UnitListResponse.model_validate_page(response.content, pagination_options)
 
     if nortech_api.ignore_pagination and resp.next and resp.next.token:
         next_resp = list_division_units(nortech_api, division_id, resp.next_pagination_options())
@@ -166,4 +181,4 @@ def get_unit(nortech_api: NortechAPI, unit_id: int):
         url=f"/api/v1/units/{unit_id}",
     )
     validate_response(response)
-    return UnitOutput.model_validate(response.json())
+    return UnitOutput.model_validate_json(response.content)
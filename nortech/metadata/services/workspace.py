@@ -18,6 +18,8 @@ from nortech.metadata.values.workspace import (
     parse_workspace_input,
 )
 
+WorkspaceListResponse = PaginatedResponse[WorkspaceListOutput, Literal["id", "name", "description"]]
+
 
 def list_workspaces(
     nortech_api: NortechAPI,
@@ -29,9 +31,7 @@ def list_workspaces(
     )
     validate_response(response)
 
-    resp = PaginatedResponse[WorkspaceListOutput, Literal["id", "name", "description"]].model_validate(
-        {**response.json(), "pagination_options": pagination_options}
-    )
+    resp = WorkspaceListResponse.model_validate_page(response.content, pagination_options)
 
     if nortech_api.ignore_pagination and resp.next and resp.next.token:
         next_resp = list_workspaces(nortech_api, resp.next_pagination_options())
@@ -52,4 +52,4 @@ def get_workspace(
     workspace_input = parse_workspace_input(workspace)
     response = nortech_api.get(url=f"/api/v1/workspaces/{workspace_input}")
     validate_response(response)
-    return WorkspaceOutput.model_validate(response.json())
+    return WorkspaceOutput.model_validate_json(response.content)
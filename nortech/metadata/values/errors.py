@@ -0,0 +1,4 @@
+class SignalNotFoundError(Exception):
+    def __init__(self, message="Signal not found"):
+        self.message = message
+        super().__init__(self.message)
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from typing import Generic, Literal, TypeVar
+from datetime import datetime
+from typing import Any, Dict, Generic, List, Literal, Sequence, TypeVar, get_args, get_origin
 
+from polars import Boolean, Datetime, Float64, Int64, Object, String, from_dicts
+from polars import DataFrame as PolarsDataFrame
+from pyarrow import Table
 from pydantic import BaseModel, ConfigDict, Field
 
 SortBy = TypeVar("SortBy")
@@ -34,6 +38,35 @@ class NextRef(BaseModel):
 Resp = TypeVar("Resp")
 
 
+def _polars_dtype(annotation: Any):
+    if get_origin(annotation) is Literal:
+        return String
+    if type(None) in get_args(annotation):
+        not_none = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _polars_dtype(not_none[0]) if len(not_none) == 1 else Object
+    return {bool: Boolean, int: Int64, float: Float64, str: String, datetime: Datetime("us", "UTC")}.get(
+        annotation, Object
+    )
+
+
+def polars_schema(model: type[BaseModel], by_alias: bool = False) -> Dict[str, Any]:
+    """Polars schema of a model, with one column per model field."""
+    return {
+        (field.alias or name) if by_alias else name: _polars_dtype(field.annotation)
+        for name, field in model.model_fields.items()
+    }
+
+
+def polars_frame_from_dicts(
+    rows: Sequence[Dict[str, Any]], model: type[BaseModel], by_alias: bool = False
+) -> PolarsDataFrame:
+    """Build a polars DataFrame of a model's fields from its dictionaries, without instancing the model."""
+    frame = from_dicts(rows, schema=polars_schema(model, by_alias=by_alias))
+    if by_alias:
+        frame = frame.rename({field.alias: name for name, field in model.model_fields.items() if field.alias})
+    return frame
+
+
 class PaginatedResponse(BaseModel, Generic[Resp, SortBy]):
     """
     Paginated response from list endpoints.
@@ -56,3 +89,85 @@ class PaginatedResponse(BaseModel, Generic[Resp, SortBy]):
         if self.pagination_options:
             return self.pagination_options.model_copy(update={"next_token": self.next.token})
         return PaginationOptions(nextToken=self.next.token)
+
+    @classmethod
+    def model_validate_page(cls, content: bytes | str, pagination_options: PaginationOptions[SortBy] | None = None):
+        """Validate a list endpoint page straight from its JSON body."""
+        resp = cls.model_validate_json(content)
+        if pagination_options is not None:
+            resp.pagination_options = pagination_options
+        return resp
+
+    def to_polars(self) -> PolarsDataFrame:
+        """
+        Convert the listed items to a polars DataFrame.
+
+        Returns:
+            DataFrame: A polars DataFrame with one column per item field.
+
+        """
+        resp_type = (
+            self.__pydantic_generic_metadata__["args"][0] if self.__pydantic_generic_metadata__["args"] else None
+        )
+        if not isinstance(resp_type, type) or not issubclass(resp_type, BaseModel):
+            if not self.data:
+                return PolarsDataFrame()
+            resp_type = type(self.data[0])
+
+        return polars_frame_from_dicts([item.model_dump() for item in self.data], resp_type)  # type: ignore
+
+    def to_arrow(self) -> Table:
+        """
+        Convert the listed items to an Arrow table.
+
+        Returns:
+            Table: An Arrow table with one column per item field.
+
+        """
+        return self.to_polars().to_arrow()
+
+
+class ColumnarPaginatedResponse(BaseModel, Generic[SortBy]):
+    """
+    Paginated response from list endpoints, with the items stored as columns instead of pydantic models.
+
+    Attributes:
+        size (int): The number of items returned.
+        data (DataFrame): A polars DataFrame with one row per item and one column per item field.
+        next.token (str | None): The next token to use for pagination. If None, there are no more pages.
+
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    size: int
+    data: PolarsDataFrame
+    next: NextRef | None = None
+    pagination_options: PaginationOptions[SortBy] | None = None
+
+    def next_pagination_options(self) -> PaginationOptions[SortBy] | None:
+        if not self.next:
+            return None
+        if self.pagination_options:
+            return self.pagination_options.model_copy(update={"next_token": self.next.token})
+        return PaginationOptions(nextToken=self.next.token)
+
+    def to_polars(self) -> PolarsDataFrame:
+        return self.data
+
+    def to_arrow(self) -> Table:
+        return self.data.to_arrow()
+
+
+def columnar_paginated_response_from_pages(
+    pages: List[Dict[str, Any]],
+    model: type[BaseModel],
+    pagination_options: PaginationOptions[SortBy] | None = None,
+) -> ColumnarPaginatedResponse[SortBy]:
+    """Merge raw list endpoint pages into a single columnar response."""
+    return ColumnarPaginatedResponse(
+        size=sum(page["size"] for page in pages),
+        data=polars_frame_from_dicts([item for page in pages for item in page["data"]], model, by_alias=True),
+        next=pages[-1].get("next"),
+        pagination_options=pagination_options,
+    )
@@ -1,4 +1,7 @@
-from datetime import datetime
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import List
 
 from pydantic import BaseModel, model_validator
 from tzlocal import get_localzone
@@ -49,3 +52,26 @@ class TimeWindow(BaseModel):
         self.start = start
         self.end = end
         return self
+
+    def split(self, duration: timedelta) -> List[TimeWindow]:
+        """
+        Split the time window into consecutive time windows of at most `duration`.
+
+        Args:
+            duration (timedelta): The maximum duration of each time window.
+
+        Returns:
+            list[TimeWindow]: The time windows, in order. Each one starts at the end of the previous one.
+
+        """
+        if duration <= timedelta(0):
+            raise ValueError("duration must be positive")
+
+        windows: List[TimeWindow] = []
+        start = self.start
+        while True:
+            end = min(start + duration, self.end)
+            windows.append(TimeWindow(start=start, end=end))
+            if end >= self.end:
+                return windows
+            start = end
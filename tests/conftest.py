@@ -5,6 +5,8 @@ from nortech.gateways.nortech_api import (
     NortechAPISettings,
 )
 
+pytest_plugins = ["nortech.derivers.pytest_plugin"]
+
 
 @pytest.fixture(scope="session", name="nortech_api_settings")
 def nortech_api_settings_fixture() -> NortechAPISettings:
@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta, timezone
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+from requests_mock import Mocker
+
+from nortech import Nortech
+from nortech.datatools import TimeWindow
+from nortech.metadata import SignalInput, SignalOutput
+
+
+def test_get_df_with_units(
+    nortech: Nortech,
+    data_signal_input: SignalInput,
+    data_signal_output: SignalOutput,
+    requests_mock: Mocker,
+):
+    temperature_signal = data_signal_output.model_copy(update={"physical_unit": "degC"})
+    power_signal = data_signal_output.model_copy(
+        update={"id": 3, "name": data_signal_input.signal, "physical_unit": "kW"}
+    )
+    signal_inputs = [data_signal_input, temperature_signal.to_signal_input()]
+
+    def get_signals(request, context) -> str:
+        # Signal outputs are requested by id, signal inputs by their names.
+        signal = temperature_signal if request.json()["signals"] == [temperature_signal.id] else power_signal
+        return f"[{signal.model_dump_json(by_alias=True)}]"
+
+    requests_mock.post(f"{nortech.settings.URL}/api/v1/signals", text=get_signals)
+
+    end = datetime.now(timezone.utc) - timedelta(days=1, seconds=10)
+    time_window = TimeWindow(start=end - timedelta(days=1), end=end)
+
+    values = {signal.path: np.random.rand(24) * 100 for signal in signal_inputs}
+    parquet_df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range(end=end, periods=24, freq="h").round("ms").astype("datetime64[ms, UTC]"),
+            **{signal.hash(): values[signal.path] for signal in signal_inputs},
+        }
+    )
+    parquet_content = BytesIO()
+    parquet_df.to_parquet(parquet_content, index=False, engine="pyarrow")
+
+    parquet_url = "http://parquet.file/"
+    requests_mock.post(nortech.settings.URL + "/api/v1/historical-data/sync", json={"outputFile": parquet_url})
+    requests_mock.get(parquet_url, content=parquet_content.getvalue())
+
+    df = nortech.datatools.pandas.get_df(
+        signals=[data_signal_input, temperature_signal],
+        time_window=time_window,
+        units={data_signal_input.path: "W", temperature_signal.to_signal_input().path: "degF"},
+    )
+
+    pdt.assert_frame_equal(
+        df,
+        pd.DataFrame(
+            {
+                data_signal_input.path: values[data_signal_input.path] * 1000,
+                temperature_signal.to_signal_input().path: values[temperature_signal.to_signal_input().path] * 1.8 + 32,
+            },
+            index=parquet_df["timestamp"],
+        ),
+    )
+
+    # The metadata of signal outputs is not fetched again for their units.
+    assert [request.json() for request in requests_mock.request_history[:2]] == [
+        {"signals": [temperature_signal.id]},
+        {"signals": [data_signal_input.model_dump(by_alias=True)]},
+    ]
+
+    with pytest.raises(ValueError, match="incompatible units"):
+        nortech.datatools.polars.get_df(
+            signals=[temperature_signal],
+            time_window=time_window,
+            units={temperature_signal.to_signal_input().path: "W"},
+        )
+
+    with pytest.raises(ValueError, match="not retrieved"):
+        nortech.datatools.polars.get_df(signals=[temperature_signal], time_window=time_window, units={"a/b/c/d/e": "W"})
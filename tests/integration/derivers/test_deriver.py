@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-from datetime import timezone
+import gc
+import weakref
+from datetime import datetime, timedelta, timezone
+from inspect import getsource
 
 import bytewax.operators as op
 import pandas as pd
+import pandas.testing as pdt
+import polars as pl
 import pytest
+from bytewax.errors import BytewaxRuntimeError
 
 from nortech import Nortech
 from nortech.derivers import (
@@ -13,9 +19,27 @@ from nortech.derivers import (
     DeriverInputs,
     DeriverOutput,
     DeriverOutputs,
+    TimeWindow,
+    follow_deriver_locally,
+    operators,
+    run_deriver_backfill_locally,
+    run_deriver_locally_in_parallel_with_df,
     run_deriver_locally_with_df,
+    run_deriver_locally_with_polars_df,
+    run_deriver_locally_with_source_data,
+    run_derivers_locally_with_source_data,
+    sync_derivers,
 )
-from nortech.derivers.values.deriver import InvalidDeriverError, validate_deriver
+from nortech.derivers.services.backfill import BackfillSource
+from nortech.derivers.services.load_test import synthetic_inputs
+from nortech.derivers.services.nortech_api import DeployedDeriverList
+from nortech.derivers.values.deriver import (
+    InvalidDeriverError,
+    describe_fields,
+    get_deriver_from_script,
+    validate_deriver,
+)
+from nortech.metadata.values.pagination import PaginatedResponse
 
 
 def test_validate_deriver_not_subclass():
@@ -166,3 +190,640 @@ def test_deriver_run_locally(nortech: Nortech):
     print(renamed_df)
 
     assert output_deriver.equals(renamed_df)
+
+
+class TestBatchDeriver(TestDeriver):
+    def run_batch(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df.rename(columns={"input_signal": "output_signal"})
+
+
+def test_deriver_run_locally_batch_mode():
+    size = 100
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range(start="2023-01-01", periods=size, freq="s", tz=timezone.utc),
+            "input_signal": [float(i) for i in range(size)],
+        }
+    ).set_index("timestamp")
+
+    output_deriver = run_deriver_locally_with_df(deriver=TestBatchDeriver, df=df, batch_size=30, batch_mode=True)
+
+    assert output_deriver.equals(run_deriver_locally_with_df(deriver=TestBatchDeriver, df=df))
+
+
+def test_deriver_run_locally_batch_mode_without_run_batch():
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range(start="2023-01-01", periods=10, freq="s", tz=timezone.utc),
+            "input_signal": [float(i) for i in range(10)],
+        }
+    ).set_index("timestamp")
+
+    with pytest.raises(InvalidDeriverError) as exc_info:
+        run_deriver_locally_with_df(deriver=TestDeriver, df=df, batch_mode=True)
+    assert str(exc_info.value) == "Deriver must implement the run_batch method to run in batch mode."
+
+
+class TestRunningSumDeriver(TestDeriver):
+    def run(self, stream: op.Stream[TestDeriver.Inputs]) -> op.Stream[TestDeriver.Outputs]:
+        keyed_stream = op.key_on("key_all", stream, lambda _: "ALL")
+        summed_stream = op.stateful_map(
+            "running_sum",
+            keyed_stream,
+            lambda state, item: (
+                ((state or []) + [item.input_signal])[-3:],
+                self.Outputs(timestamp=item.timestamp, output_signal=sum(((state or []) + [item.input_signal])[-3:])),
+            ),
+        )
+        return op.map("unkey", summed_stream, lambda item: item[1])
+
+
+def test_deriver_run_locally_in_parallel_time_chunks():
+    size = 100
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range(start="2023-01-01", periods=size, freq="s", tz=timezone.utc),
+            "input_signal": [float(i) for i in range(size)],
+        }
+    ).set_index("timestamp")
+
+    output_deriver = run_deriver_locally_in_parallel_with_df(
+        deriver=TestRunningSumDeriver,
+        df=df,
+        workers=2,
+        time_chunk=timedelta(seconds=10),
+        warm_up=timedelta(seconds=2),
+    )
+
+    assert output_deriver.equals(run_deriver_locally_with_df(deriver=TestRunningSumDeriver, df=df))
+
+
+class TestWindowSumDeriver(TestDeriver):
+    def run(self, stream: op.Stream[TestDeriver.Inputs]) -> op.Stream[TestDeriver.Outputs]:
+        summed_stream = operators.incremental_resample("sum", stream, timedelta(seconds=4), "sum")
+        return op.map(
+            "map_output",
+            summed_stream,
+            lambda item: self.Outputs(timestamp=item.timestamp, output_signal=item.input_signal),
+        )
+
+
+def test_deriver_run_locally_in_parallel_time_chunks_aligned_to_windows():
+    size = 100
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range(start="2023-01-01 00:00:03", periods=size, freq="s", tz=timezone.utc),
+            "input_signal": [float(i) for i in range(size)],
+        }
+    ).set_index("timestamp")
+
+    output_deriver = run_deriver_locally_in_parallel_with_df(
+        deriver=TestWindowSumDeriver, df=df, workers=2, time_chunk=timedelta(seconds=12)
+    )
+
+    assert output_deriver.equals(run_deriver_locally_with_df(deriver=TestWindowSumDeriver, df=df))
+
+
+def test_deriver_run_locally_in_parallel_partition_by():
+    timestamps = pd.date_range(start="2023-01-01", periods=10, freq="s", tz=timezone.utc)
+    df = pd.DataFrame(
+        {
+            "timestamp": list(timestamps) * 2,
+            "input_signal": [float(i) for i in range(20)],
+            "asset": ["asset_1"] * 10 + ["asset_2"] * 10,
+        }
+    ).set_index("timestamp")
+
+    output_deriver = run_deriver_locally_in_parallel_with_df(
+        deriver=TestRunningSumDeriver, df=df, workers=2, partition_by="asset"
+    )
+
+    for asset in ["asset_1", "asset_2"]:
+        asset_df = df[df["asset"] == asset].drop(columns="asset")
+        assert (
+            output_deriver[output_deriver["asset"] == asset]
+            .drop(columns="asset")
+            .equals(run_deriver_locally_with_df(deriver=TestRunningSumDeriver, df=asset_df))
+        )
+    assert output_deriver.index.is_monotonic_increasing
+
+
+def test_deriver_run_locally_with_source_data_in_chunks(nortech: Nortech, monkeypatch: pytest.MonkeyPatch, tmp_path):
+    size = 100
+    source_df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range(start="2023-01-01", periods=size, freq="s", tz=timezone.utc),
+            "Workspace/Asset/Division/Unit/Signal": [float(i) for i in range(size)],
+        }
+    ).set_index("timestamp")
+    fetched_time_windows = []
+
+    def get_df(nortech_api, signals, time_window):
+        fetched_time_windows.append(time_window)
+        return source_df[(source_df.index >= time_window.start) & (source_df.index <= time_window.end)]
+
+    monkeypatch.setattr("nortech.datatools.handlers.pandas.get_df", get_df)
+    monkeypatch.setattr("nortech.derivers.handlers.deriver.get_df", get_df)
+    time_window = TimeWindow(
+        start=datetime(2023, 1, 1, tzinfo=timezone.utc), end=datetime(2023, 1, 1, 0, 1, 39, tzinfo=timezone.utc)
+    )
+
+    expected_df = run_deriver_locally_with_source_data(nortech.api, TestRunningSumDeriver, time_window)
+    assert expected_df is not None and len(expected_df) == size
+
+    fetched_time_windows.clear()
+    output_deriver = run_deriver_locally_with_source_data(
+        nortech.api, TestRunningSumDeriver, time_window, batch_size=7, chunk=timedelta(seconds=30), prefetch=2
+    )
+    assert [window.start.second + 60 * window.start.minute for window in fetched_time_windows] == [0, 30, 60, 90]
+    assert output_deriver is not None and output_deriver.equals(expected_df)
+
+    output_path = tmp_path / "outputs.parquet"
+    assert (
+        run_deriver_locally_with_source_data(
+            nortech.api,
+            TestRunningSumDeriver,
+            time_window,
+            batch_size=7,
+            chunk=timedelta(seconds=30),
+            output_path=output_path,
+        )
+        is None
+    )
+    # Parquet files store microsecond timestamps, which older pandas versions do not read back as nanoseconds.
+    pdt.assert_frame_equal(pd.read_parquet(output_path).set_index("timestamp"), expected_df, check_index_type=False)
+
+
+def test_deriver_backfill_locally_resumes_from_checkpoint(nortech: Nortech, monkeypatch: pytest.MonkeyPatch, tmp_path):
+    size = 200
+    source_df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range(start="2023-01-01", periods=size, freq="s", tz=timezone.utc),
+            "Workspace/Asset/Division/Unit/Signal": [float(i) for i in range(size)],
+        }
+    ).set_index("timestamp")
+    fetched_time_windows = []
+    failures = [source_df.index[100]]
+
+    def get_df(nortech_api, signals, time_window):
+        fetched_time_windows.append(time_window)
+        if time_window.start in failures:
+            failures.remove(time_window.start)
+            raise RuntimeError("Connection lost")
+        return source_df[(source_df.index >= time_window.start) & (source_df.index <= time_window.end)]
+
+    monkeypatch.setattr("nortech.datatools.handlers.pandas.get_df", get_df)
+    time_window = TimeWindow(start=source_df.index[0].to_pydatetime(), end=source_df.index[-1].to_pydatetime())
+    backfill = {
+        "nortech_api": nortech.api,
+        "deriver": TestRunningSumDeriver,
+        "time_window": time_window,
+        "chunk": timedelta(seconds=20),
+        "checkpoint_dir": tmp_path,
+        "checkpoint_interval": timedelta(0),
+        "batch_size": 7,
+    }
+
+    with pytest.raises(BytewaxRuntimeError):
+        run_deriver_backfill_locally(**backfill)
+
+    fetched_time_windows.clear()
+    output_deriver = run_deriver_backfill_locally(**backfill)
+    assert fetched_time_windows[0].start > time_window.start
+
+    expected_df = run_deriver_locally_with_df(
+        deriver=TestRunningSumDeriver,
+        df=source_df.rename(columns={"Workspace/Asset/Division/Unit/Signal": "input_signal"}),
+    )
+    assert output_deriver.equals(expected_df)
+
+    fetched_time_windows.clear()
+    assert run_deriver_backfill_locally(**backfill).equals(expected_df)
+    assert fetched_time_windows == []
+
+    # A backfill stopped after its last snapshot resumes without fetching any chunk.
+    (tmp_path / "complete").unlink()
+    assert run_deriver_backfill_locally(**backfill).equals(expected_df)
+    assert fetched_time_windows == []
+    time_windows = time_window.split(backfill["chunk"])
+    source = BackfillSource(time_windows, lambda _: iter([source_df]), TestRunningSumDeriver.Inputs)
+    source.build_part("input", "chunks", (len(time_windows), 0)).close()
+
+    with pytest.raises(ValueError):
+        run_deriver_backfill_locally(**{**backfill, "chunk": timedelta(seconds=10)})
+
+    monkeypatch.setattr("nortech.derivers.services.backfill.deriver_source_hash", lambda source: "changed")
+    with pytest.raises(ValueError):
+        run_deriver_backfill_locally(**backfill)
+
+
+def test_deriver_introspection_is_cached_without_keeping_derivers_alive():
+    deriver = validate_deriver(get_deriver_from_script(getsource(TestDeriver)))
+
+    assert describe_fields(deriver.Inputs, "DeriverInput") is describe_fields(deriver.Inputs, "DeriverInput")
+    assert deriver.Inputs.list() == TestDeriver.Inputs.list()
+    assert deriver.Outputs.list_types() == TestDeriver.Outputs.list_types()
+
+    # A redefined deriver is a new class, which is introspected again.
+    redefined_deriver = get_deriver_from_script(getsource(TestDeriver).replace("float | None", "str | None"))
+    assert redefined_deriver.Outputs.list_types() == [("output_signal", str)]
+
+    refs = [weakref.ref(cls) for cls in (deriver, deriver.Inputs, deriver.Outputs)]
+    del deriver
+    gc.collect()
+    assert [ref() for ref in refs] == [None, None, None]
+
+
+def test_deployed_deriver_list_compiles_deriver_lazily(monkeypatch: pytest.MonkeyPatch):
+    definition = "class ListedDeriver(TestDeriver): ..."
+    compiled_definitions = []
+
+    def get_deriver_from_script(script: str):
+        compiled_definitions.append(script)
+        return TestDeriver
+
+    monkeypatch.setattr("nortech.derivers.services.nortech_api.get_deriver_from_script", get_deriver_from_script)
+
+    deployed_derivers = [
+        DeployedDeriverList.model_validate(
+            {"definition": definition, "description": None, "startAt": None, "status": "RUNNING"}
+        )
+        for _ in range(3)
+    ]
+    assert compiled_definitions == []
+
+    assert all(deployed_deriver.deriver is TestDeriver for deployed_deriver in deployed_derivers)
+    assert compiled_definitions == [definition]
+
+
+def test_deployed_deriver_list_dumps_and_releases_compiled_deriver():
+    deployed_deriver = DeployedDeriverList.model_validate(
+        {"definition": getsource(TestDeriver), "description": None, "startAt": None, "status": "RUNNING"}
+    )
+    deriver = deployed_deriver.deriver
+
+    assert deployed_deriver.model_dump() == {
+        "description": None,
+        "start_at": None,
+        "status": "RUNNING",
+        "deriver": deriver,
+    }
+    assert deployed_deriver.model_dump(by_alias=True)["definition"] is deriver
+    assert "deriver=" in repr(deployed_deriver)
+    assert "definition=" not in repr(deployed_deriver)
+
+    deriver_ref = weakref.ref(deriver)
+    del deployed_deriver, deriver
+    gc.collect()
+
+    assert deriver_ref() is None
+
+
+def test_sync_derivers_skips_unchanged_derivers(nortech: Nortech, monkeypatch: pytest.MonkeyPatch):
+    class ChangedDeriver(TestDeriver): ...
+
+    class NewDeriver(TestDeriver): ...
+
+    # The deployed definition differs from the local source only in formatting and comments.
+    unchanged_definition = "# Deployed\n" + getsource(TestDeriver).replace("step_id=", "step_id = ")
+    deployed_pages = [
+        {
+            "data": [{"definition": unchanged_definition, "startAt": None, "status": "RUNNING"}],
+            "size": 1,
+            "next": {"token": "page-2"},
+        },
+        {
+            "data": [{"definition": "class ChangedDeriver(Deriver): ...", "startAt": None, "status": "RUNNING"}],
+            "size": 1,
+        },
+    ]
+    requests = []
+
+    def list_derivers(nortech_api, pagination_options=None):
+        requests.append(("list", pagination_options.next_token if pagination_options else ""))
+        return PaginatedResponse[DeployedDeriverList, str].model_validate(deployed_pages[len(requests) - 1])
+
+    monkeypatch.setattr("nortech.derivers.handlers.deriver.list_derivers_api", list_derivers)
+    monkeypatch.setattr(
+        "nortech.derivers.handlers.deriver.create_deriver_api",
+        lambda nortech_api, deriver, *args: requests.append(("create", deriver.__name__)),
+    )
+    monkeypatch.setattr(
+        "nortech.derivers.handlers.deriver.update_deriver_api",
+        lambda nortech_api, deriver, *args, **kwargs: requests.append(("update", deriver.__name__)),
+    )
+
+    summary = sync_derivers(nortech.api, [TestDeriver, ChangedDeriver, NewDeriver], max_workers=2)
+    assert summary.created == ["NewDeriver"]
+    assert summary.updated == ["ChangedDeriver"]
+    assert summary.unchanged == ["TestDeriver"]
+    assert summary.failed == {}
+    assert sorted(requests) == [
+        ("create", "NewDeriver"),
+        ("list", ""),
+        ("list", "page-2"),
+        ("update", "ChangedDeriver"),
+    ]
+
+    with pytest.raises(ValueError):
+        sync_derivers(nortech.api, [TestDeriver, TestDeriver])
+
+
+def fused_deriver(input_name: str, output_name: str, deriver: type[Deriver]) -> type[Deriver]:
+    class FusedDeriver(deriver):
+        class Inputs(DeriverInputs):
+            input_signal: float | None = DeriverInput(
+                workspace="Workspace", asset="Asset", division="Division", unit="Unit", signal=input_name
+            )
+
+        class Outputs(DeriverOutputs):
+            output_signal: float | None = DeriverOutput(
+                workspace="Workspace", asset="Asset", division="Division", unit="Unit", signal=output_name
+            )
+
+    FusedDeriver.__name__ = f"{output_name}Deriver"
+    return FusedDeriver
+
+
+def test_derivers_run_locally_with_source_data_in_one_dataflow(nortech: Nortech, monkeypatch: pytest.MonkeyPatch):
+    size = 50
+    source_df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range(start="2023-01-01", periods=size, freq="s", tz=timezone.utc),
+            "Workspace/Asset/Division/Unit/Signal": [float(i) for i in range(size)],
+            "Workspace/Asset/Division/Unit/Other": [float(i) if i % 2 else None for i in range(size)],
+        }
+    ).set_index("timestamp")
+    fetched_signals = []
+
+    def get_df(nortech_api, signals, time_window):
+        fetched_signals.append(sorted(signal.path for signal in signals))
+        return source_df[[signal.path for signal in signals]].dropna(how="all")
+
+    monkeypatch.setattr("nortech.derivers.handlers.deriver.get_df", get_df)
+    time_window = TimeWindow(start=source_df.index[0].to_pydatetime(), end=source_df.index[-1].to_pydatetime())
+
+    # Copy and Sum both use the step id of TestDeriver, and Sum reads the output of Copy.
+    summed = fused_deriver("Copy", "Sum", TestRunningSumDeriver)
+    copied = fused_deriver("Signal", "Copy", TestDeriver)
+    other = fused_deriver("Other", "OtherSum", TestRunningSumDeriver)
+    output_derivers = run_derivers_locally_with_source_data(nortech.api, [summed, copied, other], time_window)
+    assert fetched_signals == [["Workspace/Asset/Division/Unit/Other", "Workspace/Asset/Division/Unit/Signal"]]
+
+    expected_copy = run_deriver_locally_with_df(
+        copied, source_df[["Workspace/Asset/Division/Unit/Signal"]].set_axis(["input_signal"], axis=1)
+    )
+    assert output_derivers["CopyDeriver"].equals(expected_copy)
+    assert output_derivers["SumDeriver"].equals(
+        run_deriver_locally_with_df(summed, expected_copy.rename(columns={"output_signal": "input_signal"}))
+    )
+    assert output_derivers["OtherSumDeriver"].equals(
+        run_deriver_locally_with_df(
+            other, source_df[["Workspace/Asset/Division/Unit/Other"]].dropna().set_axis(["input_signal"], axis=1)
+        )
+    )
+
+    with pytest.raises(ValueError):
+        run_derivers_locally_with_source_data(nortech.api, [TestDeriver], time_window)
+
+
+class TestMixedDeriver(Deriver):
+    class Inputs(DeriverInputs):
+        source_signal: float | None = DeriverInput(
+            workspace="Workspace", asset="Asset", division="Division", unit="Unit", signal="Other"
+        )
+        copied_signal: float | None = DeriverInput(
+            workspace="Workspace", asset="Asset", division="Division", unit="Unit", signal="Copy"
+        )
+
+    class Outputs(DeriverOutputs):
+        output_signal: float | None = DeriverOutput(
+            workspace="Workspace", asset="Asset", division="Division", unit="Unit", signal="Mixed"
+        )
+
+    def run(self, stream: op.Stream[Inputs]) -> op.Stream[Outputs]:
+        return op.map(
+            "sum",
+            stream,
+            lambda item: self.Outputs(
+                timestamp=item.timestamp,
+                output_signal=None
+                if item.source_signal is None or item.copied_signal is None
+                else item.source_signal + item.copied_signal,
+            ),
+        )
+
+
+def test_derivers_run_locally_with_source_data_joins_source_and_upstream_inputs(
+    nortech: Nortech, monkeypatch: pytest.MonkeyPatch
+):
+    size = 50
+    source_df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range(start="2023-01-01", periods=size, freq="s", tz=timezone.utc),
+            "Workspace/Asset/Division/Unit/Signal": [float(i) for i in range(size)],
+            "Workspace/Asset/Division/Unit/Other": [float(i) if i % 2 else None for i in range(size)],
+        }
+    ).set_index("timestamp")
+    monkeypatch.setattr(
+        "nortech.derivers.handlers.deriver.get_df",
+        lambda nortech_api, signals, time_window: source_df[[signal.path for signal in signals]].dropna(how="all"),
+    )
+    time_window = TimeWindow(start=source_df.index[0].to_pydatetime(), end=source_df.index[-1].to_pydatetime())
+
+    copied = fused_deriver("Signal", "Copy", TestDeriver)
+    output_derivers = run_derivers_locally_with_source_data(
+        nortech.api, [TestMixedDeriver, copied], time_window, batch_size=7
+    )
+
+    expected_copy = run_deriver_locally_with_df(
+        copied, source_df[["Workspace/Asset/Division/Unit/Signal"]].set_axis(["input_signal"], axis=1)
+    )
+    expected_mixed = run_deriver_locally_with_df(
+        TestMixedDeriver,
+        source_df[["Workspace/Asset/Division/Unit/Other"]]
+        .set_axis(["source_signal"], axis=1)
+        .join(expected_copy.rename(columns={"output_signal": "copied_signal"}), how="outer"),
+    )
+    assert output_derivers["TestMixedDeriver"].index.is_unique
+    assert output_derivers["TestMixedDeriver"]["output_signal"].notna().sum() == size // 2
+    assert output_derivers["TestMixedDeriver"].equals(expected_mixed)
+
+
+def test_deriver_run_locally_with_source_data_cached(nortech: Nortech, monkeypatch: pytest.MonkeyPatch, tmp_path):
+    size = 100
+    source_df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range(start="2023-01-01", periods=size, freq="s", tz=timezone.utc),
+            "Workspace/Asset/Division/Unit/Signal": [float(i) for i in range(size)],
+        }
+    ).set_index("timestamp")
+    fetched_time_windows = []
+
+    def get_df(nortech_api, signals, time_window):
+        fetched_time_windows.append(time_window)
+        return source_df[(source_df.index >= time_window.start) & (source_df.index <= time_window.end)]
+
+    monkeypatch.setattr("nortech.derivers.handlers.deriver.get_df", get_df)
+    start = source_df.index[0].to_pydatetime()
+    expected_df = run_deriver_locally_with_source_data(
+        nortech.api, TestRunningSumDeriver, TimeWindow(start=start, end=source_df.index[-1].to_pydatetime())
+    )
+    assert expected_df is not None
+
+    def run_cached(deriver: type[Deriver], end: int):
+        fetched_time_windows.clear()
+        return run_deriver_locally_with_source_data(
+            nortech.api,
+            deriver,
+            TimeWindow(start=start, end=source_df.index[end].to_pydatetime()),
+            cache_dir=tmp_path,
+            warm_up=timedelta(seconds=2),
+        )
+
+    assert run_cached(TestRunningSumDeriver, 59).equals(expected_df.iloc[:60])  # type: ignore
+    assert len(fetched_time_windows) == 1
+
+    assert run_cached(TestRunningSumDeriver, 29).equals(expected_df.iloc[:30])  # type: ignore
+    assert fetched_time_windows == []
+
+    # Extending the window only fetches the tail, with the warm-up before it.
+    assert run_cached(TestRunningSumDeriver, 99).equals(expected_df)  # type: ignore
+    assert [window.start for window in fetched_time_windows] == [source_df.index[57]]
+
+    run_cached(TestDeriver, 99)
+    assert [window.start for window in fetched_time_windows] == [start]
+
+    with pytest.raises(ValueError):
+        run_deriver_locally_with_source_data(
+            nortech.api,
+            TestDeriver,
+            TimeWindow(start=start, end=start),
+            cache_dir=tmp_path,
+            output_path=tmp_path / "outputs.parquet",
+        )
+
+
+def test_deriver_run_locally_with_profile():
+    size = 100
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range(start="2023-01-01", periods=size, freq="s", tz=timezone.utc),
+            "input_signal": [float(i) for i in range(size)],
+        }
+    ).set_index("timestamp")
+
+    output_deriver, profile = run_deriver_locally_with_df(
+        deriver=TestRunningSumDeriver, df=df, batch_size=30, profile=True
+    )
+    assert output_deriver.equals(run_deriver_locally_with_df(deriver=TestRunningSumDeriver, df=df))
+
+    steps = profile.to_df()
+    assert list(steps.index) == ["key_all", "running_sum", "unkey"]
+    assert (steps["items_in"] == size).all() and (steps["items_out"] == size).all()
+    assert (steps["seconds"] > 0).all()
+    assert 0 < profile.input_conversion_seconds < profile.total_seconds
+    assert 0 < profile.output_conversion_seconds < profile.total_seconds
+
+    output_deriver, profile = run_deriver_locally_with_df(
+        deriver=TestBatchDeriver, df=df, batch_size=30, batch_mode=True, profile=True
+    )
+    assert [(step.step_id, step.items_in, step.items_out) for step in profile.steps] == [("run_batch", size, size)]
+
+
+def test_deriver_load_test(deriver_load_test):
+    inputs = synthetic_inputs(TestDeriver.Inputs, timedelta(minutes=10), rate=10, null_ratio=0.25, jitter=0.5)
+    assert len(inputs) == 6000
+    assert inputs.index.is_monotonic_increasing
+    assert 0.2 < inputs["input_signal"].isna().mean() < 0.3
+
+    report = deriver_load_test(TestDeriver, duration=timedelta(minutes=10), rate=10, batch_size=500)
+    assert report.items == report.outputs == 6000
+    assert report.items_per_second > 0
+    assert list(report.latency_percentiles) == [50, 90, 99]
+    assert 0 <= report.latency_percentiles[50] <= report.latency_percentiles[99] < report.seconds
+    assert report.peak_memory is not None and report.peak_memory > 0
+
+
+def test_deriver_follow_locally(nortech: Nortech, monkeypatch: pytest.MonkeyPatch):
+    start = datetime.now(timezone.utc).replace(microsecond=0) - timedelta(minutes=5)
+    source_df = pl.DataFrame(
+        {
+            "timestamp": pl.datetime_range(start, start + timedelta(minutes=4), "1s", eager=True, time_unit="ms"),
+            "Workspace/Asset/Division/Unit/Signal": [float(i) for i in range(241)],
+        }
+    )
+    fetched_time_windows = []
+
+    def get_lazy_polars_df_from_hot_storage(nortech_api, signals, time_window):
+        fetched_time_windows.append(time_window)
+        return source_df.lazy().filter(pl.col("timestamp").is_between(time_window.start, time_window.end))
+
+    monkeypatch.setattr(
+        "nortech.derivers.handlers.deriver.get_lazy_polars_df_from_hot_storage", get_lazy_polars_df_from_hot_storage
+    )
+    outputs = []
+    follow_deriver_locally(
+        nortech.api,
+        TestRunningSumDeriver,
+        outputs.append,
+        start=start,
+        until=start + timedelta(minutes=4),
+        poll_interval=timedelta(0),
+        max_window=timedelta(minutes=1),
+        batch_size=7,
+    )
+
+    assert [window.start for window in fetched_time_windows[1:]] == [window.end for window in fetched_time_windows[:-1]]
+    assert fetched_time_windows[-1].end == start + timedelta(minutes=4)
+    assert all(window.end - window.start <= timedelta(minutes=1) for window in fetched_time_windows)
+
+    output_deriver = pd.concat(outputs)
+    assert output_deriver.index.is_unique
+    expected_df = run_deriver_locally_with_df(
+        deriver=TestRunningSumDeriver,
+        df=source_df.to_pandas().set_index("timestamp").set_axis(["input_signal"], axis=1).tz_convert("UTC"),
+    )
+    assert output_deriver.equals(expected_df)
+
+
+def test_deriver_run_locally_with_polars_df():
+    size = 100
+    df = pl.DataFrame(
+        {
+            "time": pl.datetime_range(
+                datetime(2023, 1, 1), datetime(2023, 1, 1, 0, 1, 39), "1s", eager=True, time_zone="Europe/Lisbon"
+            ),
+            "input_signal": [float(i) for i in range(size)],
+            "unused": list(range(size)),
+        }
+    )
+    original_df = df.clone()
+    pandas_df = df.to_pandas().set_index("time").drop(columns="unused")
+    expected_df = run_deriver_locally_with_df(deriver=TestRunningSumDeriver, df=pandas_df)
+    assert str(pandas_df.index.tz) == "Europe/Lisbon"
+
+    output_deriver = run_deriver_locally_with_polars_df(
+        TestRunningSumDeriver, df, timestamp_column="time", batch_size=7
+    )
+    assert df.equals(original_df)
+    assert output_deriver.schema["timestamp"] == pl.Datetime("us", "Europe/Lisbon")
+    assert output_deriver.equals(
+        pl.from_pandas(expected_df.reset_index()).with_columns(
+            pl.col("timestamp").cast(output_deriver.schema["timestamp"])
+        )
+    )
+
+    lazy_output_deriver = run_deriver_locally_with_polars_df(
+        TestRunningSumDeriver,
+        df.lazy().with_columns(pl.col("time").dt.replace_time_zone(None)),
+        timestamp_column="time",
+    )
+    assert lazy_output_deriver["output_signal"].equals(output_deriver["output_signal"])
+    assert lazy_output_deriver.schema["timestamp"] == pl.Datetime("us")
+
+    with pytest.raises(ValueError, match="input_signal"):
+        run_deriver_locally_with_polars_df(TestRunningSumDeriver, df.drop("input_signal"), timestamp_column="time")
+
+    with pytest.raises(ValueError):
+        run_deriver_locally_with_polars_df(TestRunningSumDeriver, df)
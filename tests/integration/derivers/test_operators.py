@@ -4,10 +4,12 @@ from datetime import datetime, timedelta, timezone
 
 import bytewax.operators as op
 import pandas as pd
+import pytest
 from bytewax.dataflow import Dataflow
 from bytewax.testing import TestingSink, TestingSource, run_main
 
 from nortech.derivers import operators as internal_op
+from nortech.derivers.services.columnar import ColumnarSink, ColumnarSource
 from nortech.derivers.values.deriver import DeriverInputs
 
 
@@ -120,6 +122,7 @@ def test_ffill():
         TestInput(timestamp=datetime(2023, 1, 1, 0, 0, 4, tzinfo=timezone.utc), value=None),
         TestInput(timestamp=datetime(2023, 1, 1, 0, 0, 5, tzinfo=timezone.utc), value=5.0),
     ]
+    input_messages[0].extra = "extra"  # type: ignore
 
     flow = Dataflow("test_ffill")
 
@@ -135,12 +138,13 @@ def test_ffill():
 
     run_main(flow)
 
+    # Undeclared extra fields are forward filled too.
     assert output_list == [
-        TestInput(timestamp=datetime(2023, 1, 1, 0, 0, 1, tzinfo=timezone.utc), value=1.0),
-        TestInput(timestamp=datetime(2023, 1, 1, 0, 0, 2, tzinfo=timezone.utc), value=1.0),
-        TestInput(timestamp=datetime(2023, 1, 1, 0, 0, 3, tzinfo=timezone.utc), value=3.0),
-        TestInput(timestamp=datetime(2023, 1, 1, 0, 0, 4, tzinfo=timezone.utc), value=3.0),
-        TestInput(timestamp=datetime(2023, 1, 1, 0, 0, 5, tzinfo=timezone.utc), value=5.0),
+        TestInput(timestamp=datetime(2023, 1, 1, 0, 0, 1, tzinfo=timezone.utc), value=1.0, extra="extra"),
+        TestInput(timestamp=datetime(2023, 1, 1, 0, 0, 2, tzinfo=timezone.utc), value=1.0, extra="extra"),
+        TestInput(timestamp=datetime(2023, 1, 1, 0, 0, 3, tzinfo=timezone.utc), value=3.0, extra="extra"),
+        TestInput(timestamp=datetime(2023, 1, 1, 0, 0, 4, tzinfo=timezone.utc), value=3.0, extra="extra"),
+        TestInput(timestamp=datetime(2023, 1, 1, 0, 0, 5, tzinfo=timezone.utc), value=5.0, extra="extra"),
     ]
 
 
@@ -163,7 +167,6 @@ def test_resample():
         frequency=timedelta(seconds=2),
         resampler=internal_op.Resampler(
             downsample_function=lambda df, frequency: df.resample(frequency).mean(),
-            upsample_function=lambda df, frequency: df.resample(frequency).ffill(),
         ),
     )
 
@@ -182,6 +185,305 @@ def test_resample():
         TestInput(timestamp=datetime(2023, 1, 1, 0, 0, 8, tzinfo=timezone.utc), value=8.5),
     ]
 
+    with pytest.warns(DeprecationWarning, match="upsample_function is ignored"):
+        internal_op.Resampler(
+            downsample_function=lambda df, frequency: df.resample(frequency).mean(),
+            upsample_function=lambda df, frequency: df.resample(frequency).ffill(),
+        )
+
+
+def test_incremental_resample():
+    class TestInput(DeriverInputs):
+        mean: float | None
+        sum: float | None
+        min: float | None
+        max: float | None
+        first: float | None
+        last: float | None
+        count: float | None
+        ignored: float | None
+
+    input_messages = [
+        TestInput(
+            timestamp=datetime(2023, 1, 1, 0, 0, i, tzinfo=timezone.utc),
+            **{name: float(i) for name in ["mean", "sum", "min", "max", "first", "last", "count"]},
+            ignored=float(i),
+        )
+        for i in [0, 1, 2, 3, 4, 5, 8]
+    ]
+    input_messages[1].min = None
+
+    flow = Dataflow("test_incremental_resample")
+
+    input_source = TestingSource(input_messages)
+    stream = op.input("input", flow, input_source)
+
+    resampled_stream = internal_op.incremental_resample(
+        "test_incremental_resample",
+        stream,
+        frequency=timedelta(seconds=3),
+        aggregation={name: name for name in ["mean", "sum", "min", "max", "first", "last", "count"]},
+    )
+
+    output_list = []
+    output = TestingSink(output_list)
+
+    op.output("output", resampled_stream, output)
+
+    run_main(flow)
+
+    assert output_list == [
+        TestInput(
+            timestamp=datetime(2023, 1, 1, 0, 0, 0, tzinfo=timezone.utc),
+            mean=1.0,
+            sum=3.0,
+            min=0.0,
+            max=2.0,
+            first=0.0,
+            last=2.0,
+            count=3,
+            ignored=None,
+        ),
+        TestInput(
+            timestamp=datetime(2023, 1, 1, 0, 0, 3, tzinfo=timezone.utc),
+            mean=4.0,
+            sum=12.0,
+            min=3.0,
+            max=5.0,
+            first=3.0,
+            last=5.0,
+            count=3,
+            ignored=None,
+        ),
+        TestInput(
+            timestamp=datetime(2023, 1, 1, 0, 0, 6, tzinfo=timezone.utc),
+            mean=8.0,
+            sum=8.0,
+            min=8.0,
+            max=8.0,
+            first=8.0,
+            last=8.0,
+            count=1,
+            ignored=None,
+        ),
+    ]
+
+
+def test_interpolate():
+    class TestInput(DeriverInputs):
+        value: float | None
+        state: str | None
+
+    input_messages = [
+        TestInput(timestamp=datetime(2023, 1, 1, 0, 0, 1, tzinfo=timezone.utc), value=0.0, state="off"),
+        TestInput(timestamp=datetime(2023, 1, 1, 0, 0, 11, tzinfo=timezone.utc), value=10.0, state=None),
+        TestInput(timestamp=datetime(2023, 1, 1, 0, 0, 15, tzinfo=timezone.utc), value=None, state="on"),
+        TestInput(timestamp=datetime(2023, 1, 1, 0, 0, 21, tzinfo=timezone.utc), value=30.0, state=None),
+    ]
+
+    output_lists = {}
+    for method in ["linear", "previous", "nearest"]:
+        flow = Dataflow("test_interpolate")
+
+        input_source = TestingSource(input_messages, batch_size=1)
+        stream = op.input("input", flow, input_source)
+
+        interpolated_stream = internal_op.interpolate(
+            "test_interpolate", stream, frequency=timedelta(seconds=4), method=method
+        )
+
+        output_lists[method] = []
+        output = TestingSink(output_lists[method])
+
+        op.output("output", interpolated_stream, output)
+
+        run_main(flow)
+
+    timestamps = [datetime(2023, 1, 1, 0, 0, second, tzinfo=timezone.utc) for second in [4, 8, 12, 16, 20]]
+    expected_values = {
+        "linear": ([3.0, 7.0, 12.0, 20.0, 28.0], ["off", "off", "off", "on", "on"]),
+        "previous": ([0.0, 0.0, 10.0, 10.0, 10.0], ["off", "off", "off", "on", "on"]),
+        "nearest": ([0.0, 10.0, 10.0, 10.0, 30.0], ["off", "off", "on", "on", "on"]),
+    }
+    for method, (values, states) in expected_values.items():
+        assert output_lists[method] == [
+            TestInput(timestamp=timestamp, value=value, state=state)
+            for timestamp, value, state in zip(timestamps, values, states)
+        ]
+
+
+def test_interpolator_upsamples_sparse_data():
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range(start="2023-01-01", periods=3, freq="10s", tz=timezone.utc),
+            "value": [0.0, 10.0, None],
+        }
+    ).set_index("timestamp")
+
+    resampled_df = internal_op.interpolator("linear")(df, frequency=timedelta(seconds=5))
+
+    pd.testing.assert_frame_equal(
+        resampled_df,
+        pd.DataFrame(
+            {
+                "timestamp": pd.date_range(start="2023-01-01", periods=5, freq="5s", tz=timezone.utc),
+                "value": [0.0, 5.0, 10.0, None, None],
+            }
+        ).set_index("timestamp"),
+        check_freq=False,
+    )
+
+
+def test_sliding_window():
+    class TestInput(DeriverInputs):
+        asset: str | None
+        value: float | None
+
+    input_messages = [
+        TestInput(timestamp=datetime(2023, 1, 1, 0, 0, i, tzinfo=timezone.utc), asset=asset, value=float(i) * sign)
+        for i in range(6)
+        for asset, sign in [("asset_1", 1), ("asset_2", -1)]
+    ]
+
+    flow = Dataflow("test_sliding_window")
+
+    input_source = TestingSource(input_messages)
+    stream = op.input("input", flow, input_source)
+
+    windows_stream = internal_op.sliding_window(
+        "test_sliding_window",
+        stream,
+        length=timedelta(seconds=4),
+        hop=timedelta(seconds=2),
+        aggregation={"value": "max"},
+        key=lambda item: item.asset,
+    )
+
+    output_list = []
+    output = TestingSink(output_list)
+
+    op.output("output", windows_stream, output)
+
+    run_main(flow)
+
+    def window(second: int, asset: str, value: float) -> tuple[str, TestInput]:
+        return asset, TestInput(
+            timestamp=datetime(2023, 1, 1, 0, 0, second, tzinfo=timezone.utc), asset=None, value=value
+        )
+
+    # Windows are emitted with their key, as the asset is not one of the aggregated fields.
+    assert sorted(output_list, key=lambda item: (item[0], item[1].timestamp)) == [
+        window(2, "asset_1", 1.0),
+        window(4, "asset_1", 3.0),
+        window(6, "asset_1", 5.0),
+        window(8, "asset_1", 5.0),
+        window(2, "asset_2", 0.0),
+        window(4, "asset_2", 0.0),
+        window(6, "asset_2", -2.0),
+        window(8, "asset_2", -4.0),
+    ]
+
+
+def test_align():
+    class TestInput(DeriverInputs):
+        fast: float | None
+        slow: float | None
+
+    class AlignedInput(DeriverInputs):
+        fast: float
+        slow: float
+
+    input_messages = [
+        TestInput(timestamp=datetime(2023, 1, 1, 0, 0, 0, tzinfo=timezone.utc), fast=0.0, slow=None),
+        TestInput(timestamp=datetime(2023, 1, 1, 0, 0, 1, tzinfo=timezone.utc), fast=1.0, slow=10.0),
+        TestInput(timestamp=datetime(2023, 1, 1, 0, 0, 2, tzinfo=timezone.utc), fast=2.0, slow=None),
+        TestInput(timestamp=datetime(2023, 1, 1, 0, 0, 3, tzinfo=timezone.utc), fast=None, slow=30.0),
+        TestInput(timestamp=datetime(2023, 1, 1, 0, 0, 5, tzinfo=timezone.utc), fast=5.0, slow=None),
+    ]
+
+    def run_align(trigger: str | timedelta) -> list[AlignedInput]:
+        flow = Dataflow("test_align")
+
+        input_source = TestingSource(input_messages)
+        stream = op.input("input", flow, input_source)
+
+        aligned_stream = internal_op.align("test_align", stream, AlignedInput, trigger=trigger)
+
+        output_list = []
+        output = TestingSink(output_list)
+
+        op.output("output", aligned_stream, output)
+
+        run_main(flow)
+
+        return output_list
+
+    def aligned(second: int, fast: float, slow: float) -> AlignedInput:
+        return AlignedInput(timestamp=datetime(2023, 1, 1, 0, 0, second, tzinfo=timezone.utc), fast=fast, slow=slow)
+
+    assert run_align("any") == [
+        aligned(1, 1.0, 10.0),
+        aligned(2, 2.0, 10.0),
+        aligned(3, 2.0, 30.0),
+        aligned(5, 5.0, 30.0),
+    ]
+    assert run_align("slow") == [aligned(1, 1.0, 10.0), aligned(3, 2.0, 30.0)]
+    assert run_align(timedelta(seconds=2)) == [aligned(2, 2.0, 10.0), aligned(4, 2.0, 30.0)]
+
+
+def test_convert_units():
+    class TestInput(DeriverInputs):
+        temperature: float | None
+        power: float | None
+
+    input_messages = [
+        TestInput(timestamp=datetime(2023, 1, 1, 0, 0, i, tzinfo=timezone.utc), temperature=temperature, power=power)
+        for i, (temperature, power) in enumerate([(0.0, 1.0), (100.0, None), (None, 2.5)])
+    ]
+
+    flow = Dataflow("test_convert_units")
+
+    input_source = TestingSource(input_messages)
+    stream = op.input("input", flow, input_source)
+
+    converted_stream = internal_op.convert_units(
+        "test_convert_units", stream, TestInput, {"temperature": ("degC", "degF"), "power": ("kW", "W")}
+    )
+
+    # The same stream also feeds a raw sink, which must not see the converted values.
+    raw_list = []
+    op.output("raw_output", stream, TestingSink(raw_list))
+
+    output_list = []
+    output = TestingSink(output_list)
+
+    op.output("output", converted_stream, output)
+
+    run_main(flow)
+
+    assert [(item.temperature, item.power) for item in output_list] == [
+        (pytest.approx(32.0), pytest.approx(1000.0)),
+        (pytest.approx(212.0), None),
+        (None, pytest.approx(2500.0)),
+    ]
+    assert [(item.temperature, item.power) for item in raw_list] == [(0.0, 1.0), (100.0, None), (None, 2.5)]
+    assert [(item.temperature, item.power) for item in input_messages] == [(0.0, 1.0), (100.0, None), (None, 2.5)]
+
+    with pytest.raises(ValueError, match="incompatible units"):
+        internal_op.convert_units("test_convert_units", stream, TestInput, {"power": ("kW", "degF")})
+
+
+def test_convert_units_rejects_fields_that_are_not_floats():
+    class TestInput(DeriverInputs):
+        count: int | None
+        label: str
+
+    stream = op.input("input", Dataflow("test_convert_units"), TestingSource([]))
+
+    for name in ["count", "label", "missing"]:
+        with pytest.raises(ValueError, match=f"Field '{name}' of TestInput is not a float field"):
+            internal_op.convert_units("test_convert_units", stream, TestInput, {name: ("kW", "W")})
+
 
 def test_list_to_dataframe():
     class TestInput(DeriverInputs):
@@ -214,3 +516,50 @@ def test_list_to_dataframe():
 
     for df in output_list:
         assert df.equals(expected_df)
+
+
+def test_columnar_source_and_sink():
+    class TestInput(DeriverInputs):
+        value: float | None
+
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range(start="2023-01-01", periods=5, freq="s", tz=timezone.utc),
+            "value": [1, None, 3, None, 5],
+        }
+    ).set_index("timestamp")
+
+    flow = Dataflow("test_columnar_source_and_sink")
+    stream = op.input("input", flow, ColumnarSource(df, TestInput, batch_size=2))
+
+    input_list = []
+    op.output("inputs", stream, TestingSink(input_list))
+
+    doubled_stream = op.map(
+        "double",
+        stream,
+        lambda item: TestInput(
+            timestamp=item.timestamp,
+            value=item.value * 2 if item.value is not None else None,
+            extra_value="odd" if item.value is not None else None,  # type: ignore
+        ),
+    )
+    output_sink = ColumnarSink()
+    op.output("output", doubled_stream, output_sink)
+
+    run_main(flow)
+
+    assert input_list == [
+        TestInput(timestamp=timestamp, value=value)  # type: ignore
+        for timestamp, value in zip(df.index, [1.0, None, 3.0, None, 5.0])
+    ]
+    pd.testing.assert_frame_equal(
+        output_sink.to_df(),
+        pd.DataFrame(
+            {
+                "timestamp": list(df.index),
+                "value": [2.0, None, 6.0, None, 10.0],
+                "extra_value": ["odd", None, "odd", None, "odd"],
+            }
+        ),
+    )
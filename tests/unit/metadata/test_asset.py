@@ -232,3 +232,20 @@ def test_get_asset_error(
     with pytest.raises(AssertionError) as err:
         nortech.metadata.asset.get(asset=1)
     assert "Fetch failed." in str(err.value)
+
+
+def test_list_workspace_assets_columnar(
+    nortech: Nortech,
+    asset_list_output: AssetListOutput,
+    paginated_asset_list_output: PaginatedResponse[AssetListOutput, Literal["id", "name", "description"]],
+    requests_mock: Mocker,
+):
+    requests_mock.get(
+        f"{nortech.settings.URL}/api/v1/workspaces/1/assets",
+        text=paginated_asset_list_output.model_dump_json(by_alias=True),
+    )
+
+    assets = nortech.metadata.asset.list(workspace=1, columnar=True)
+    assert assets.size == 1
+    assert assets.data.to_dicts() == [asset_list_output.model_dump()]
+    assert assets.to_polars().equals(paginated_asset_list_output.to_polars())
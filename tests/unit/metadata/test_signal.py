@@ -1,22 +1,30 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Literal
 
 import pytest
 from requests_mock import Mocker
 
 from nortech import Nortech
+from nortech.gateways.nortech_api import NortechAPI, NortechAPISettings
 from nortech.metadata import (
+    NextRef,
     PaginatedResponse,
+    SignalCatalog,
     SignalInput,
     SignalInputDict,
     SignalListOutput,
+    SignalNotFoundError,
     SignalOutput,
     UnitInput,
 )
+from nortech.metadata import Signal as SignalClient
 from nortech.metadata.services.signal import (
     _get_signals,  # type: ignore
     parse_signal_input_or_output_or_id_union_to_signal_input,
 )
 from nortech.metadata.values.unit import UnitOutput
+from nortech.metadata.values.workspace import WorkspaceOutput
 
 
 def test_list_workspace_asset_division_unit_signals_from_input(
@@ -392,3 +400,263 @@ def test_parse_signal_input_or_output_or_id_union_to_signal_input(
     assert signal_inputs == [signal_input, signal_input, signal_input, signal_input]
     assert requests_mock.last_request is not None
     assert requests_mock.last_request.json() == {"signals": [1, 2]}
+
+
+def test_signal_batch(
+    nortech: Nortech,
+    signal_output: SignalOutput,
+    requests_mock: Mocker,
+):
+    requests_mock.post(
+        f"{nortech.settings.URL}/api/v1/signals",
+        [
+            {
+                "text": f"[{signal_output.model_dump_json(by_alias=True)},{signal_output.model_copy(update={'id': 2, 'name': 'test_signal_2'}).model_dump_json(by_alias=True)}]"
+            },
+            {"text": f"[{signal_output.model_copy(update={'id': 3}).model_dump_json(by_alias=True)}]"},
+        ],
+    )
+
+    with nortech.metadata.signal.batch(max_batch_size=2) as batch:
+        futures = [batch.load(signal_id) for signal_id in [1, 2, 1, 3]]
+
+    assert [future.result().id for future in futures] == [1, 2, 1, 3]
+    assert futures[0] is futures[2]
+    assert [request.json() for request in requests_mock.request_history] == [
+        {"signals": [1, 2]},
+        {"signals": [3]},
+    ]
+
+
+def test_signal_batch_not_found(
+    nortech: Nortech,
+    signal_output: SignalOutput,
+    requests_mock: Mocker,
+):
+    requests_mock.post(
+        f"{nortech.settings.URL}/api/v1/signals",
+        text=f"[{signal_output.model_dump_json(by_alias=True)}]",
+    )
+
+    with nortech.metadata.signal.batch() as batch:
+        found = batch.load(1)
+        not_found = batch.load(2)
+
+    assert found.result() == signal_output
+    with pytest.raises(SignalNotFoundError) as err:
+        not_found.result()
+    assert "Signal 2 not found." in str(err.value)
+
+
+def test_signal_batch_error(
+    nortech: Nortech,
+    requests_mock: Mocker,
+):
+    requests_mock.post(f"{nortech.settings.URL}/api/v1/signals", status_code=500)
+
+    with nortech.metadata.signal.batch() as batch:
+        future = batch.load(1)
+
+    with pytest.raises(AssertionError) as err:
+        future.result()
+    assert "Failed to get signals." in str(err.value)
+
+
+def test_get_signal_with_batch_window(
+    nortech_api_settings: NortechAPISettings,
+    signal_output: SignalOutput,
+    requests_mock: Mocker,
+):
+    signal_client = SignalClient(
+        NortechAPI(nortech_api_settings.model_copy(update={"SIGNAL_BATCH_WINDOW": 0.5, "SIGNAL_BATCH_SIZE": 4}))
+    )
+    requests_mock.post(
+        f"{nortech_api_settings.URL}/api/v1/signals",
+        text="["
+        + ",".join(
+            signal_output.model_copy(update={"id": signal_id}).model_dump_json(by_alias=True)
+            for signal_id in range(1, 5)
+        )
+        + "]",
+    )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        signals = list(executor.map(signal_client.get, range(1, 5)))
+
+    assert [signal.id for signal in signals] == [1, 2, 3, 4]
+    assert requests_mock.call_count == 1
+    assert sorted(requests_mock.last_request.json()["signals"]) == [1, 2, 3, 4]  # type: ignore
+
+
+def test_get_many_signals(
+    nortech: Nortech,
+    signal_output: SignalOutput,
+    signal_input: SignalInput,
+    signal_input_dict: SignalInputDict,
+    requests_mock: Mocker,
+):
+    requests_mock.post(
+        f"{nortech.settings.URL}/api/v1/signals",
+        [
+            {
+                "text": f"[{signal_output.model_dump_json(by_alias=True)},{signal_output.model_copy(update={'id': 2, 'name': 'test_signal_2'}).model_dump_json(by_alias=True)}]"
+            },
+            {"text": f"[{signal_output.model_dump_json(by_alias=True)}]"},
+        ],
+    )
+
+    signals = nortech.metadata.signal.get_many(
+        [signal_input, 2, signal_input_dict, signal_output, 1], chunk_size=2, max_workers=1
+    )
+
+    assert [signal.id if signal else None for signal in signals] == [1, 2, 1, 1, 1]
+    assert [request.json() for request in requests_mock.request_history] == [
+        {"signals": [signal_input.model_dump(by_alias=True), 2]},
+        {"signals": [1]},
+    ]
+
+
+def test_get_many_signals_not_found(
+    nortech: Nortech,
+    signal_output: SignalOutput,
+    requests_mock: Mocker,
+):
+    def signals_callback(request, context):
+        signal_ids = request.json()["signals"]
+        if 3 in signal_ids:
+            context.status_code = 404
+            return ""
+        return (
+            "["
+            + ",".join(
+                signal_output.model_copy(update={"id": signal_id}).model_dump_json(by_alias=True)
+                for signal_id in signal_ids
+                if signal_id != 4
+            )
+            + "]"
+        )
+
+    requests_mock.post(f"{nortech.settings.URL}/api/v1/signals", text=signals_callback)
+
+    signals = nortech.metadata.signal.get_many([1, 2, 3, 4])
+
+    assert [signal.id if signal else None for signal in signals] == [1, 2, None, None]
+
+
+def test_get_many_signals_error(
+    nortech: Nortech,
+    requests_mock: Mocker,
+):
+    requests_mock.post(f"{nortech.settings.URL}/api/v1/signals", status_code=500)
+
+    with pytest.raises(AssertionError) as err:
+        nortech.metadata.signal.get_many([1, 2])
+    assert "Failed to get signals." in str(err.value)
+
+
+def test_list_signals_columnar(
+    nortech: Nortech,
+    signal_list_output: SignalListOutput,
+    requests_mock: Mocker,
+):
+    requests_mock.get(
+        f"{nortech.settings.URL}/api/v1/units/1/signals",
+        [
+            {
+                "text": PaginatedResponse[SignalListOutput, Literal["id"]](
+                    size=1,
+                    data=[signal_list_output],
+                    next=NextRef(token="test_token"),  # noqa: S106
+                ).model_dump_json(by_alias=True)
+            },
+            {
+                "text": PaginatedResponse[SignalListOutput, Literal["id"]](
+                    size=1, data=[signal_list_output.model_copy(update={"id": 2})], next=None
+                ).model_dump_json(by_alias=True)
+            },
+        ],
+    )
+
+    signals = nortech.metadata.signal.list(1, columnar=True)
+    assert signals.size == 2
+    assert signals.next is None
+    assert signals.data.to_dicts() == [
+        signal_list_output.model_dump(),
+        signal_list_output.model_copy(update={"id": 2}).model_dump(),
+    ]
+    assert requests_mock.last_request is not None
+    assert requests_mock.last_request.qs == {"nexttoken": ["test_token"]}
+
+
+def test_paginated_response_to_polars(
+    signal_list_output: SignalListOutput,
+    paginated_signal_list_output: PaginatedResponse[
+        SignalListOutput, Literal["id", "name", "physical_unit", "data_type", "description", "long_description"]
+    ],
+):
+    df = paginated_signal_list_output.to_polars()
+    assert df.columns == list(SignalListOutput.model_fields)
+    assert df.to_dicts() == [signal_list_output.model_dump()]
+    assert paginated_signal_list_output.to_arrow().to_pylist() == [signal_list_output.model_dump()]
+
+
+def test_signal_catalog(
+    nortech_api_settings: NortechAPISettings,
+    workspace_output: WorkspaceOutput,
+    paginated_asset_list_output: PaginatedResponse,
+    paginated_division_list_output: PaginatedResponse,
+    paginated_unit_list_output: PaginatedResponse,
+    signal_list_output: SignalListOutput,
+    requests_mock: Mocker,
+    tmp_path: Path,
+):
+    signal_client = SignalClient(NortechAPI(nortech_api_settings))
+    requests_mock.get(
+        f"{nortech_api_settings.URL}/api/v1/workspaces/test_workspace", text=workspace_output.model_dump_json()
+    )
+    requests_mock.get(
+        f"{nortech_api_settings.URL}/api/v1/workspaces/1/assets",
+        text=paginated_asset_list_output.model_dump_json(by_alias=True),
+    )
+    requests_mock.get(
+        f"{nortech_api_settings.URL}/api/v1/assets/1/divisions",
+        text=paginated_division_list_output.model_dump_json(by_alias=True),
+    )
+    requests_mock.get(
+        f"{nortech_api_settings.URL}/api/v1/divisions/1/units",
+        text=paginated_unit_list_output.model_dump_json(by_alias=True),
+    )
+    requests_mock.get(
+        f"{nortech_api_settings.URL}/api/v1/units/1/signals",
+        text=PaginatedResponse[SignalListOutput, Literal["id"]](
+            size=2,
+            data=[
+                signal_list_output,
+                signal_list_output.model_copy(
+                    update={"id": 2, "name": "pressure", "physical_unit": "bar", "description": "Pressure sensor"}
+                ),
+            ],
+        ).model_dump_json(by_alias=True),
+    )
+
+    catalog = signal_client.catalog("test_workspace")
+    assert signal_client.catalog("test_workspace") is catalog
+    assert requests_mock.call_count == 5
+    assert len(catalog) == 2
+
+    pressure = SignalInput(
+        workspace="test_workspace", asset="test_asset", division="test_division", unit="test_unit", signal="pressure"
+    )
+    test_signal = pressure.model_copy(update={"signal": "test_signal"})
+    assert catalog.search(prefix="test_workspace/test_asset/") == [pressure, test_signal]
+    assert catalog.search(prefix="test_workspace/test_asset/test_division/test_unit/p") == [pressure]
+    assert catalog.search(contains="SIGNAL") == [test_signal]
+    assert catalog.search(contains="unit/pres") == [pressure]
+    assert catalog.search(regex=r"/test_\w+$") == [test_signal]
+    assert catalog.search(physical_unit="bar") == [pressure]
+    assert catalog.search(data_type="float", description="sensor") == [pressure]
+    assert catalog.search(physical_unit="bar", contains="test_signal") == []
+    assert catalog.search(limit=1) == [pressure]
+
+    catalog.save(tmp_path / "catalog.parquet")
+    assert SignalCatalog.load(tmp_path / "catalog.parquet").search(contains="test") == [pressure, test_signal]
@@ -281,3 +281,19 @@ def test_get_unit_error(
     with pytest.raises(AssertionError) as err:
         nortech.metadata.unit.get(1)
     assert "Fetch failed." in str(err.value)
+
+
+def test_list_workspace_units_columnar(
+    nortech: Nortech,
+    unit_list_output: UnitListOutput,
+    paginated_unit_list_output: PaginatedResponse[UnitListOutput, Literal["id", "name"]],
+    requests_mock: Mocker,
+):
+    requests_mock.get(
+        f"{nortech.settings.URL}/api/v1/workspaces/1/units",
+        text=paginated_unit_list_output.model_dump_json(by_alias=True),
+    )
+
+    units = nortech.metadata.unit.list_by_workspace_id(1, columnar=True)
+    assert units.data.to_dicts() == [unit_list_output.model_dump()]
+    assert units.to_arrow().to_pylist() == [unit_list_output.model_dump()]